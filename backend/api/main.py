@@ -1,13 +1,30 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from shared.services.fact_check_articles_service import FactCheckArticlesService
-from shared.schemas import TopicCount, FactCheckArticlesSchema
-from shared.database import Database
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from contextlib import asynccontextmanager
+from shared.services.async_fact_check_articles_service import AsyncFactCheckArticlesService
+from shared.schemas import TopicCount, FactCheckArticlesSchema, FactCheckArticleSummarySchema, ArticlePage, PublicationFrequency, SimilarArticle
+from shared.database import AsyncDatabase
+from shared.export import EXPORT_MEDIA_TYPES, export_columns, aexport_lines
+from shared.embeddings import ArticleEmbedder
+from api.response_cache import ResponseCache
+from typing import AsyncGenerator, List, Optional, Tuple, Literal, Union
+import asyncio
 import datetime
 
-app = FastAPI()
-db = Database()
+db = AsyncDatabase()
+response_cache = ResponseCache()
+# Encodes /search queries, the model is loaded on the first search
+embedder = ArticleEmbedder()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await db.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,18 +32,53 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+def parse_date_range(
+        published_after: Optional[str],
+        published_before: Optional[str]
+    ) -> Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]:
+    '''
+    Parse YYYY-MM-DD query parameters into an inclusive datetime range.
+    Invalid dates are ignored, published_before covers the whole day.
+    '''
+    published_after_dt = None
+    published_before_dt = None
+    if published_after:
+        try:
+            published_after_dt = datetime.datetime.strptime(published_after, '%Y-%m-%d')
+        except ValueError:
+            pass
+    if published_before:
+        try:
+            published_before_dt = datetime.datetime.strptime(published_before, '%Y-%m-%d')
+            published_before_dt = published_before_dt.replace(hour=23, minute=59, second=59)
+        except ValueError:
+            pass
+    return published_after_dt, published_before_dt
+
+
+async def get_service() -> AsyncGenerator[AsyncFactCheckArticlesService, None]:
+    '''
+    Provide each request with a service on its own async session.
+    '''
+    async with db.get_session() as session:
+        yield AsyncFactCheckArticlesService(session)
+
+
 @app.get('/')
-def read_root():
+async def read_root():
     return {'message': 'Faktencheck-Aggregator API', 'version': '1.0'}
 
 
 @app.get('/topic-counts', response_model=List[TopicCount])
-def get_topic_counts(
+async def get_topic_counts(
+        request: Request,
         published_after: Optional[str] = None,
         published_before: Optional[str] = None,
-        medium: Optional[str] = None
+        medium: Optional[str] = None,
+        service: AsyncFactCheckArticlesService = Depends(get_service)
     ) -> List[TopicCount]:
     '''
     Retrieve a list of topic counts for a given time period and optional medium.
@@ -35,37 +87,31 @@ def get_topic_counts(
     - published_before: Date in YYYY-MM-DD format (optional)
     - medium: Fact-checking medium filter (optional)
     '''
-    with db.get_session() as session:
-        service = FactCheckArticlesService(session)
-        published_after_dt = None
-        published_before_dt = None
-        if published_after:
-            try:
-                published_after_dt = datetime.datetime.strptime(published_after, '%Y-%m-%d')
-            except ValueError:
-                pass
-        if published_before:
-            try:
-                published_before_dt = datetime.datetime.strptime(published_before, '%Y-%m-%d')
-                published_before_dt = published_before_dt.replace(hour=23, minute=59, second=59)
-            except ValueError:
-                pass
-        topic_counts = service.get_topic_counts_by_period(
+    published_after_dt, published_before_dt = parse_date_range(published_after, published_before)
+    return await response_cache.respond(
+        request,
+        params={'published_after': published_after_dt, 'published_before': published_before_dt, 'medium': medium},
+        data_version=await service.get_data_version(),
+        compute=lambda: service.get_topic_counts_by_period(
             published_after=published_after_dt,
             published_before=published_before_dt,
             medium=medium
-        )
-        return topic_counts
+        ),
+        response_type=List[TopicCount]
+    )
 
 
-@app.get('/articles-by-topic', response_model=List[FactCheckArticlesSchema])
-def get_articles_by_topic(
+@app.get('/articles-by-topic', response_model=Union[List[FactCheckArticleSummarySchema], List[FactCheckArticlesSchema]])
+async def get_articles_by_topic(
+        request: Request,
         topic: str,
         published_after: Optional[str] = None,
         published_before: Optional[str] = None,
         medium: Optional[str] = None,
-        limit: int = 100
-    ) -> List[FactCheckArticlesSchema]:
+        limit: int = 100,
+        summary: bool = False,
+        service: AsyncFactCheckArticlesService = Depends(get_service)
+    ) -> Union[List[FactCheckArticleSummarySchema], List[FactCheckArticlesSchema]]:
     '''
     Retrieve articles for a given topic with optional filtering by time period and medium.
     Query parameters:
@@ -74,27 +120,258 @@ def get_articles_by_topic(
     - published_before: Date in YYYY-MM-DD format (optional)e
     - medium: Fact-checking medium filter (optional)
     - limit: Maximum number of articles to return (default: 100)
+    - summary: Return only list fields without body and entities (default: false)
     '''
-    with db.get_session() as session:
-        service = FactCheckArticlesService(session)
-        published_after_dt = None
-        published_before_dt = None
-        if published_after:
-            try:
-                published_after_dt = datetime.datetime.strptime(published_after, '%Y-%m-%d')
-            except ValueError:
-                pass
-        if published_before:
-            try:
-                published_before_dt = datetime.datetime.strptime(published_before, '%Y-%m-%d')
-                published_before_dt = published_before_dt.replace(hour=23, minute=59, second=59)
-            except ValueError:
-                pass
-        articles = service.get_articles(
+    published_after_dt, published_before_dt = parse_date_range(published_after, published_before)
+    return await response_cache.respond(
+        request,
+        params={
+            'topic': topic, 'published_after': published_after_dt, 'published_before': published_before_dt,
+            'medium': medium, 'limit': limit, 'summary': summary
+        },
+        data_version=await service.get_data_version(),
+        compute=lambda: service.get_articles(
             limit=limit,
             medium=medium,
             topic=topic,
             published_after=published_after_dt,
-            published_before=published_before_dt
+            published_before=published_before_dt,
+            summary=summary
+        ),
+        response_type=Union[List[FactCheckArticleSummarySchema], List[FactCheckArticlesSchema]]
+    )
+
+
+@app.get('/articles', response_model=ArticlePage)
+async def get_articles_page(
+        request: Request,
+        topic: Optional[str] = None,
+        published_after: Optional[str] = None,
+        published_before: Optional[str] = None,
+        medium: Optional[str] = None,
+        limit: int = Query(default=100, ge=1, le=500),
+        cursor: Optional[str] = None,
+        summary: bool = False,
+        service: AsyncFactCheckArticlesService = Depends(get_service)
+    ) -> ArticlePage:
+    '''
+    Retrieve one page of articles, newest first, with optional filtering by topic, time period and medium.
+    Query parameters:
+    - topic: Topic name (optional)
+    - published_after: Date in YYYY-MM-DD format (optional)
+    - published_before: Date in YYYY-MM-DD format (optional)
+    - medium: Fact-checking medium filter (optional)
+    - limit: Maximum number of articles per page (default: 100, max: 500)
+    - cursor: The next_cursor of the previous page, omit for the first page (optional)
+    - summary: Return only list fields without body and entities (default: false)
+    '''
+    published_after_dt, published_before_dt = parse_date_range(published_after, published_before)
+
+    async def compute() -> ArticlePage:
+        try:
+            return await service.get_articles_page(
+                limit=limit,
+                cursor=cursor,
+                medium=medium,
+                topic=topic,
+                published_after=published_after_dt,
+                published_before=published_before_dt,
+                summary=summary
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await response_cache.respond(
+        request,
+        params={
+            'topic': topic, 'published_after': published_after_dt, 'published_before': published_before_dt,
+            'medium': medium, 'limit': limit, 'cursor': cursor, 'summary': summary
+        },
+        data_version=await service.get_data_version(),
+        compute=compute,
+        response_type=ArticlePage
+    )
+
+
+@app.get('/articles/{article_id}', response_model=FactCheckArticlesSchema)
+async def get_article(
+        article_id: int,
+        service: AsyncFactCheckArticlesService = Depends(get_service)
+    ) -> FactCheckArticlesSchema:
+    '''
+    Retrieve a single article with all fields, including body and entities.
+    '''
+    article = await service.get_article(article_id)
+    if not article:
+        raise HTTPException(status_code=404, detail=f'Article {article_id} not found')
+    return article
+
+
+@app.get('/similar/{article_id}', response_model=List[SimilarArticle])
+async def get_similar_articles(
+        request: Request,
+        article_id: int,
+        limit: int = Query(default=10, ge=1, le=100),
+        other_media_only: bool = False,
+        service: AsyncFactCheckArticlesService = Depends(get_service)
+    ) -> List[SimilarArticle]:
+    '''
+    Retrieve the articles most similar to an article by headline, teaser and claim, most similar first.
+    Query parameters:
+    - limit: Maximum number of articles to return (default: 10, max: 100)
+    - other_media_only: Only articles of other media, e.g. fact-checks of the same claim by other outlets (default: false)
+    '''
+    async def compute() -> List[SimilarArticle]:
+        articles = await service.get_similar_articles(
+            article_id,
+            embedder.model_name,
+            limit=limit,
+            other_media_only=other_media_only
         )
-        return articles
\ No newline at end of file
+        if articles is None:
+            raise HTTPException(status_code=404, detail=f'Article {article_id} not found or not embedded yet')
+        return articles
+
+    return await response_cache.respond(
+        request,
+        params={'article_id': article_id, 'limit': limit, 'other_media_only': other_media_only},
+        data_version=await service.get_data_version(),
+        compute=compute,
+        response_type=List[SimilarArticle]
+    )
+
+
+@app.get('/search', response_model=List[SimilarArticle])
+async def search_articles(
+        request: Request,
+        q: str = Query(min_length=1, max_length=500),
+        limit: int = Query(default=20, ge=1, le=100),
+        medium: Optional[str] = None,
+        service: AsyncFactCheckArticlesService = Depends(get_service)
+    ) -> List[SimilarArticle]:
+    '''
+    Semantic search: retrieve the articles whose headline, teaser and claim are closest in meaning to the query.
+    Query parameters:
+    - q: Search text, e.g. a claim (required)
+    - limit: Maximum number of articles to return (default: 20, max: 100)
+    - medium: Fact-checking medium filter (optional)
+    '''
+    query = ' '.join(q.split())
+    if not query:
+        raise HTTPException(status_code=400, detail='Empty search query')
+
+    async def compute() -> List[SimilarArticle]:
+        # Encoding is CPU-bound, keep it off the event loop
+        vector = await asyncio.to_thread(embedder.encode_one, query)
+        return await service.get_nearest_articles(vector, embedder.model_name, limit=limit, medium=medium)
+
+    return await response_cache.respond(
+        request,
+        params={'q': query, 'limit': limit, 'medium': medium},
+        data_version=await service.get_data_version(),
+        compute=compute,
+        response_type=List[SimilarArticle]
+    )
+
+
+@app.get('/publication-frequency', response_model=List[PublicationFrequency])
+async def get_publication_frequency(
+        request: Request,
+        interval: Literal['day', 'week', 'month'] = 'week',
+        published_after: Optional[str] = None,
+        published_before: Optional[str] = None,
+        medium: Optional[str] = None,
+        group_by_topic: bool = False,
+        service: AsyncFactCheckArticlesService = Depends(get_service)
+    ) -> List[PublicationFrequency]:
+    '''
+    Retrieve the number of published articles per period and medium (and optionally topic).
+    Query parameters:
+    - interval: Bucket size, one of day, week or month (default: week)
+    - published_after: Date in YYYY-MM-DD format (optional)
+    - published_before: Date in YYYY-MM-DD format (optional)
+    - medium: Fact-checking medium filter (optional)
+    - group_by_topic: Additionally split the counts by topic (default: false)
+    '''
+    published_after_dt, published_before_dt = parse_date_range(published_after, published_before)
+    return await response_cache.respond(
+        request,
+        params={
+            'interval': interval, 'published_after': published_after_dt, 'published_before': published_before_dt,
+            'medium': medium, 'group_by_topic': group_by_topic
+        },
+        data_version=await service.get_data_version(),
+        compute=lambda: service.get_publication_histogram(
+            interval=interval,
+            medium=medium,
+            start=published_after_dt,
+            end=published_before_dt,
+            group_by_topic=group_by_topic
+        ),
+        response_type=List[PublicationFrequency]
+    )
+
+
+@app.get('/export')
+async def export_articles(
+        format: Literal['ndjson', 'csv'] = 'ndjson',
+        topic: Optional[str] = None,
+        published_after: Optional[str] = None,
+        published_before: Optional[str] = None,
+        medium: Optional[str] = None,
+        fields: Optional[str] = None,
+        summary: bool = False
+    ) -> StreamingResponse:
+    '''
+    Stream all matching articles as NDJSON or CSV, one row at a time in constant memory.
+    Query parameters:
+    - format: ndjson or csv (default: ndjson)
+    - topic: Topic name (optional)
+    - published_after: Date in YYYY-MM-DD format (optional)
+    - published_before: Date in YYYY-MM-DD format (optional)
+    - medium: Fact-checking medium filter (optional)
+    - fields: Comma-separated columns to export, id is always included (optional)
+    - summary: Export only list fields without body and entities (default: false)
+    '''
+    field_names = [name.strip() for name in fields.split(',') if name.strip()] if fields else None
+    try:
+        columns = export_columns(field_names, summary)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    published_after_dt, published_before_dt = parse_date_range(published_after, published_before)
+
+    async def generate():
+        # The session lives as long as the stream, not as long as the request handler
+        async with db.get_session() as session:
+            articles = AsyncFactCheckArticlesService(session).stream_articles(
+                medium=medium,
+                topic=topic,
+                published_after=published_after_dt,
+                published_before=published_before_dt,
+                fields=field_names,
+                summary=summary
+            )
+            async for line in aexport_lines(articles, format, columns):
+                yield line
+
+    return StreamingResponse(
+        generate(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={'Content-Disposition': f'attachment; filename="fact_check_articles.{format}"'}
+    )
+
+
+@app.get('/cache-stats')
+async def get_cache_stats() -> dict:
+    '''
+    Hit rate and size of the response cache, for monitoring.
+    '''
+    return response_cache.stats()
+
+
+@app.get('/pool-stats')
+async def get_pool_stats() -> dict:
+    '''
+    Connection pool usage (checkouts, overflow, waits, timeouts), for sizing DB_POOL_SIZE and DB_MAX_OVERFLOW.
+    '''
+    return db.pool_stats()
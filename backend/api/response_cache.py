@@ -0,0 +1,115 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+
+class CachedResponse():
+    '''
+    A serialized response body together with the data version it was computed from.
+    '''
+    def __init__(self, body: bytes, data_version: int):
+        self.body = body
+        self.data_version = data_version
+        self.created_at = time.monotonic()
+        self.etag = f'"{data_version}-{hashlib.sha1(body).hexdigest()[:16]}"'
+
+
+class ResponseCache():
+    '''
+    In-process LRU cache with TTL for JSON responses of read endpoints.
+
+    Entries are keyed on the endpoint and its normalized query parameters and remember
+    the data version they were computed from. An entry is only served while the data
+    version is unchanged and it is younger than ttl_seconds; the least recently used
+    entries are evicted beyond max_entries.
+    '''
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: 'OrderedDict[Tuple, CachedResponse]' = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any]) -> Tuple:
+        '''
+        Normalize query parameters so equivalent requests share an entry:
+        parameters that are not set are dropped and the rest are sorted by name.
+        '''
+        return (endpoint,) + tuple(sorted((name, str(value)) for name, value in params.items() if value is not None))
+
+
+    def get(self, key: Tuple, data_version: int) -> Optional[CachedResponse]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.data_version != data_version or time.monotonic() - entry.created_at > self.ttl_seconds:
+                del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+
+    def set(self, key: Tuple, entry: CachedResponse):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+    async def respond(
+        self,
+        request: Request,
+        params: Dict[str, Any],
+        data_version: int,
+        compute: Callable[[], Awaitable[Any]],
+        response_type: Any
+    ) -> Response:
+        '''
+        Serve a request from the cache or await compute, serialize and cache the result.
+        Answers 304 Not Modified if the client's If-None-Match matches the ETag.
+        '''
+        key = self.make_key(request.url.path, params)
+        entry = self.get(key, data_version)
+        if entry is None:
+            body = TypeAdapter(response_type).dump_json(await compute())
+            entry = CachedResponse(body, data_version)
+            self.set(key, entry)
+        headers = {'ETag': entry.etag, 'Cache-Control': 'no-cache'}
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match and entry.etag in [tag.strip() for tag in if_none_match.split(',')]:
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type='application/json', headers=headers)
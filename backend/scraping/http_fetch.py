@@ -0,0 +1,116 @@
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import httpx
+from lxml import html
+
+
+# news_scraper selector tuple: (xpath, multiple elements, function of the element(s))
+Selector = Tuple[str, bool, Callable[[Any], Any]]
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; fact-check-monitor/1.0)',
+    'Accept-Language': 'de-DE,de;q=0.9,en;q=0.5',
+}
+
+
+class LxmlElement():
+    '''
+    Wraps an lxml element in the part of the Selenium WebElement API the selector
+    functions use (text, get_attribute, tag_name), so selectors work unchanged for
+    both fetch paths.
+    '''
+    def __init__(self, element: html.HtmlElement):
+        self.element = element
+
+    @property
+    def text(self) -> str:
+        # Like Selenium's rendered text: whitespace collapsed per line, surrounding space removed
+        lines = (' '.join(line.split()) for line in self.element.text_content().splitlines())
+        return '\n'.join(line for line in lines if line)
+
+    @property
+    def tag_name(self) -> str:
+        return self.element.tag
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.element.get(name)
+
+
+def extract(document: html.HtmlElement, selectors: Dict[str, Selector]) -> Dict[str, Any]:
+    '''
+    Evaluate news_scraper selectors on a parsed page. Keys are the selector names without
+    the _selector suffix, like news_scraper's article dicts. A selector without a match
+    or whose function fails yields None.
+    '''
+    article: Dict[str, Any] = {}
+    for name, (xpath, multiple, function) in selectors.items():
+        key = name[:-len('_selector')] if name.endswith('_selector') else name
+        elements = [LxmlElement(element) for element in document.xpath(xpath) if isinstance(element, html.HtmlElement)]
+        try:
+            if multiple:
+                article[key] = function(elements)
+            else:
+                article[key] = function(elements[0]) if elements else None
+        except Exception:
+            article[key] = None
+    return article
+
+
+class HttpArticleWorker():
+    '''
+    Scrapes articles of static pages with pooled httpx requests and lxml instead of a browser.
+
+    Takes the same selector tuples as news_scraper's ArticleContentScraper. If make_fallback
+    is given, pages where a required field comes back empty (content rendered by JavaScript,
+    a consent wall) are handed to the worker it creates, e.g. a Selenium worker. That worker
+    is only created on the first such page, so a source that never needs it starts no browser.
+    '''
+    def __init__(
+        self,
+        selectors: Dict[str, Selector],
+        required: Sequence[str] = ('headline',),
+        make_fallback: Optional[Callable[[], Callable[[str], Optional[Dict[str, Any]]]]] = None,
+        timeout: float = 20.0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        self.selectors = selectors
+        self.required = required
+        self.make_fallback = make_fallback
+        self.fallback: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None
+        self.client = httpx.Client(
+            headers=headers or DEFAULT_HEADERS,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=4)
+        )
+        self.fallbacks = 0
+
+
+    def fetch(self, url: str) -> html.HtmlElement:
+        response = self.client.get(url)
+        response.raise_for_status()
+        return html.fromstring(response.content, base_url=str(response.url))
+
+
+    def __call__(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            article = extract(self.fetch(url), self.selectors)
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        if any(not article.get(field) for field in self.required):
+            if self.make_fallback:
+                if self.fallback is None:
+                    self.fallback = self.make_fallback()
+                self.fallbacks += 1
+                return self.fallback(url)
+            return None
+        article['url'] = url
+        return article
+
+
+    def close(self):
+        self.client.close()
+        # Only a fallback that was started has something to release
+        close = getattr(self.fallback, 'close', None) if self.fallback is not None else None
+        if close:
+            close()
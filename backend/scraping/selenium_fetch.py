@@ -0,0 +1,53 @@
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from lxml import html
+
+from scraping.http_fetch import Selector, extract
+
+
+class SeleniumArticleWorker():
+    '''
+    Scrapes articles in a real browser, for pages that need JavaScript or a consent click.
+
+    Each worker starts one undetected-chrome driver in __init__ and reuses it for every URL
+    until close(), and the ScrapingPipeline creates one worker per thread, so a run starts a
+    browser per thread instead of per article. The rendered page is evaluated with the same
+    selector tuples as the HTTP path. pre_hooks run after every page load, e.g. to close a
+    cookie banner; a hook that fails (the banner was already accepted) is ignored.
+    '''
+    def __init__(
+        self,
+        selectors: Dict[str, Selector],
+        required: Sequence[str] = ('headline',),
+        pre_hooks: Sequence[Callable[[Any], None]] = (),
+        headed: bool = True,
+        page_load_timeout: float = 30.0
+    ):
+        import undetected_chromedriver as uc
+        self.selectors = selectors
+        self.required = required
+        self.pre_hooks = pre_hooks
+        self.driver = uc.Chrome(headless=not headed)
+        self.driver.set_page_load_timeout(page_load_timeout)
+
+
+    def __call__(self, url: str) -> Optional[Dict[str, Any]]:
+        from selenium.common.exceptions import TimeoutException
+        try:
+            self.driver.get(url)
+        except TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        for hook in self.pre_hooks:
+            try:
+                hook(self.driver)
+            except Exception:
+                pass
+        article = extract(html.fromstring(self.driver.page_source, base_url=url), self.selectors)
+        if any(not article.get(field) for field in self.required):
+            return None
+        article['url'] = url
+        return article
+
+
+    def close(self):
+        self.driver.quit()
@@ -0,0 +1,46 @@
+import datetime
+from dataclasses import dataclass
+from typing import Dict, Optional
+from zoneinfo import ZoneInfo
+
+from scraping.http_fetch import Selector
+
+
+@dataclass
+class ScrapeSource():
+    '''
+    Where and how to scrape one medium. The selectors are news_scraper selector tuples and
+    work for both the HTTP and the Selenium fetch path. Only sources flagged needs_browser
+    (content rendered by JavaScript, consent walls hiding the article) are scraped with Selenium.
+    '''
+    medium: str
+    links_url: str
+    selectors: Dict[str, Selector]
+    needs_browser: bool = False
+    max_workers: int = 2
+    requests_per_minute: Optional[float] = 20
+
+
+def correctiv_published_at(element) -> datetime.datetime:
+    # The datetime attribute is local time, stored as UTC
+    local_time = datetime.datetime.strptime(element.get_attribute('datetime').split('+')[0], '%Y-%m-%dT%H:%M:%S')
+    return local_time - datetime.timedelta(hours=(lambda: 2 if datetime.datetime.now(ZoneInfo('Europe/Brussels')).dst() != datetime.timedelta(0) else 1)())
+
+
+CORRECTIV = ScrapeSource(
+    medium='correctiv',
+    links_url='https://correctiv.org/wp-json/wp/v2/posts?categories=5',
+    selectors={
+        'datetime_published_selector': ('//time', False, correctiv_published_at),
+        'author_selector': ('//p[@class="detail__authors"]', False, lambda element: element.text.replace('von ', '')),
+        'image_url_selector': ('//article//source', False, lambda element: element.get_attribute('srcset')),
+        'kicker_selector': ('//header/span[@class="topline"]', False, lambda element: element.text),
+        'headline_selector': ('//header/h1', False, lambda element: element.text),
+        'teaser_selector': ('//header/p[@class="detail__excerpt"]', False, lambda element: element.text),
+        'body_selector': ('//div[@class="detail__content"]/p', True, lambda element: [x.text for x in element if 'Alle Faktenchecks zu' not in x.text and 'Redigatur:' not in x.text]),
+        'subheadlines_selector': ('//div[@class="detail__content"]/h2', True, lambda element: [x.text for x in element]),
+        'body_structured_selector': ('//div[@class="detail__content"]/p | //div[@class="detail__content"]/h2', True, lambda element: [('subheadline', x.text) if x.tag_name == 'h2' else ('paragraph', x.text) for x in element])
+    },
+    # The cookie consent overlay only matters in a browser, the article HTML is served statically
+    needs_browser=False
+)
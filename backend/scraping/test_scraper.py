@@ -1,15 +1,18 @@
-import sys, datetime
+import sys, asyncio
 from pathlib import Path
-from zoneinfo import ZoneInfo
 from selenium.webdriver.common.by import By
 
 project_root = str(Path(__file__).parent.parent)
 sys.path.append(project_root)
 
-from news_scraper.news_scraper.scraper import ArticleLinkScraper, ArticleContentScraper
-from shared.schemas import FactCheckArticlesSchema
-from shared.services.fact_check_articles_service import FactCheckArticlesService
 from shared.database import Database
+from shared.pipelines.scraping import ScrapingPipeline, ScrapeJob
+from scraping.http_fetch import HttpArticleWorker
+from scraping.selenium_fetch import SeleniumArticleWorker
+from scraping.wordpress_feed import WordPressFeed
+from shared.embeddings import ArticleEmbedder
+from shared.pipelines.embedding import EmbeddingPipeline
+from scraping.sources import CORRECTIV
 
 
 def close_cookie_consent_correctiv(driver):
@@ -20,53 +23,48 @@ def close_cookie_consent_correctiv(driver):
     """, shadow_host).click()
 
 
-def main():
-    # Get links
-    article_link_scraper = ArticleLinkScraper(
-        scraping_mode='API',
-        selenium_settings={
-            'mode': 'wire',
-            'headed': True,
-            'proxy': None
-        },
-        urls=['https://correctiv.org/wp-json/wp/v2/posts?categories=5&per_page=3'],
-        article_url_selector=lambda x: [entry['link'] for entry in x]
+def make_correctiv_browser():
+    # At most one browser per worker thread, kept open for all articles the thread scrapes
+    return SeleniumArticleWorker(
+        CORRECTIV.selectors,
+        pre_hooks=[close_cookie_consent_correctiv],
+        headed=True
     )
-    links = article_link_scraper.run()
-    print(f'Number of links: {len(links)}')
 
-    # Use links to scrape content
-    article_content_scraper = ArticleContentScraper(
-        scraping_mode='FRONTEND',
-        selenium_settings={
-            'mode': 'uc',
-            'headed': True,
-            'proxy': None
-        },
-        link_list=links,
-        medium='correctiv',
-        pre_hooks=[lambda driver: close_cookie_consent_correctiv(driver)],
-        datetime_published_selector=('//time', False, lambda element: datetime.datetime.strptime(element.get_attribute('datetime').split('+')[0], '%Y-%m-%dT%H:%M:%S') - datetime.timedelta(hours=(lambda: 2 if datetime.datetime.now(ZoneInfo('Europe/Brussels')).dst() != datetime.timedelta(0) else 1)())),
-        # post_hooks=[lambda driver, article_data: parse_factcheck_data(driver, article_data), lambda driver, article_data: parse_category(driver, article_data)],
-        author_selector=('//p[@class="detail__authors"]', False, lambda element: element.text.replace('von ', '')),
-        image_url_selector=('//article//source', False, lambda element: element.get_attribute('srcset')),
-        kicker_selector=('//header/span[@class="topline"]', False, lambda element: element.text),
-        headline_selector=('//header/h1', False, lambda element: element.text),
-        teaser_selector=('//header/p[@class="detail__excerpt"]', False, lambda element: element.text),
-        body_selector=('//div[@class="detail__content"]/p', True, lambda element: [x.text for x in element if 'Alle Faktenchecks zu' not in x.text and 'Redigatur:' not in x.text]),
-        subheadlines_selector=('//div[@class="detail__content"]/h2', True, lambda element: [x.text for x in element]),
-        body_structured_selector=('//div[@class="detail__content"]/p | //div[@class="detail__content"]/h2', True, lambda element: [('subheadline', x.text) if x.tag_name == 'h2' else ('paragraph', x.text) for x in element])
-    )
-    articles = article_content_scraper.run()
-    print(f'Number of articles scraped: {len(articles)}')
 
-    # Save content to db
-    articles_objects = [FactCheckArticlesSchema.from_news_scraper(x) for x in articles]
+def make_correctiv_worker():
+    if CORRECTIV.needs_browser:
+        return make_correctiv_browser()
+    # Plain HTTP first, pages that come back without a headline are rendered in the browser,
+    # which is only started when the first such page comes up
+    return HttpArticleWorker(CORRECTIV.selectors, make_fallback=make_correctiv_browser)
+
+
+def main():
     db = Database()
-    with db.get_session() as session:
-        fact_check_articles_service = FactCheckArticlesService(session)
-        fact_check_articles_service.save_articles(articles_objects)
-    
+    # Only posts newer than the last crawl are listed, the crawl state advances once they are stored
+    correctiv_feed = WordPressFeed(db, CORRECTIV.medium, CORRECTIV.links_url)
+    # Links already in the database are skipped, scraped articles are saved in small batches
+    pipeline = ScrapingPipeline(
+        db=db,
+        jobs=[
+            ScrapeJob(
+                medium=CORRECTIV.medium,
+                get_links=correctiv_feed.get_links,
+                on_complete=correctiv_feed.on_complete,
+                make_worker=make_correctiv_worker,
+                max_workers=CORRECTIV.max_workers,
+                requests_per_minute=CORRECTIV.requests_per_minute
+            )
+        ],
+        write_batch_size=10
+    )
+    stats = asyncio.run(pipeline.run())
+    print(f'Scraping finished: {stats}')
+    # Embed the new articles for /similar and /search, unchanged ones are skipped
+    embedding_stats = EmbeddingPipeline(db, ArticleEmbedder()).run()
+    print(f'Embedding finished: {embedding_stats}')
+
     # RSS
     # article_link_scraper = ArticleLinkScraper(
     #     scraping_mode='RSS',
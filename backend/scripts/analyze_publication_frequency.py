@@ -9,8 +9,7 @@ project_root = str(Path(__file__).parent.parent)
 sys.path.append(project_root)
 
 from shared.database import Database
-from shared.models import FactCheckArticles
-from sqlalchemy import func
+from shared.services.fact_check_articles_service import FactCheckArticlesService
 
 def parse_date(date_string):
     try:
@@ -22,66 +21,52 @@ def analyze_publication_frequency_cli(date: str = None, interval: str = 'week',
     """
     Connects to the database and prints statistics on the number of articles published.
     Allows filtering by date, interval (day, week, month), and medium.
+    The counting happens in the database, only the aggregated buckets are loaded.
     """
     db = Database()
     
-    print(f"Connecting to database and fetching articles for '{interval}' interval...")
-    with db.get_session() as session:
-        query = session.query(FactCheckArticles)
-
-        if medium:
-            query = query.filter(FactCheckArticles.medium == medium)
+    start = None
+    end = None
+    if date:
+        start = datetime.strptime(date, '%Y-%m-%d')
+        end = start + timedelta(days=1) - timedelta(microseconds=1)
 
-        articles = query.all()
-        
-        articles_data = []
-        for article in articles:
-            if article.published_at:
-                articles_data.append({
-                    'published_at': article.published_at,
-                    'medium': article.medium # Include medium for later filtering
-                })
+    print(f"Connecting to database and aggregating articles per '{interval}'...")
+    with db.get_session() as session:
+        service = FactCheckArticlesService(session)
+        buckets = service.get_publication_histogram(
+            interval=interval,
+            medium=medium,
+            start=start,
+            end=end
+        )
 
-    if not articles_data:
-        print("No articles found or no publication dates available for the given criteria.")
+    if not buckets:
+        if date:
+            print(f"No articles found for {date}.")
+        else:
+            print("No articles found or no publication dates available for the given criteria.")
         return
 
-    df = pd.DataFrame(articles_data)
-    df['published_at'] = pd.to_datetime(df['published_at'])
-    
-    # Filter by a specific date if provided
-    if date:
-        target_date = datetime.strptime(date, '%Y-%m-%d').date()
-        df = df[df['published_at'].dt.date == target_date]
-        if df.empty:
-            print(f"No articles found for {date}.")
-            return
+    df = pd.DataFrame([bucket.model_dump() for bucket in buckets])
+    df['period'] = df['period'].dt.date
 
-    # Determine grouping frequency based on interval
     if interval == 'day':
-        grouping_key = df['published_at'].dt.date
         print(f"\n--- Articles Published on {date if date else 'Each Day'} ---")
     elif interval == 'week':
-        grouping_key = df['published_at'].dt.to_period('W')
-        print(f"\n--- Articles Published per Week (for {date if date else 'All Weeks'}) ---")
-    elif interval == 'month':
-        grouping_key = df['published_at'].dt.to_period('M')
-        print(f"\n--- Articles Published per Month (for {date if date else 'All Months'}) ---")
+        print(f"\n--- Articles Published per Week (for {date if date else 'All Weeks'}, starting Monday) ---")
     else:
-        print("Invalid interval. Please choose 'day', 'week', or 'month'.")
-        return
+        print(f"\n--- Articles Published per Month (for {date if date else 'All Months'}) ---")
 
-    # Group and count articles
+    total_counts = df.groupby('period')['count'].sum()
     if medium:
         # If a specific medium is requested, just show counts for that medium
-        result = df.groupby(grouping_key).size()
-        print(f"Total articles for medium '{medium}': {result.sum()}")
+        print(f"Total articles for medium '{medium}': {total_counts.sum()}")
     else:
         # Show total counts and breakdown by medium
-        total_counts = df.groupby(grouping_key).size()
         print(f"Total articles in selected interval(s): {total_counts.sum()}")
         print("\nBreakdown by Medium:")
-        medium_counts = df.groupby([grouping_key, df['medium']]).size().unstack(fill_value=0)
+        medium_counts = df.pivot_table(index='period', columns='medium', values='count', aggfunc='sum', fill_value=0)
         print(medium_counts.sort_index(ascending=False).to_string())
         print("\nTotal per interval:")
         print(total_counts.sort_index(ascending=False).to_string())
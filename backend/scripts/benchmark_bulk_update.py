@@ -0,0 +1,71 @@
+import sys, time
+from pathlib import Path
+import argparse
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.models import FactCheckArticles
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+
+def benchmark_bulk_update(num_articles: int = 1000, chunk_size: int = 1000):
+    """
+    Compare writing topics with one update_article call per row against bulk_update_articles.
+    Every article gets its current topic written back, so the data is left unchanged.
+    """
+    db = Database()
+    with db.get_session() as session:
+        rows = (
+            session.query(FactCheckArticles.id, FactCheckArticles.topic)
+            .order_by(FactCheckArticles.id)
+            .limit(num_articles)
+            .all()
+        )
+    updates = {article_id: {'topic': topic} for article_id, topic in rows}
+    if not updates:
+        print("No articles found in the database. Exiting.")
+        return
+    print(f"Benchmarking topic write-back for {len(updates)} articles...")
+
+    start = time.perf_counter()
+    with db.get_session() as session:
+        service = FactCheckArticlesService(session)
+        for article_id, update_data in updates.items():
+            service.update_article(article_id, update_data)
+    per_row_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with db.get_session() as session:
+        service = FactCheckArticlesService(session)
+        updated_count = service.bulk_update_articles(updates, chunk_size=chunk_size)
+    bulk_seconds = time.perf_counter() - start
+
+    print(f"\n{'Method':<25} {'Seconds':>10} {'Rows/s':>12}")
+    print("-" * 49)
+    print(f"{'update_article per row':<25} {per_row_seconds:>10.3f} {len(updates) / per_row_seconds:>12.0f}")
+    print(f"{'bulk_update_articles':<25} {bulk_seconds:>10.3f} {updated_count / bulk_seconds:>12.0f}")
+    print(f"\nSpeedup: {per_row_seconds / bulk_seconds:.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-row update_article against bulk_update_articles (writes current topics back, data is unchanged)."
+    )
+    parser.add_argument(
+        "--num_articles",
+        type=int,
+        default=1000,
+        help="Number of articles to update (default: 1000)."
+    )
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=1000,
+        help="Rows per UPDATE statement for the bulk path (default: 1000)."
+    )
+
+    args = parser.parse_args()
+    benchmark_bulk_update(num_articles=args.num_articles, chunk_size=args.chunk_size)
@@ -15,8 +15,16 @@ from shared.database import Database
 from shared.models import FactCheckArticles
 from shared.schemas import FactCheckArticleContent, Topic
 from shared.agents.topic_classifier import TopicClassifierAgent
+from shared.agents.llm_cache import LLMResultCache
 
-async def build_topic_classification_csv(num_articles: int, csv_file: str = "topic_classification_test.csv", model_name: Optional[str] = None):
+async def build_topic_classification_csv(
+    num_articles: int,
+    csv_file: str = "topic_classification_test.csv",
+    model_name: Optional[str] = None,
+    max_concurrency: int = 5,
+    requests_per_minute: Optional[float] = None,
+    use_cache: bool = True
+):
     """
     Build or append to a CSV file with all database columns plus classified topics.
     
@@ -25,6 +33,9 @@ async def build_topic_classification_csv(num_articles: int, csv_file: str = "top
     
     This creates a complete mirror of the database with all columns (including JSONB fields)
     that can be used for Streamlit visualization and experimentation.
+
+    Note: topics in the database are maintained by classify_topics.py. Use this script
+    (or classify_topics.py --export_csv) only when a CSV snapshot is needed.
     """
     db = Database()
     
@@ -61,31 +72,42 @@ async def build_topic_classification_csv(num_articles: int, csv_file: str = "top
         
         print(f"Found {len(articles_to_classify)} new articles to classify (requesting {num_articles}).")
         
-        classifier_agent = TopicClassifierAgent(model_name=model_name)
-        new_results = []
-        
-        for idx, article_orm in enumerate(articles_to_classify, 1):
-            article_id = article_orm.id
-            headline = article_orm.headline if article_orm.headline else ""
-            kicker = article_orm.kicker if article_orm.kicker else ""
-            teaser = article_orm.teaser if article_orm.teaser else ""
-            url = article_orm.url if article_orm.url else ""
-            
-            article_content = FactCheckArticleContent(
-                kicker=kicker,
-                headline=headline,
-                teaser=teaser,
+        cache = LLMResultCache(bypass=not use_cache)
+        classifier_agent = TopicClassifierAgent(model_name=model_name, cache=cache)
+        article_contents = [
+            FactCheckArticleContent(
+                kicker=article_orm.kicker if article_orm.kicker else "",
+                headline=article_orm.headline if article_orm.headline else "",
+                teaser=article_orm.teaser if article_orm.teaser else "",
                 body=article_orm.body if article_orm.body else []
             )
+            for article_orm in articles_to_classify
+        ]
 
-            print(f"[{idx}/{len(articles_to_classify)}] Classifying article ID: {article_id} - Headline: {headline[:60]}...")
-            
+        def report_progress(result):
+            article_orm = articles_to_classify[result.index]
+            headline = article_orm.headline if article_orm.headline else ""
+            if result.ok:
+                print(f"[{result.index + 1}/{len(articles_to_classify)}] Classified article ID: {article_orm.id} - Headline: {headline[:60]}...")
+            else:
+                print(f"  ❌ Error classifying article {article_orm.id}: {result.error}")
+
+        print(f"Classifying with up to {max_concurrency} concurrent requests...")
+        batch_results = await classifier_agent.run_many(
+            article_contents,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            on_result=report_progress
+        )
+        stats = cache.stats()
+        print(f"LLM cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate).")
+
+        new_results = []
+        for article_orm, result in zip(articles_to_classify, batch_results):
             classified_topic_label = "ERROR_CLASSIFYING_TOPIC" # Default in case of LLM failure
-            try:
-                classified_topic: Topic = await classifier_agent.run(article_content)
+            if result.ok:
+                classified_topic: Topic = result.output
                 classified_topic_label = classified_topic.topic_label
-            except Exception as e:
-                print(f"  ❌ Error classifying article {article_id}: {e}")
             
             # Extract all columns from the article ORM object
             new_results.append({
@@ -148,12 +170,35 @@ if __name__ == '__main__':
         default=None,
         help="Optional: Specify a different LLM model name."
     )
+    parser.add_argument(
+        "--concurrency",
+        dest="max_concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of concurrent LLM requests (default: 5)."
+    )
+    parser.add_argument(
+        "--rpm",
+        dest="requests_per_minute",
+        type=float,
+        default=None,
+        help="Optional: Rate limit in requests per minute for the model."
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Bypass the LLM result cache and send every article to the model."
+    )
     
     args = parser.parse_args()
     asyncio.run(
         build_topic_classification_csv(
             num_articles=args.num_articles,
             csv_file=args.csv_file,
-            model_name=args.model_name
+            model_name=args.model_name,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.requests_per_minute,
+            use_cache=args.use_cache
         )
     )
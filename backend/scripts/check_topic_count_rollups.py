@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+import argparse
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+
+def check_topic_count_rollups(rebuild: bool = False):
+    """
+    Compare the topic_count_rollups table with counts computed from the articles
+    and optionally rebuild it from scratch.
+    """
+    # A full rebuild may run longer than the default statement timeout
+    db = Database(statement_timeout_ms=0 if rebuild else None)
+    with db.get_session() as session:
+        service = FactCheckArticlesService(session)
+        if rebuild:
+            row_count = service.rebuild_topic_count_rollup()
+            print(f"Rebuilt topic count rollup with {row_count} rows.")
+
+        mismatches = service.check_topic_count_rollup()
+
+    if not mismatches:
+        print("✅ Topic count rollup matches the article counts.")
+        return
+    print(f"❌ {len(mismatches)} rollup buckets differ from the article counts:")
+    for mismatch in mismatches[:20]:
+        print(f"  {mismatch['day']} | {mismatch['medium']} | {mismatch['topic']}: "
+              f"articles={mismatch['article_count']}, rollup={mismatch['rollup_count']}")
+    if len(mismatches) > 20:
+        print(f"  ... and {len(mismatches) - 20} more.")
+    print("Run with --rebuild to recompute the rollup.")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Check the daily topic count rollup against the articles table."
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompute the rollup from the articles before checking."
+    )
+
+    args = parser.parse_args()
+    check_topic_count_rollups(rebuild=args.rebuild)
@@ -13,8 +13,16 @@ from shared.database import Database
 from shared.models import FactCheckArticles
 from shared.schemas import FactCheckArticleContent, Topic
 from shared.agents.topic_classifier import TopicClassifierAgent
+from shared.agents.llm_cache import LLMResultCache
 
-async def classify_articles_to_csv_cli(num_articles: int, output_csv: str, model_name: Optional[str] = None):
+async def classify_articles_to_csv_cli(
+    num_articles: int,
+    output_csv: str,
+    model_name: Optional[str] = None,
+    max_concurrency: int = 5,
+    requests_per_minute: Optional[float] = None,
+    use_cache: bool = True
+):
     """
     CLI function to load N articles, classify them using the TopicClassifierAgent,
     and save the results to a CSV file.
@@ -31,37 +39,47 @@ async def classify_articles_to_csv_cli(num_articles: int, output_csv: str, model
             print("No articles found in the database. Exiting.")
             return
         
-        classifier_agent = TopicClassifierAgent(model_name=model_name)
-        
-        for article_orm in articles_orm:
-            article_id = article_orm.id
-            headline = article_orm.headline if article_orm.headline else ""
-            kicker = article_orm.kicker if article_orm.kicker else ""
-            teaser = article_orm.teaser if article_orm.teaser else ""
-            url = article_orm.url if article_orm.url else ""
-            
-            article_content = FactCheckArticleContent(
-                kicker=kicker,
-                headline=headline,
-                teaser=teaser,
+        cache = LLMResultCache(bypass=not use_cache)
+        classifier_agent = TopicClassifierAgent(model_name=model_name, cache=cache)
+        article_contents = [
+            FactCheckArticleContent(
+                kicker=article_orm.kicker if article_orm.kicker else "",
+                headline=article_orm.headline if article_orm.headline else "",
+                teaser=article_orm.teaser if article_orm.teaser else "",
                 body=article_orm.body if article_orm.body else []
             )
+            for article_orm in articles_orm
+        ]
 
-            print(f"Classifying article ID: {article_id} - Headline: {headline[:70]}...")
-            
+        def report_progress(result):
+            article_orm = articles_orm[result.index]
+            headline = article_orm.headline if article_orm.headline else ""
+            if result.ok:
+                print(f"Classified article ID: {article_orm.id} - Headline: {headline[:70]}...")
+            else:
+                print(f"❌ Error classifying article {article_orm.id}: {result.error}")
+
+        batch_results = await classifier_agent.run_many(
+            article_contents,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            on_result=report_progress
+        )
+        stats = cache.stats()
+        print(f"LLM cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate).")
+
+        for article_orm, result in zip(articles_orm, batch_results):
             classified_topic_label = "ERROR_CLASSIFYING_TOPIC" # Default in case of LLM failure
-            try:
-                classified_topic: Topic = await classifier_agent.run(article_content)
+            if result.ok:
+                classified_topic: Topic = result.output
                 classified_topic_label = classified_topic.topic_label
-            except Exception as e:
-                print(f"❌ Error classifying article {article_id}: {e}")
             
             results.append({
-                "id": article_id,
-                "headline": headline,
-                "kicker": kicker,
-                "teaser": teaser,
-                "url": url,
+                "id": article_orm.id,
+                "headline": article_orm.headline if article_orm.headline else "",
+                "kicker": article_orm.kicker if article_orm.kicker else "",
+                "teaser": article_orm.teaser if article_orm.teaser else "",
+                "url": article_orm.url if article_orm.url else "",
                 "topic": classified_topic_label
             })
 
@@ -96,13 +114,36 @@ if __name__ == '__main__':
         default=None,
         help="Optional: Specify a different LLM model name."
     )
+    parser.add_argument(
+        "--concurrency",
+        dest="max_concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of concurrent LLM requests (default: 5)."
+    )
+    parser.add_argument(
+        "--rpm",
+        dest="requests_per_minute",
+        type=float,
+        default=None,
+        help="Optional: Rate limit in requests per minute for the model."
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Bypass the LLM result cache and send every article to the model."
+    )
     
     args = parser.parse_args()
     asyncio.run(
         classify_articles_to_csv_cli(
             num_articles=args.num_articles,
             output_csv=args.output_csv,
-            model_name=args.model_name
+            model_name=args.model_name,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.requests_per_minute,
+            use_cache=args.use_cache
         )
     )
 
@@ -0,0 +1,196 @@
+import sys, asyncio
+from pathlib import Path
+from typing import Optional
+import argparse
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.agents.topic_classifier import TopicClassifierAgent
+from shared.agents.llm_cache import LLMResultCache
+from shared.agents.prompt_builder import ArticlePromptBuilder
+from shared.agents.local_topic_classifier import LocalTopicClassifier
+from shared.pipelines.topic_classification import TopicClassificationPipeline
+
+async def classify_topics_cli(
+    max_articles: Optional[int] = None,
+    chunk_size: int = 100,
+    include_stale: bool = False,
+    include_changed: bool = True,
+    restart: bool = False,
+    export_csv: Optional[str] = None,
+    model_name: Optional[str] = None,
+    max_concurrency: int = 5,
+    requests_per_minute: Optional[float] = None,
+    use_cache: bool = True,
+    local: bool = False,
+    local_model: Optional[str] = None,
+    min_confidence: Optional[float] = None,
+    pack_tokens: Optional[int] = None,
+    prompt_tokens: Optional[int] = None
+):
+    """
+    Classify all articles without a topic, or whose content changed since their classification,
+    and write the topics straight to the database.
+    Progress is checkpointed per chunk, so re-running after a crash resumes where it stopped.
+    With local, confident articles are labelled by the local classifier and only the rest go to the LLM.
+    With pack_tokens, several articles are sent per LLM request up to that token budget.
+    With prompt_tokens, articles are sent as plain text cut to that many tokens.
+    """
+    cache = LLMResultCache(bypass=not use_cache)
+    local_classifier = None
+    if local:
+        local_classifier = LocalTopicClassifier.load(local_model)
+        if min_confidence is not None:
+            local_classifier.threshold = min_confidence
+        print(f"Local classifier trained on {local_classifier.metadata.get('num_training_articles')} articles, "
+              f"confidence threshold {local_classifier.threshold:.2f}.")
+    prompt_builder = ArticlePromptBuilder(max_tokens=prompt_tokens) if prompt_tokens else None
+    classifier_agent = TopicClassifierAgent(model_name=model_name, cache=cache, prompt_builder=prompt_builder)
+    pipeline = TopicClassificationPipeline(
+        db=Database(),
+        classifier_agent=classifier_agent,
+        chunk_size=chunk_size,
+        include_stale=include_stale,
+        include_changed=include_changed,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+        export_csv=export_csv,
+        local_classifier=local_classifier,
+        pack_request_tokens=pack_tokens
+    )
+    stats = await pipeline.run(max_articles=max_articles, restart=restart)
+    cache_stats = cache.stats()
+
+    print(f"\n✅ Classified {stats['classified']} of {stats['processed']} articles ({stats['local']} locally, {stats['llm']} by the LLM).")
+    if stats['failed'] > 0:
+        print(f"❌ Failed to classify {stats['failed']} articles (they keep their previous topic and are retried on the next pass).")
+    usage = classifier_agent.usage
+    print(f"LLM usage: {usage['requests']} requests ({usage['packed_requests']} packed, {usage['fallback_articles']} articles re-sent alone), "
+          f"{usage['input_tokens']} input and {usage['output_tokens']} output tokens.")
+    if prompt_builder:
+        print(f"Prompt builder: {usage['prompt_tokens_saved']} article tokens saved.")
+    print(f"LLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses ({cache_stats['hit_rate']:.0%} hit rate).")
+    if export_csv:
+        print(f"✅ Appended classified articles to {export_csv}.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Classify all unclassified articles in the database and store their topics (incremental, resumable)."
+    )
+    parser.add_argument(
+        "--max_articles",
+        type=int,
+        default=None,
+        help="Optional: Stop after this many articles (default: all unclassified articles)."
+    )
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=100,
+        help="Number of articles read, classified and written back per chunk (default: 100)."
+    )
+    parser.add_argument(
+        "--include-stale",
+        dest="include_stale",
+        action="store_true",
+        help="Also re-classify articles whose topic is not one of the current Axis-1 labels."
+    )
+    parser.add_argument(
+        "--unclassified-only",
+        dest="include_changed",
+        action="store_false",
+        help="Do not re-classify articles whose content changed since they were classified."
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the checkpoint and start from the first article."
+    )
+    parser.add_argument(
+        "--export_csv",
+        type=str,
+        default=None,
+        help="Optional: Also append the classified articles to this CSV file."
+    )
+    parser.add_argument(
+        "--model",
+        dest="model_name",
+        type=str,
+        default=None,
+        help="Optional: Specify a different LLM model name."
+    )
+    parser.add_argument(
+        "--concurrency",
+        dest="max_concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of concurrent LLM requests (default: 5)."
+    )
+    parser.add_argument(
+        "--rpm",
+        dest="requests_per_minute",
+        type=float,
+        default=None,
+        help="Optional: Rate limit in requests per minute for the model."
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Bypass the LLM result cache and send every article to the model."
+    )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Label confident articles with the local classifier (see train_local_topic_classifier.py), send only the rest to the LLM."
+    )
+    parser.add_argument(
+        "--local_model",
+        type=str,
+        default=None,
+        help="Optional: Path of the local classifier (default: .models/local_topic_classifier.joblib)."
+    )
+    parser.add_argument(
+        "--min_confidence",
+        type=float,
+        default=None,
+        help="Optional: Override the local classifier's confidence threshold."
+    )
+    parser.add_argument(
+        "--pack_tokens",
+        type=int,
+        default=None,
+        help="Optional: Pack several articles into one LLM request up to this many prompt tokens (e.g. 8000)."
+    )
+    parser.add_argument(
+        "--prompt_tokens",
+        type=int,
+        default=None,
+        help="Optional: Send articles as plain text cut to this many tokens (e.g. 600) instead of the full JSON."
+    )
+
+    args = parser.parse_args()
+    asyncio.run(
+        classify_topics_cli(
+            max_articles=args.max_articles,
+            chunk_size=args.chunk_size,
+            include_stale=args.include_stale,
+            include_changed=args.include_changed,
+            restart=args.restart,
+            export_csv=args.export_csv,
+            model_name=args.model_name,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.requests_per_minute,
+            use_cache=args.use_cache,
+            local=args.local,
+            local_model=args.local_model,
+            min_confidence=args.min_confidence,
+            pack_tokens=args.pack_tokens,
+            prompt_tokens=args.prompt_tokens
+        )
+    )
@@ -10,19 +10,27 @@ sys.path.append(str(project_root))
 
 from shared.schemas import FactCheckArticleContent, FactCheckArticlesSchema, LLMGeneratedTopic
 from shared.agents.topic_generator import TopicGeneratorAgent
+from shared.agents.llm_cache import LLMResultCache
 from shared.database import Database
 from shared.services.fact_check_articles_service import FactCheckArticlesService
 from shared.models import FactCheckArticles # Import the SQLAlchemy model
 
-async def generate_topics_for_sample(sample_size: int = 100):
+async def generate_topics_for_sample(
+    sample_size: int = 100,
+    max_concurrency: int = 5,
+    requests_per_minute: Optional[float] = None,
+    use_cache: bool = True
+):
     """
     Generates topics for a sample of articles, evenly distributed by medium and published_at,
     and stores the results in a local CSV file, avoiding articles already processed.
     """
     db = Database()
+    cache = LLMResultCache(bypass=not use_cache)
     topic_generator = TopicGeneratorAgent(
         # model_name='mistralai/devstral-2512:free' # Or your preferred model
-        model_name='anthropic/claude-haiku-4.5'
+        model_name='anthropic/claude-haiku-4.5',
+        cache=cache
     )
     output_file = "llm_generated_topics_sample.csv"
     existing_processed_ids = set()
@@ -42,6 +50,8 @@ async def generate_topics_for_sample(sample_size: int = 100):
             existing_df = pd.DataFrame(columns=['id', 'medium', 'url', 'headline', 'kicker', 'teaser', 'llm_topic'])
 
     results_to_append = []
+    sampled_rows = []
+    article_contents = []
 
     with db.get_session() as session:
         service = FactCheckArticlesService(session)
@@ -84,41 +94,49 @@ async def generate_topics_for_sample(sample_size: int = 100):
                 article = FactCheckArticlesSchema.model_validate(article_orm.__dict__)
 
                 # Handle potential None values for article fields
-                article_id = article.id
-                medium = article.medium
-                url = article.url
                 headline = article.headline if article.headline is not None else "N/A"
                 kicker = article.kicker if article.kicker is not None else "N/A"
                 teaser = article.teaser if article.teaser is not None else "N/A"
                 body = article.body # body is a List[BodyBlock], so it should be safe even if empty
 
-                article_content = FactCheckArticleContent(
+                sampled_rows.append({
+                    'id': article.id,
+                    'medium': article.medium,
+                    'url': article.url,
+                    'headline': headline,
+                    'kicker': kicker,
+                    'teaser': teaser
+                })
+                article_contents.append(FactCheckArticleContent(
                     kicker=kicker,
                     headline=headline,
                     teaser=teaser,
                     body=body
-                )
-
-                print(f"Generating topic for article ID: {article_id} - Headline: {headline[:50]}...")
-                
-                topic_label = "ERROR_GENERATING_TOPIC" # Default in case of LLM failure
-
-                try:
-                    generated_topic: LLMGeneratedTopic = await topic_generator.run(article_content)
-                    topic_label = generated_topic.topic_label
-                except Exception as e:
-                    print(f"Error generating topic for article {article_id}: {e}")
-
-                results_to_append.append({
-                    'id': article_id,
-                    'medium': medium,
-                    'url': url,
-                    'headline': headline,
-                    'kicker': kicker,
-                    'teaser': teaser,
-                    'llm_topic': topic_label
-                })
-                # Pause to respect API rate limits if needed (e.g., time.sleep(1))
+                ))
+
+    def report_progress(result):
+        row = sampled_rows[result.index]
+        if result.ok:
+            print(f"Generated topic for article ID: {row['id']} - Headline: {row['headline'][:50]}...")
+        else:
+            print(f"Error generating topic for article {row['id']}: {result.error}")
+
+    # Concurrency and rate limiting are handled by the batch runner
+    batch_results = await topic_generator.run_many(
+        article_contents,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+        on_result=report_progress
+    )
+    stats = cache.stats()
+    print(f"LLM cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate).")
+
+    for row, result in zip(sampled_rows, batch_results):
+        topic_label = "ERROR_GENERATING_TOPIC" # Default in case of LLM failure
+        if result.ok:
+            generated_topic: LLMGeneratedTopic = result.output
+            topic_label = generated_topic.topic_label
+        results_to_append.append({**row, 'llm_topic': topic_label})
     
     if results_to_append:
         new_df = pd.DataFrame(results_to_append)
@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+from typing import Optional
+import argparse
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.embeddings import ArticleEmbedder
+from shared.pipelines.embedding import EmbeddingPipeline
+
+
+def embed_articles_cli(
+    max_articles: Optional[int] = None,
+    model_name: Optional[str] = None,
+    batch_size: int = 64,
+    scan_size: int = 1000
+):
+    """
+    Embed all articles that are new or whose headline, teaser or claim changed since they were embedded.
+    """
+    pipeline = EmbeddingPipeline(
+        db=Database(),
+        embedder=ArticleEmbedder(model_name=model_name, batch_size=batch_size),
+        scan_size=scan_size
+    )
+    stats = pipeline.run(max_articles=max_articles)
+    print(f"\n✅ Embedded {stats['embedded']} articles.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Embed new and changed articles for semantic search and near-duplicate detection (incremental)."
+    )
+    parser.add_argument(
+        "--max_articles",
+        type=int,
+        default=None,
+        help="Optional: Stop after this many articles (default: all new and changed articles)."
+    )
+    parser.add_argument(
+        "--model",
+        dest="model_name",
+        type=str,
+        default=None,
+        help="Optional: sentence-transformers model (default: EMBEDDING_MODEL or paraphrase-multilingual-MiniLM-L12-v2)."
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=64,
+        help="Number of texts encoded per model call (default: 64)."
+    )
+    parser.add_argument(
+        "--scan_size",
+        type=int,
+        default=1000,
+        help="Number of articles checked per database round trip (default: 1000)."
+    )
+
+    args = parser.parse_args()
+    embed_articles_cli(
+        max_articles=args.max_articles,
+        model_name=args.model_name,
+        batch_size=args.batch_size,
+        scan_size=args.scan_size
+    )
@@ -0,0 +1,179 @@
+import sys, json, asyncio
+from pathlib import Path
+from typing import List, Optional
+import argparse
+
+from sqlalchemy import func
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.models import FactCheckArticles
+from shared.schemas import FactCheckArticleContent, TOPIC_LABELS
+from shared.agents.topic_classifier import TopicClassifierAgent
+from shared.agents.llm_cache import LLMResultCache
+from shared.agents.prompt_builder import ArticlePromptBuilder
+from shared.agents.token_counter import TokenCounter
+
+
+def load_sample(num_articles: int):
+    '''
+    A deterministic sample of classified articles (ordered by the hash of their URL) with their stored topics.
+    '''
+    with Database().get_session() as session:
+        articles = (
+            session.query(FactCheckArticles)
+            .filter(FactCheckArticles.topic.in_(TOPIC_LABELS))
+            .order_by(func.md5(FactCheckArticles.url))
+            .limit(num_articles)
+            .all()
+        )
+        return [FactCheckArticleContent.from_article(article) for article in articles], [article.topic for article in articles]
+
+
+def agreement(labels: List[Optional[str]], reference: List[Optional[str]]) -> Optional[float]:
+    pairs = [(label, other) for label, other in zip(labels, reference) if label is not None and other is not None]
+    return sum(label == other for label, other in pairs) / len(pairs) if pairs else None
+
+
+async def evaluate_prompt_budget_cli(
+    num_articles: int = 200,
+    budgets: Optional[List[int]] = None,
+    tokens_only: bool = False,
+    model_name: Optional[str] = None,
+    max_concurrency: int = 5,
+    requests_per_minute: Optional[float] = None,
+    use_cache: bool = True,
+    report_json: Optional[str] = None
+):
+    """
+    Compare the full JSON article prompt with the token-budgeted plain-text prompt of the
+    ArticlePromptBuilder on a sample of classified articles: article tokens per prompt and, unless
+    tokens_only, how often the topics of each budget agree with the full prompt and the stored topics.
+    """
+    budgets = budgets or [300, 600, 1000]
+    contents, stored = load_sample(num_articles)
+    print(f"Loaded {len(contents)} classified articles.")
+    counter = TokenCounter()
+    full_tokens = [counter.count(content.model_dump_json()) for content in contents]
+
+    full_labels = None
+    if not tokens_only:
+        cache = LLMResultCache(bypass=not use_cache)
+        agent = TopicClassifierAgent(model_name=model_name, cache=cache)
+        results = await agent.run_many(contents, max_concurrency=max_concurrency, requests_per_minute=requests_per_minute)
+        full_labels = [result.output.topic_label if result.ok else None for result in results]
+
+    rows = [{
+        'budget': None,
+        'tokens_per_article': sum(full_tokens) / len(contents),
+        'saved': 0.0,
+        'truncated': 0.0,
+        'agreement_full': 1.0 if full_labels else None,
+        'agreement_stored': agreement(full_labels, stored) if full_labels else None,
+    }]
+    for budget in budgets:
+        builder = ArticlePromptBuilder(max_tokens=budget, token_counter=counter)
+        prompts = [builder.build(content) for content in contents]
+        row = {
+            'budget': budget,
+            'tokens_per_article': sum(prompt.tokens for prompt in prompts) / len(prompts),
+            'saved': sum(prompt.saved_tokens for prompt in prompts) / sum(full_tokens),
+            'truncated': sum(prompt.truncated for prompt in prompts) / len(prompts),
+            'agreement_full': None,
+            'agreement_stored': None,
+        }
+        if not tokens_only:
+            agent = TopicClassifierAgent(model_name=model_name, cache=cache, prompt_builder=builder)
+            results = await agent.run_many(contents, max_concurrency=max_concurrency, requests_per_minute=requests_per_minute)
+            labels = [result.output.topic_label if result.ok else None for result in results]
+            row['agreement_full'] = agreement(labels, full_labels)
+            row['agreement_stored'] = agreement(labels, stored)
+        rows.append(row)
+
+    def percent(value: Optional[float]) -> str:
+        return f"{value:.1%}" if value is not None else '-'
+
+    print(f"\n{'budget':>8} {'tokens':>8} {'saved':>7} {'cut':>7} {'= full':>8} {'= stored':>9}")
+    for row in rows:
+        budget = 'full' if row['budget'] is None else row['budget']
+        print(f"{budget:>8} {row['tokens_per_article']:>8.0f} {percent(row['saved']):>7} {percent(row['truncated']):>7} "
+              f"{percent(row['agreement_full']):>8} {percent(row['agreement_stored']):>9}")
+    if report_json:
+        with open(report_json, 'w') as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Evaluate the token-budgeted article prompt against the full JSON prompt on classified articles."
+    )
+    parser.add_argument(
+        "--num_articles",
+        type=int,
+        default=200,
+        help="Number of classified articles to sample (default: 200)."
+    )
+    parser.add_argument(
+        "--budget",
+        dest="budgets",
+        type=int,
+        action="append",
+        default=None,
+        help="Token budget of the prompt builder to evaluate (repeatable, default: 300, 600 and 1000)."
+    )
+    parser.add_argument(
+        "--tokens_only",
+        action="store_true",
+        help="Only report the token counts, without calling the LLM."
+    )
+    parser.add_argument(
+        "--model",
+        dest="model_name",
+        type=str,
+        default=None,
+        help="Optional: Specify a different LLM model name."
+    )
+    parser.add_argument(
+        "--concurrency",
+        dest="max_concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of concurrent LLM requests (default: 5)."
+    )
+    parser.add_argument(
+        "--rpm",
+        dest="requests_per_minute",
+        type=float,
+        default=None,
+        help="Optional: Rate limit in requests per minute for the model."
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Bypass the LLM result cache and send every article to the model."
+    )
+    parser.add_argument(
+        "--report_json",
+        type=str,
+        default=None,
+        help="Optional: Also write the report rows to this JSON file."
+    )
+
+    args = parser.parse_args()
+    asyncio.run(
+        evaluate_prompt_budget_cli(
+            num_articles=args.num_articles,
+            budgets=args.budgets,
+            tokens_only=args.tokens_only,
+            model_name=args.model_name,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.requests_per_minute,
+            use_cache=args.use_cache,
+            report_json=args.report_json
+        )
+    )
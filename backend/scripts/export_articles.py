@@ -0,0 +1,120 @@
+import sys
+from pathlib import Path
+import argparse
+import datetime
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.export import EXPORT_FORMATS, export_columns, export_lines
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+
+def export_articles(
+    output: str = '-',
+    format: str = 'ndjson',
+    medium: str = None,
+    topic: str = None,
+    published_after: datetime.datetime = None,
+    published_before: datetime.datetime = None,
+    fields: list = None,
+    summary: bool = False,
+    batch_size: int = 1000
+):
+    """
+    Write all matching articles as NDJSON or CSV, row by row through a server-side cursor,
+    so the whole corpus can be exported in constant memory.
+    """
+    columns = export_columns(fields, summary)
+    db = Database()
+    out = sys.stdout if output == '-' else open(output, 'w', encoding='utf-8', newline='')
+    exported = 0
+    try:
+        with db.get_session() as session:
+            articles = FactCheckArticlesService(session).iter_articles(
+                medium=medium,
+                topic=topic,
+                published_after=published_after,
+                published_before=published_before,
+                fields=fields,
+                summary=summary,
+                batch_size=batch_size
+            )
+            for line in export_lines(articles, format, columns):
+                out.write(line)
+                exported += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if format == 'csv':
+        # The header line is not an article
+        exported -= 1
+    print(f"Exported {exported} articles.", file=sys.stderr)
+
+
+def parse_date(value: str) -> datetime.datetime:
+    return datetime.datetime.strptime(value, '%Y-%m-%d')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Export articles as NDJSON or CSV in constant memory.")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default='-',
+        help="Output file (default: stdout)."
+    )
+    parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default='ndjson',
+        help="Export format (default: ndjson)."
+    )
+    parser.add_argument("--medium", type=str, default=None, help="Only export articles of this medium.")
+    parser.add_argument("--topic", type=str, default=None, help="Only export articles of this topic.")
+    parser.add_argument(
+        "--published_after",
+        type=parse_date,
+        default=None,
+        help="Only export articles published on or after this date (YYYY-MM-DD)."
+    )
+    parser.add_argument(
+        "--published_before",
+        type=parse_date,
+        default=None,
+        help="Only export articles published on or before this date (YYYY-MM-DD)."
+    )
+    parser.add_argument(
+        "--fields",
+        type=lambda value: [name.strip() for name in value.split(',') if name.strip()],
+        default=None,
+        help="Comma-separated columns to export, id is always included (default: all)."
+    )
+    parser.add_argument(
+        "--summary",
+        action='store_true',
+        help="Export only list fields without body and entities."
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=1000,
+        help="Rows fetched per round trip from the server-side cursor (default: 1000)."
+    )
+
+    args = parser.parse_args()
+    if args.published_before:
+        args.published_before = args.published_before.replace(hour=23, minute=59, second=59)
+    export_articles(
+        output=args.output,
+        format=args.format,
+        medium=args.medium,
+        topic=args.topic,
+        published_after=args.published_after,
+        published_before=args.published_before,
+        fields=args.fields,
+        summary=args.summary,
+        batch_size=args.batch_size
+    )
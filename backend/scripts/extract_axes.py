@@ -0,0 +1,146 @@
+import sys, asyncio
+from pathlib import Path
+from typing import Optional
+import argparse
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.schemas import AXIS_COLUMNS
+from shared.agents.axis_extractor import AxisExtractorAgent
+from shared.agents.llm_cache import LLMResultCache
+from shared.agents.prompt_builder import ArticlePromptBuilder
+from shared.pipelines.axis_extraction import AxisExtractionPipeline
+
+async def extract_axes_cli(
+    max_articles: Optional[int] = None,
+    chunk_size: int = 100,
+    only_missing: bool = True,
+    restart: bool = False,
+    model_name: Optional[str] = None,
+    max_concurrency: int = 5,
+    requests_per_minute: Optional[float] = None,
+    use_cache: bool = True,
+    pack_tokens: Optional[int] = None,
+    prompt_tokens: Optional[int] = None
+):
+    """
+    Extract topic, claim, instrumentalizer and entities of all articles with an empty axis
+    in a single LLM call per article and write them straight to the database.
+    By default only the empty axes are filled; with only_missing=False all four are overwritten.
+    Progress is checkpointed per chunk, so re-running after a crash resumes where it stopped.
+    With pack_tokens, several articles are sent per LLM request up to that token budget.
+    With prompt_tokens, articles are sent as plain text cut to that many tokens.
+    """
+    cache = LLMResultCache(bypass=not use_cache)
+    prompt_builder = ArticlePromptBuilder(max_tokens=prompt_tokens) if prompt_tokens else None
+    extractor_agent = AxisExtractorAgent(model_name=model_name, cache=cache, prompt_builder=prompt_builder)
+    pipeline = AxisExtractionPipeline(
+        db=Database(),
+        extractor_agent=extractor_agent,
+        chunk_size=chunk_size,
+        only_missing=only_missing,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+        pack_request_tokens=pack_tokens
+    )
+    stats = await pipeline.run(max_articles=max_articles, restart=restart)
+    cache_stats = cache.stats()
+
+    print(f"\n✅ Extracted the axes of {stats['extracted']} of {stats['processed']} articles.")
+    print("Written values: " + ", ".join(f"{axis} {stats[axis]}" for axis in AXIS_COLUMNS))
+    if stats['failed'] > 0:
+        print(f"❌ Failed to extract {stats['failed']} articles (they are retried on the next pass).")
+    usage = extractor_agent.usage
+    print(f"LLM usage: {usage['requests']} requests ({usage['packed_requests']} packed, {usage['fallback_articles']} articles re-sent alone), "
+          f"{usage['input_tokens']} input and {usage['output_tokens']} output tokens.")
+    if prompt_builder:
+        print(f"Prompt builder: {usage['prompt_tokens_saved']} article tokens saved.")
+    print(f"LLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses ({cache_stats['hit_rate']:.0%} hit rate).")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Fill topic, claim, instrumentalizer and entities of articles with one LLM call per article (incremental, resumable)."
+    )
+    parser.add_argument(
+        "--max_articles",
+        type=int,
+        default=None,
+        help="Optional: Stop after this many articles (default: all articles with an empty axis)."
+    )
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=100,
+        help="Number of articles read, extracted and written back per chunk (default: 100)."
+    )
+    parser.add_argument(
+        "--overwrite",
+        dest="only_missing",
+        action="store_false",
+        help="Overwrite all four axes instead of filling only the empty ones, and re-extract articles whose content changed."
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the checkpoint and start from the first article."
+    )
+    parser.add_argument(
+        "--model",
+        dest="model_name",
+        type=str,
+        default=None,
+        help="Optional: Specify a different LLM model name."
+    )
+    parser.add_argument(
+        "--concurrency",
+        dest="max_concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of concurrent LLM requests (default: 5)."
+    )
+    parser.add_argument(
+        "--rpm",
+        dest="requests_per_minute",
+        type=float,
+        default=None,
+        help="Optional: Rate limit in requests per minute for the model."
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Bypass the LLM result cache and send every article to the model."
+    )
+    parser.add_argument(
+        "--pack_tokens",
+        type=int,
+        default=None,
+        help="Optional: Pack several articles into one LLM request up to this many prompt tokens (e.g. 8000)."
+    )
+    parser.add_argument(
+        "--prompt_tokens",
+        type=int,
+        default=None,
+        help="Optional: Send articles as plain text cut to this many tokens (e.g. 600) instead of the full JSON."
+    )
+
+    args = parser.parse_args()
+    asyncio.run(
+        extract_axes_cli(
+            max_articles=args.max_articles,
+            chunk_size=args.chunk_size,
+            only_missing=args.only_missing,
+            restart=args.restart,
+            model_name=args.model_name,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.requests_per_minute,
+            use_cache=args.use_cache,
+            pack_tokens=args.pack_tokens,
+            prompt_tokens=args.prompt_tokens
+        )
+    )
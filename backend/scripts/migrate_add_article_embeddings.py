@@ -0,0 +1,74 @@
+"""
+Migration script to add the article_embeddings table.
+This script:
+1. Enables the pgvector extension
+2. Creates the article_embeddings table (one embedding per article)
+3. Adds an HNSW index for cosine-distance nearest-neighbour queries
+
+Fill the table with scripts/embed_articles.py afterwards.
+
+Run this script once to apply the migration.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from backend.shared.database import Database
+from backend.shared.models import EMBEDDING_DIMENSIONS
+
+
+def migrate_article_embeddings():
+    """
+    Create the article_embeddings table and its vector index.
+    This is a safe migration that can be run multiple times.
+    """
+    # Index builds may run longer than the default statement timeout
+    db = Database(statement_timeout_ms=0)
+
+    # SQL statements to add the table
+    migration_statements = [
+        """
+        CREATE EXTENSION IF NOT EXISTS vector;
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS article_embeddings (
+            article_id INTEGER PRIMARY KEY REFERENCES fact_check_articles (id) ON DELETE CASCADE,
+            model VARCHAR NOT NULL,
+            text_hash VARCHAR(64) NOT NULL,
+            embedding vector({EMBEDDING_DIMENSIONS}) NOT NULL,
+            created_at TIMESTAMP
+        );
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_article_embeddings_embedding_hnsw
+        ON article_embeddings USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64);
+        """,
+    ]
+
+    try:
+        with db.engine.connect() as connection:
+            for statement in migration_statements:
+                print(f"Executing: {statement.strip()[:60]}...")
+                connection.execute(text(statement))
+                connection.commit()
+
+        print("\n✅ Migration successful!")
+        print("   Added:   vector extension")
+        print(f"   Added:   article_embeddings (article_id, model, text_hash, embedding vector({EMBEDDING_DIMENSIONS}), created_at)")
+        print("   Added:   idx_article_embeddings_embedding_hnsw")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == '__main__':
+    print("Starting article embeddings migration...")
+    print("=" * 60)
+    migrate_article_embeddings()
+    print("=" * 60)
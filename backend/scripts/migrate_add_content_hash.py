@@ -0,0 +1,127 @@
+"""
+Migration script to add change detection to the fact_check_articles table.
+This script:
+1. Adds the content_hash and classified_hash columns
+2. Backfills content_hash from headline, teaser and body, and sets classified_hash to it
+   for articles that already have a topic (their topic is taken as up to date)
+3. Adds an index on content_hash and a partial index on id for articles to classify
+
+The backfill runs in keyset-paginated chunks, each committed on its own, so it can be
+interrupted and re-run; only articles without a content_hash are hashed.
+
+Run this script once to apply the migration.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root / 'backend'))
+
+from sqlalchemy import text
+from shared.database import Database
+from shared.models import FactCheckArticles
+from shared.services.fact_check_articles_service import FactCheckArticlesService, compute_content_hash
+
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def backfill_content_hashes(db: Database) -> int:
+    '''
+    Hash all articles without a content_hash, chunk by chunk in ID order.
+    '''
+    after_id = 0
+    backfilled = 0
+    while True:
+        with db.get_session() as session:
+            rows = (
+                session.query(
+                    FactCheckArticles.id, FactCheckArticles.headline, FactCheckArticles.teaser,
+                    FactCheckArticles.body, FactCheckArticles.topic
+                )
+                .filter(FactCheckArticles.id > after_id, FactCheckArticles.content_hash.is_(None))
+                .order_by(FactCheckArticles.id)
+                .limit(BACKFILL_CHUNK_SIZE)
+                .all()
+            )
+            if not rows:
+                return backfilled
+            updates = {}
+            for article_id, headline, teaser, body, topic in rows:
+                content_hash = compute_content_hash(headline, teaser, body)
+                updates[article_id] = {'content_hash': content_hash}
+                if topic is not None:
+                    updates[article_id]['classified_hash'] = content_hash
+            FactCheckArticlesService(session).bulk_update_articles(updates)
+        after_id = rows[-1].id
+        backfilled += len(rows)
+        print(f"   Hashed {backfilled} articles (up to ID {after_id}).")
+
+
+def migrate_content_hash():
+    """
+    Add, backfill and index the content hash columns.
+    This is a safe migration that can be run multiple times.
+    """
+    # Index builds and the backfill may run longer than the default statement timeout
+    db = Database(statement_timeout_ms=0)
+
+    column_statements = [
+        """
+        ALTER TABLE fact_check_articles
+        ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+        """,
+        """
+        ALTER TABLE fact_check_articles
+        ADD COLUMN IF NOT EXISTS classified_hash VARCHAR(64);
+        """,
+    ]
+    index_statements = [
+        # Articles with the same content
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fact_check_articles_content_hash
+        ON fact_check_articles (content_hash);
+        """,
+        # Articles without a topic or changed since classification
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fact_check_articles_to_classify_id
+        ON fact_check_articles (id)
+        WHERE topic IS NULL OR classified_hash IS DISTINCT FROM content_hash;
+        """,
+        """
+        ANALYZE fact_check_articles;
+        """,
+    ]
+
+    try:
+        with db.engine.connect() as connection:
+            for statement in column_statements:
+                print(f"Executing: {statement.strip()[:60]}...")
+                connection.execute(text(statement))
+                connection.commit()
+
+        print("Backfilling content hashes...")
+        backfilled = backfill_content_hashes(db)
+
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            for statement in index_statements:
+                print(f"Executing: {statement.strip()[:60]}...")
+                connection.execute(text(statement))
+
+        print("\n✅ Migration successful!")
+        print("   Added:   content_hash (VARCHAR(64)), classified_hash (VARCHAR(64))")
+        print(f"   Hashed:  {backfilled} articles")
+        print("   Added:   idx_fact_check_articles_content_hash")
+        print("   Added:   idx_fact_check_articles_to_classify_id")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == '__main__':
+    print("Starting content hash migration...")
+    print("=" * 60)
+    migrate_content_hash()
+    print("=" * 60)
@@ -0,0 +1,63 @@
+"""
+Migration script to add the crawl_states table.
+This script:
+1. Creates the crawl_states table with one row per medium
+
+Link discovery stores the newest published_at and item ID it has seen per medium and
+the ETag/Last-Modified of the feed, so later crawls only request newer posts.
+
+Run this script once to apply the migration.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from backend.shared.database import Database
+
+
+def migrate_crawl_states():
+    """
+    Create the crawl_states table.
+    This is a safe migration that can be run multiple times.
+    """
+    db = Database()
+
+    # SQL statements to add the table
+    migration_statements = [
+        """
+        CREATE TABLE IF NOT EXISTS crawl_states (
+            id SERIAL PRIMARY KEY,
+            medium VARCHAR NOT NULL UNIQUE,
+            last_published_at TIMESTAMP,
+            last_item_id BIGINT,
+            etag VARCHAR,
+            last_modified VARCHAR,
+            last_crawled_at TIMESTAMP
+        );
+        """,
+    ]
+
+    try:
+        with db.engine.connect() as connection:
+            for statement in migration_statements:
+                print(f"Executing: {statement.strip()[:60]}...")
+                connection.execute(text(statement))
+                connection.commit()
+
+        print("\n✅ Migration successful!")
+        print("   Added:   crawl_states (medium, last_published_at, last_item_id, etag, last_modified, last_crawled_at)")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == '__main__':
+    print("Starting crawl state migration...")
+    print("=" * 60)
+    migrate_crawl_states()
+    print("=" * 60)
@@ -0,0 +1,63 @@
+"""
+Migration script to add the data_version table.
+This script:
+1. Creates the single-row data_version table
+2. Inserts its row with version 0
+
+FactCheckArticlesService increments the version on every article write and the API
+uses it to invalidate its response cache.
+
+Run this script once to apply the migration.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from backend.shared.database import Database
+
+
+def migrate_data_version():
+    """
+    Create the data_version table with its single row.
+    This is a safe migration that can be run multiple times.
+    """
+    db = Database()
+
+    # SQL statements to add the table
+    migration_statements = [
+        """
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        );
+        """,
+        """
+        INSERT INTO data_version (id, version) VALUES (1, 0)
+        ON CONFLICT (id) DO NOTHING;
+        """,
+    ]
+
+    try:
+        with db.engine.connect() as connection:
+            for statement in migration_statements:
+                print(f"Executing: {statement.strip()[:60]}...")
+                connection.execute(text(statement))
+                connection.commit()
+
+        print("\n✅ Migration successful!")
+        print("   Added:   data_version (id, version)")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == '__main__':
+    print("Starting data version migration...")
+    print("=" * 60)
+    migrate_data_version()
+    print("=" * 60)
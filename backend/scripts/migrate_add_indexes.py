@@ -0,0 +1,93 @@
+"""
+Migration script to add indexes for the API's filter patterns to the fact_check_articles table.
+This script adds:
+1. A (published_at, id) index covering medium and topic, for listings, keyset pagination,
+   topic counts and publication histograms over date ranges
+2. (topic, published_at, id) and (medium, published_at, id) indexes for filtered listings
+3. A partial index on id for articles without a topic (classification pipeline)
+4. A GIN index on entities for JSONB containment queries
+
+Indexes are built with CREATE INDEX CONCURRENTLY, so the table stays writable while
+the migration runs. All statements are idempotent.
+
+Run this script once to apply the migration.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from backend.shared.database import Database
+
+
+def migrate_indexes():
+    """
+    Create the indexes declared on the FactCheckArticles model on an existing database
+    and refresh the planner statistics afterwards.
+    """
+    # Index builds may run longer than the default statement timeout
+    db = Database(statement_timeout_ms=0)
+
+    # SQL statements to create the indexes
+    migration_statements = [
+        # Listings and keyset pagination, covering medium and topic for aggregations
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fact_check_articles_published_at_id
+        ON fact_check_articles (published_at DESC NULLS LAST, id DESC)
+        INCLUDE (medium, topic);
+        """,
+        # Listings filtered by topic
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fact_check_articles_topic_published_at_id
+        ON fact_check_articles (topic, published_at DESC NULLS LAST, id DESC);
+        """,
+        # Listings filtered by medium
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fact_check_articles_medium_published_at_id
+        ON fact_check_articles (medium, published_at DESC NULLS LAST, id DESC);
+        """,
+        # Articles still waiting for classification
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fact_check_articles_unclassified_id
+        ON fact_check_articles (id)
+        WHERE topic IS NULL;
+        """,
+        # Containment queries on entities
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fact_check_articles_entities
+        ON fact_check_articles USING gin (entities jsonb_path_ops);
+        """,
+        # Refresh planner statistics so the new indexes are considered right away
+        """
+        ANALYZE fact_check_articles;
+        """,
+    ]
+
+    try:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            for statement in migration_statements:
+                print(f"Executing: {statement.strip()[:60]}...")
+                connection.execute(text(statement))
+
+        print("\n✅ Migration successful!")
+        print("   Added:   idx_fact_check_articles_published_at_id")
+        print("   Added:   idx_fact_check_articles_topic_published_at_id")
+        print("   Added:   idx_fact_check_articles_medium_published_at_id")
+        print("   Added:   idx_fact_check_articles_unclassified_id")
+        print("   Added:   idx_fact_check_articles_entities (GIN)")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        print("   A failed CONCURRENTLY build can leave an INVALID index behind, drop it before re-running.")
+        raise
+
+
+if __name__ == '__main__':
+    print("Starting index migration...")
+    print("=" * 60)
+    migrate_indexes()
+    print("=" * 60)
@@ -0,0 +1,93 @@
+"""
+Migration script to add the daily topic count rollup to the database.
+This script:
+1. Creates the topic_count_rollups table (day x medium x topic -> count)
+2. Installs the trigger that keeps it up to date on every article write
+3. Backfills it from the existing articles
+
+Trigger creation and backfill run in one transaction while writes to fact_check_articles
+are blocked, so no article is counted twice or missed.
+
+Run this script once to apply the migration.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from backend.shared.database import Database
+from backend.shared.models import TOPIC_COUNT_ROLLUP_TRIGGER_SQL
+
+
+def migrate_topic_count_rollups():
+    """
+    Create, wire up and backfill the topic_count_rollups table.
+    Safe to re-run: the backfill replaces the rollup contents.
+    """
+    # Index builds and the backfill may run longer than the default statement timeout
+    db = Database(statement_timeout_ms=0)
+
+    # SQL statements to add the rollup
+    migration_statements = [
+        # Block article writes until the trigger is in place and the backfill is done
+        """
+        LOCK TABLE fact_check_articles IN SHARE ROW EXCLUSIVE MODE;
+        """,
+        # Rollup table
+        """
+        CREATE TABLE IF NOT EXISTS topic_count_rollups (
+            id SERIAL PRIMARY KEY,
+            day DATE,
+            medium VARCHAR,
+            topic VARCHAR NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0
+        );
+        """,
+        # Replaced by the unique index below
+        """
+        DROP INDEX IF EXISTS idx_topic_count_rollups_day_medium_topic;
+        """,
+        # Backfill from the existing articles, one row per key
+        """
+        DELETE FROM topic_count_rollups;
+        """,
+        """
+        INSERT INTO topic_count_rollups (day, medium, topic, count)
+        SELECT published_at::date, medium, topic, count(id)
+        FROM fact_check_articles
+        WHERE topic IS NOT NULL
+        GROUP BY published_at::date, medium, topic;
+        """,
+        # One row per key (NULL days and media included), the trigger upserts on it
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_topic_count_rollups_day_medium_topic
+        ON topic_count_rollups (day, medium, topic) NULLS NOT DISTINCT;
+        """,
+        # Trigger keeping the rollup in sync
+        TOPIC_COUNT_ROLLUP_TRIGGER_SQL,
+    ]
+
+    try:
+        with db.engine.begin() as connection:
+            for statement in migration_statements:
+                print(f"Executing: {statement.strip()[:60]}...")
+                connection.execute(text(statement))
+
+        print("\n✅ Migration successful!")
+        print("   Added:   topic_count_rollups (day, medium, topic, count)")
+        print("   Added:   fact_check_articles_topic_rollup trigger")
+        print("   Backfilled rollup from existing articles")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == '__main__':
+    print("Starting topic count rollup migration...")
+    print("=" * 60)
+    migrate_topic_count_rollups()
+    print("=" * 60)
@@ -0,0 +1,77 @@
+"""
+Migration script to record where the topic of an article came from.
+This script:
+1. Adds the topic_source column ('llm' or 'local', NULL if unknown)
+2. With --mark_existing_llm, sets topic_source = 'llm' on all articles that already have a
+   topic. Only do this if classify_topics.py --local never ran on this database, otherwise
+   the local model's own predictions would be taken as LLM labels.
+
+scripts/train_local_topic_classifier.py only trains on topics with topic_source = 'llm'.
+
+Run this script once to apply the migration.
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root / 'backend'))
+
+from sqlalchemy import text
+from shared.database import Database
+
+
+def migrate_topic_source(mark_existing_llm: bool = False):
+    """
+    Add the topic_source column and optionally mark the existing topics as LLM labels.
+    This is a safe migration that can be run multiple times.
+    """
+    # The backfill may run longer than the default statement timeout
+    db = Database(statement_timeout_ms=0)
+
+    statements = [
+        """
+        ALTER TABLE fact_check_articles
+        ADD COLUMN IF NOT EXISTS topic_source VARCHAR;
+        """,
+    ]
+    if mark_existing_llm:
+        statements.append(
+            """
+            UPDATE fact_check_articles SET topic_source = 'llm'
+            WHERE topic IS NOT NULL AND topic_source IS NULL;
+            """
+        )
+
+    try:
+        with db.engine.connect() as connection:
+            for statement in statements:
+                print(f"Executing: {statement.strip()[:60]}...")
+                result = connection.execute(text(statement))
+                connection.commit()
+        print("\n✅ Migration successful!")
+        print("   Added:   topic_source (VARCHAR)")
+        if mark_existing_llm:
+            print(f"   Marked:  {result.rowcount} existing topics as 'llm'")
+        else:
+            print("   Existing topics keep topic_source NULL and are not used for training.")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Add the topic_source column to fact_check_articles.")
+    parser.add_argument(
+        "--mark_existing_llm",
+        action="store_true",
+        help="Mark all existing topics as LLM labels (only if the local classifier never wrote topics)."
+    )
+    args = parser.parse_args()
+
+    print("Starting topic source migration...")
+    print("=" * 60)
+    migrate_topic_source(mark_existing_llm=args.mark_existing_llm)
+    print("=" * 60)
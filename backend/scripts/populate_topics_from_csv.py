@@ -13,7 +13,8 @@ from shared.services.fact_check_articles_service import FactCheckArticlesService
 def populate_topics_from_csv(csv_file: str = "topic_classification_test.csv"):
     """
     Read topics from a CSV file and populate the topic column in the database.
-    Only updates articles that have a topic assigned in the CSV.
+    Only updates articles that have a topic assigned in the CSV. The topic_source is taken
+    from the CSV if it has that column, otherwise the topics are taken as LLM output.
     """
     # Check if CSV file exists
     if not Path(csv_file).exists():
@@ -37,32 +38,25 @@ def populate_topics_from_csv(csv_file: str = "topic_classification_test.csv"):
     
     print(f"Found {len(df_with_topics)} articles with topics to update.")
     
+    if 'topic_source' not in df_with_topics.columns:
+        df_with_topics['topic_source'] = 'llm'
+
+    # Later rows win if an ID appears more than once in the CSV
+    updates = {
+        int(row_id): {'topic': topic, 'topic_source': topic_source if isinstance(topic_source, str) else None}
+        for row_id, topic, topic_source in zip(df_with_topics['id'], df_with_topics['topic'], df_with_topics['topic_source'])
+    }
+    
     db_instance = Database()
-    updated_count = 0
-    error_count = 0
     
     with db_instance.get_session() as db:
         service = FactCheckArticlesService(db)
-        
-        for idx, row in df_with_topics.iterrows():
-            article_id = row['id']
-            topic = row['topic']
-            
-            try:
-                # Update the article with the topic
-                service.update_article(article_id, {'topic': topic})
-                updated_count += 1
-                
-                if (updated_count % 10) == 0:
-                    print(f"  Updated {updated_count} articles...")
-                    
-            except Exception as e:
-                print(f"  Error updating article {article_id}: {e}")
-                error_count += 1
+        updated_count = service.bulk_update_articles(updates)
     
     print(f"\n✅ Successfully updated {updated_count} articles.")
-    if error_count > 0:
-        print(f"❌ Failed to update {error_count} articles.")
+    missing_count = len(updates) - updated_count
+    if missing_count > 0:
+        print(f"❌ {missing_count} article IDs from the CSV were not found in the database.")
 
 
 if __name__ == '__main__':
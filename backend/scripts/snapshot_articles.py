@@ -0,0 +1,44 @@
+import sys, time
+from pathlib import Path
+import argparse
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.snapshots import ArticleSnapshotStore
+
+def snapshot_articles(path: str = None, batch_size: int = 5000):
+    """
+    Materialize the article metadata and classifications into the Parquet snapshot
+    read by the Streamlit app and ad-hoc analyses.
+    """
+    db = Database()
+    store = ArticleSnapshotStore(path)
+    start = time.perf_counter()
+    with db.get_session() as session:
+        written = store.write(session, batch_size=batch_size)
+    print(f"✅ Wrote {written} articles to {store.path} in {time.perf_counter() - start:.1f}s.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Write a Parquet snapshot of the articles, partitioned by month and medium."
+    )
+    parser.add_argument(
+        "--path",
+        type=str,
+        default=None,
+        help="Snapshot directory (default: SNAPSHOT_DIR or backend/.snapshots/fact_check_articles)."
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=5000,
+        help="Articles read from the database and written per batch (default: 5000)."
+    )
+
+    args = parser.parse_args()
+    snapshot_articles(path=args.path, batch_size=args.batch_size)
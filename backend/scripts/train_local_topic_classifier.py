@@ -0,0 +1,158 @@
+import sys, json, time
+from pathlib import Path
+from typing import List, Optional, Tuple
+import argparse
+
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+# Add the Python project root to sys.path
+python_project_root = Path(__file__).resolve().parent.parent # Points to /backend/
+if str(python_project_root) not in sys.path:
+    sys.path.insert(0, str(python_project_root))
+
+from shared.database import Database
+from shared.schemas import TOPIC_LABELS
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+from shared.agents.local_topic_classifier import LocalTopicClassifier, article_text, DEFAULT_MODEL_PATH
+
+
+def load_labelled_articles(csv_files: List[str], use_database: bool = True) -> Tuple[List[str], List[str]]:
+    """
+    Collect (text, topic) pairs from the topic column of the database and from CSV files with
+    headline, kicker, teaser and topic columns (e.g. classified_articles.csv). Articles are
+    deduplicated by URL, the database wins since it also has the body.
+
+    Only topics the LLM assigned are used (topic_source 'llm'; CSVs without a topic_source column
+    are taken as LLM output), so the classifier never learns from or is scored against its own
+    predictions written by classify_topics.py --local.
+    """
+    examples = {}
+    if use_database:
+        with Database().get_session() as session:
+            service = FactCheckArticlesService(session)
+            for topic in TOPIC_LABELS:
+                for article in service.iter_articles(topic=topic, fields=['url', 'kicker', 'headline', 'teaser', 'body', 'topic', 'topic_source']):
+                    if article.topic_source == 'llm':
+                        examples[article.url] = (article_text(article), topic)
+    for csv_file in csv_files:
+        df = pd.read_csv(csv_file)
+        df = df[df['topic'].isin(TOPIC_LABELS)]
+        if 'topic_source' in df.columns:
+            df = df[df['topic_source'] == 'llm']
+        df = df.astype(object).where(lambda frame: frame.notna(), None)
+        for row in df.itertuples():
+            if row.url not in examples:
+                examples[row.url] = (article_text(row), row.topic)
+    texts = [text for text, _ in examples.values()]
+    labels = [topic for _, topic in examples.values()]
+    return texts, labels
+
+
+def print_report(report: dict, threshold: float):
+    print(f"Held-out articles: {report['articles']}, overall agreement with the LLM: {report['agreement']:.1%}")
+    print(f"Local throughput: {report['articles_per_second']:.0f} articles/s")
+    print(f"{'threshold':>10} {'coverage':>9} {'agreement':>10}")
+    for row in report['thresholds']:
+        agreement = f"{row['agreement']:.1%}" if row['agreement'] is not None else '-'
+        marker = '  <- chosen' if row['threshold'] == threshold else ''
+        print(f"{row['threshold']:>10.3f} {row['coverage']:>9.1%} {agreement:>10}{marker}")
+
+
+def train_local_topic_classifier_cli(
+    csv_files: List[str],
+    use_database: bool = True,
+    output: Optional[str] = None,
+    test_size: float = 0.2,
+    min_agreement: float = 0.95,
+    report_json: Optional[str] = None
+):
+    """
+    Retrain the local topic classifier from the LLM-assigned topics, report its agreement with
+    the LLM and throughput on held-out articles, and save it for classify_topics.py --local.
+    """
+    texts, labels = load_labelled_articles(csv_files, use_database)
+    print(f"Loaded {len(texts)} labelled articles: {pd.Series(labels).value_counts().to_dict()}")
+    if len(set(labels)) < 2:
+        print("❌ Need labelled articles of at least two topics to train.")
+        return
+
+    try:
+        train_texts, test_texts, train_labels, test_labels = train_test_split(
+            texts, labels, test_size=test_size, random_state=0, stratify=labels
+        )
+    except ValueError:
+        # Too few articles of some topic for a stratified split
+        train_texts, test_texts, train_labels, test_labels = train_test_split(
+            texts, labels, test_size=test_size, random_state=0
+        )
+    start = time.perf_counter()
+    classifier = LocalTopicClassifier.train(train_texts, train_labels)
+    print(f"Trained on {len(train_texts)} articles in {time.perf_counter() - start:.1f}s.")
+
+    threshold = classifier.choose_threshold(test_texts, test_labels, min_agreement=min_agreement)
+    report = classifier.evaluate(test_texts, test_labels)
+    print_report(report, threshold)
+
+    # Refit on all labelled articles, keeping the threshold picked on the held-out split
+    final = LocalTopicClassifier.train(texts, labels, threshold=threshold)
+    final.metadata['holdout_report'] = report
+    final.metadata['min_agreement'] = min_agreement
+    final.save(output)
+    print(f"\n✅ Saved the local classifier (threshold {threshold:.3f}) to {output or DEFAULT_MODEL_PATH}.")
+    if report_json:
+        with open(report_json, 'w') as f:
+            json.dump(final.metadata, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Retrain the local (TF-IDF + logistic regression) topic classifier from LLM-labelled articles."
+    )
+    parser.add_argument(
+        "--csv",
+        dest="csv_files",
+        action="append",
+        default=[],
+        help="CSV file with headline, kicker, teaser, url and topic columns, e.g. classified_articles.csv (repeatable)."
+    )
+    parser.add_argument(
+        "--no-database",
+        dest="use_database",
+        action="store_false",
+        help="Only train on the CSV files, not on the topics stored in the database."
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help=f"Where to save the model (default: {DEFAULT_MODEL_PATH})."
+    )
+    parser.add_argument(
+        "--test_size",
+        type=float,
+        default=0.2,
+        help="Share of the labelled articles held out for the agreement report (default: 0.2)."
+    )
+    parser.add_argument(
+        "--min_agreement",
+        type=float,
+        default=0.95,
+        help="Agreement with the LLM the locally labelled articles must reach on the held-out split (default: 0.95)."
+    )
+    parser.add_argument(
+        "--report_json",
+        type=str,
+        default=None,
+        help="Optional: Also write the training metadata and agreement report to this JSON file."
+    )
+
+    args = parser.parse_args()
+    train_local_topic_classifier_cli(
+        csv_files=args.csv_files,
+        use_database=args.use_database,
+        output=args.output,
+        test_size=args.test_size,
+        min_agreement=args.min_agreement,
+        report_json=args.report_json
+    )
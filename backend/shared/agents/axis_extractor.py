@@ -0,0 +1,13 @@
+from shared.schemas import ArticleAxes
+from shared.agents.topic_classifier import TopicClassifierAgent
+
+
+class AxisExtractorAgent(TopicClassifierAgent):
+    '''
+    A PydanticAI agent that reads an article once and extracts all four axes in one
+    structured output: the Axis-1 topic label, the fact-checked claim, the instrumentalizer
+    and the entities of the claim. Caching, retries and run_many() work as for the
+    TopicClassifierAgent.
+    '''
+    output_type = ArticleAxes
+    system_prompt_file = 'shared/system_prompts/system_prompt_axis_extractor.md'
@@ -0,0 +1,180 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+from pydantic_ai.exceptions import ModelHTTPError
+
+
+InputT = TypeVar('InputT')
+OutputT = TypeVar('OutputT')
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class BatchResult(Generic[InputT, OutputT]):
+    '''
+    The outcome of one item of a batch. Exactly one of output and error is set.
+    '''
+    index: int
+    input: InputT
+    output: Optional[OutputT] = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class TokenBucket():
+    '''
+    Async token-bucket rate limiter. Refills at `rate` tokens per second up to `capacity`.
+    '''
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.capacity = capacity if capacity else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+
+    async def acquire(self, tokens: float = 1.0):
+        '''
+        Wait until `tokens` tokens are available and take them.
+        '''
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+# One bucket per model name, shared by every runner in the process so that
+# several agents talking to the same model respect one common limit.
+_buckets: Dict[str, TokenBucket] = {}
+
+
+def get_token_bucket(model_name: str, requests_per_minute: float) -> TokenBucket:
+    '''
+    Return the process-wide token bucket for a model, creating it on first use.
+    '''
+    bucket = _buckets.get(model_name)
+    rate = requests_per_minute / 60.0
+    if bucket is None or bucket.rate != rate:
+        bucket = TokenBucket(rate=rate)
+        _buckets[model_name] = bucket
+    return bucket
+
+
+def is_retryable(error: BaseException) -> bool:
+    '''
+    Rate limits, server errors and transport errors are retried, everything else
+    (validation errors, auth errors, bad requests) fails the item right away.
+    '''
+    if isinstance(error, ModelHTTPError):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (asyncio.TimeoutError, ConnectionError))
+
+
+class BatchRunner():
+    '''
+    Runs an async function over many inputs with bounded concurrency, per-model rate
+    limiting and retries with jittered exponential backoff. Results are returned in
+    input order and every item captures either its output or its exception, so one
+    failing article never aborts the batch.
+    '''
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        requests_per_minute: Optional[float] = None,
+        model_name: Optional[str] = None,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_on: Callable[[BaseException], bool] = is_retryable
+    ):
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.bucket = get_token_bucket(model_name or 'default', requests_per_minute) if requests_per_minute else None
+
+
+    def _backoff(self, attempt: int) -> float:
+        '''
+        Full-jitter exponential backoff: uniform in [0, min(max_delay, base_delay * 2^attempt)].
+        '''
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+    async def _run_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        func: Callable[[InputT], Awaitable[OutputT]],
+        index: int,
+        item: InputT,
+        on_result: Optional[Callable[[BatchResult], Any]]
+    ) -> BatchResult:
+        result = BatchResult(index=index, input=item)
+        async with semaphore:
+            while True:
+                result.attempts += 1
+                if self.bucket:
+                    await self.bucket.acquire()
+                try:
+                    result.output = await func(item)
+                    result.error = None
+                    break
+                except Exception as e:
+                    result.error = e
+                    if result.attempts > self.max_retries or not self.retry_on(e):
+                        break
+                await asyncio.sleep(self._backoff(result.attempts - 1))
+        if on_result:
+            on_result(result)
+        return result
+
+
+    async def run(
+        self,
+        func: Callable[[InputT], Awaitable[OutputT]],
+        items: Sequence[InputT],
+        on_result: Optional[Callable[[BatchResult], Any]] = None,
+        lookup: Optional[Callable[[InputT], Optional[OutputT]]] = None
+    ) -> List[BatchResult]:
+        '''
+        Apply func to every item and return one BatchResult per item, in input order.
+        on_result is called as soon as each item finishes (useful for progress output).
+        If lookup is given, items for which it returns an output (e.g. cache hits) are
+        resolved right away without a slot, a rate-limit token or a call to func.
+        '''
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: List[Optional[BatchResult]] = [None] * len(items)
+        pending = []
+        for index, item in enumerate(items):
+            output = lookup(item) if lookup else None
+            if output is not None:
+                results[index] = BatchResult(index=index, input=item, output=output)
+                if on_result:
+                    on_result(results[index])
+            else:
+                pending.append(self._run_one(semaphore, func, index, item, on_result))
+        for result in await asyncio.gather(*pending):
+            results[result.index] = result
+        return results
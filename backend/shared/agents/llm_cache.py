@@ -0,0 +1,162 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+
+OutputT = TypeVar('OutputT', bound=BaseModel)
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent.parent / '.llm_cache.sqlite'
+
+
+class LLMResultCache():
+    '''
+    Durable cache for structured LLM outputs, stored in a local SQLite file.
+
+    Entries are keyed by a hash of the model name, the system prompt and the serialized
+    input, so changing any of the three invalidates the entry. Entries older than
+    ttl_seconds are ignored and purged, and once more than max_entries are stored the
+    least recently used ones are evicted. With bypass=True lookups always miss but fresh
+    results are still written, which refreshes the cache without reading stale data.
+    '''
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        bypass: bool = False
+    ):
+        self.path = path or os.getenv('LLM_CACHE_PATH') or str(DEFAULT_CACHE_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._init_schema()
+
+
+    def _init_schema(self):
+        with self.lock, self.connection:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute(
+                '''
+                CREATE TABLE IF NOT EXISTS llm_results (
+                    key TEXT PRIMARY KEY,
+                    model_name TEXT,
+                    output_json TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                '''
+            )
+            self.connection.execute('CREATE INDEX IF NOT EXISTS idx_llm_results_accessed_at ON llm_results (accessed_at)')
+
+
+    @staticmethod
+    def make_key(model_name: str, system_prompt: str, input_json: str) -> str:
+        '''
+        Hash the three inputs that determine an LLM answer. Fields are length-prefixed so
+        that shifting text between them can never produce the same key.
+        '''
+        digest = hashlib.sha256()
+        for part in (model_name or '', system_prompt or '', input_json):
+            encoded = part.encode('utf-8')
+            digest.update(str(len(encoded)).encode('ascii') + b':' + encoded)
+        return digest.hexdigest()
+
+
+    def get(self, key: str, output_type: Type[OutputT]) -> Optional[OutputT]:
+        '''
+        Return the cached output for key, or None on a miss, an expired entry or in bypass mode.
+        '''
+        if self.bypass:
+            self.misses += 1
+            return None
+        now = time.time()
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                'SELECT output_json, created_at FROM llm_results WHERE key = ?', (key,)
+            ).fetchone()
+            if row and self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                self.connection.execute('DELETE FROM llm_results WHERE key = ?', (key,))
+                self.evictions += 1
+                row = None
+            if row:
+                self.connection.execute('UPDATE llm_results SET accessed_at = ? WHERE key = ?', (now, key))
+        if not row:
+            self.misses += 1
+            return None
+        try:
+            output = output_type.model_validate_json(row[0])
+        except ValueError:
+            # The output schema changed since the entry was written, treat it as a miss
+            self.misses += 1
+            return None
+        self.hits += 1
+        return output
+
+
+    def set(self, key: str, output: BaseModel, model_name: Optional[str] = None):
+        '''
+        Store an output and evict the least recently used entries beyond max_entries.
+        '''
+        now = time.time()
+        with self.lock, self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO llm_results (key, model_name, output_json, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                (key, model_name, output.model_dump_json(), now, now)
+            )
+            self.writes += 1
+            if self.max_entries is not None:
+                cursor = self.connection.execute(
+                    '''
+                    DELETE FROM llm_results WHERE key IN (
+                        SELECT key FROM llm_results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                    ''',
+                    (self.max_entries,)
+                )
+                self.evictions += max(cursor.rowcount, 0)
+
+
+    def purge_expired(self) -> int:
+        '''
+        Delete all entries older than ttl_seconds. Returns the number of deleted entries.
+        '''
+        if self.ttl_seconds is None:
+            return 0
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                'DELETE FROM llm_results WHERE created_at < ?', (time.time() - self.ttl_seconds,)
+            )
+        self.evictions += max(cursor.rowcount, 0)
+        return cursor.rowcount
+
+
+    def clear(self):
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM llm_results')
+
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+    def close(self):
+        self.connection.close()
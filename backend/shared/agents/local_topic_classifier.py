@@ -0,0 +1,150 @@
+import time
+import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import FeatureUnion, Pipeline
+
+from shared.schemas import FactCheckArticleContent, TOPIC_LABELS
+
+
+DEFAULT_MODEL_PATH = Path(__file__).resolve().parent.parent.parent / '.models' / 'local_topic_classifier.joblib'
+# Confidence thresholds the agreement report is computed for
+REPORT_THRESHOLDS = (0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+
+
+def article_text(article: Any, max_body_chars: int = 2000) -> str:
+    '''
+    The text the local classifier sees: kicker, headline, teaser and the start of the body
+    (FactCheckArticleContent, schema or ORM object; body blocks as models or dicts).
+    '''
+    parts = [getattr(article, 'kicker', None), article.headline, article.teaser]
+    body_length = 0
+    for block in getattr(article, 'body', None) or []:
+        block_text = block.text if hasattr(block, 'text') else block.get('text', '')
+        if body_length >= max_body_chars:
+            break
+        parts.append(block_text)
+        body_length += len(block_text)
+    return '\n'.join(part for part in parts if part)
+
+
+class LocalTopicClassifier():
+    '''
+    Predicts the Axis-1 topic on the CPU with a logistic regression over word and character
+    TF-IDF features, trained on topics the LLM already assigned.
+
+    predict() labels a whole batch with one vectorized call and returns each label with its
+    probability as confidence. Articles at or above threshold can take the local label; the
+    others should go to the TopicClassifierAgent. The threshold is picked on held-out
+    articles for a target agreement with the LLM (see choose_threshold).
+    '''
+    def __init__(self, pipeline: Pipeline, threshold: float = 0.7, metadata: Optional[Dict[str, Any]] = None):
+        self.pipeline = pipeline
+        self.threshold = threshold
+        self.metadata = metadata or {}
+
+
+    @classmethod
+    def train(cls, texts: Sequence[str], labels: Sequence[str], threshold: float = 0.7) -> 'LocalTopicClassifier':
+        unknown = sorted(set(labels) - set(TOPIC_LABELS))
+        if unknown:
+            raise ValueError(f'Unknown topic labels in the training data: {unknown}')
+        pipeline = Pipeline([
+            ('features', FeatureUnion([
+                ('words', TfidfVectorizer(ngram_range=(1, 2), min_df=1, sublinear_tf=True, lowercase=True)),
+                # Character n-grams cope with German compounds and inflection
+                ('chars', TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 5), min_df=2, sublinear_tf=True, max_features=100000)),
+            ])),
+            ('classifier', LogisticRegression(C=10.0, max_iter=2000, class_weight='balanced')),
+        ])
+        pipeline.fit(list(texts), list(labels))
+        metadata = {
+            'trained_at': datetime.datetime.now(datetime.UTC).isoformat(),
+            'num_training_articles': len(texts),
+            'labels': sorted(set(labels)),
+        }
+        return cls(pipeline, threshold=threshold, metadata=metadata)
+
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'LocalTopicClassifier':
+        state = joblib.load(path or DEFAULT_MODEL_PATH)
+        return cls(state['pipeline'], threshold=state['threshold'], metadata=state['metadata'])
+
+
+    def save(self, path: Optional[str] = None):
+        path = Path(path) if path else DEFAULT_MODEL_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump({'pipeline': self.pipeline, 'threshold': self.threshold, 'metadata': self.metadata}, path)
+
+
+    def predict_texts(self, texts: Sequence[str]) -> List[Tuple[str, float]]:
+        if not texts:
+            return []
+        probabilities = self.pipeline.predict_proba(list(texts))
+        classes = self.pipeline.classes_
+        best = probabilities.argmax(axis=1)
+        return [(classes[index], float(probabilities[row, index])) for row, index in enumerate(best)]
+
+
+    def predict(self, articles: Sequence[FactCheckArticleContent]) -> List[Tuple[str, float]]:
+        '''
+        Return (topic label, confidence) for every article, in input order.
+        '''
+        return self.predict_texts([article_text(article) for article in articles])
+
+
+    def is_confident(self, confidence: float) -> bool:
+        return confidence >= self.threshold
+
+
+    def evaluate(self, texts: Sequence[str], labels: Sequence[str]) -> Dict[str, Any]:
+        '''
+        Agreement with the given (LLM) labels overall and per confidence threshold, i.e. how
+        many articles the local classifier would take and how often it agrees on those,
+        plus the local throughput.
+        '''
+        start = time.perf_counter()
+        predictions = self.predict_texts(texts)
+        seconds = time.perf_counter() - start
+        predicted = np.array([label for label, _ in predictions])
+        confidences = np.array([confidence for _, confidence in predictions])
+        agrees = predicted == np.array(labels)
+        thresholds = []
+        for threshold in sorted(set(REPORT_THRESHOLDS) | {self.threshold}):
+            covered = confidences >= threshold
+            thresholds.append({
+                'threshold': threshold,
+                'coverage': float(covered.mean()),
+                'agreement': float(agrees[covered].mean()) if covered.any() else None,
+            })
+        return {
+            'articles': len(texts),
+            'agreement': float(agrees.mean()) if len(texts) else None,
+            'thresholds': thresholds,
+            'articles_per_second': len(texts) / seconds if seconds > 0 else None,
+        }
+
+
+    def choose_threshold(self, texts: Sequence[str], labels: Sequence[str], min_agreement: float = 0.95) -> float:
+        '''
+        Set threshold to the lowest confidence at which the held-out articles the local
+        classifier would take agree with the LLM labels at least min_agreement of the time.
+        '''
+        predictions = self.predict_texts(texts)
+        labels = list(labels)
+        # Walk down from the most confident prediction, keeping the lowest confidence that still meets the target
+        order = sorted(range(len(predictions)), key=lambda index: -predictions[index][1])
+        agreed = 0
+        threshold = 1.0
+        for count, index in enumerate(order, start=1):
+            agreed += predictions[index][0] == labels[index]
+            if agreed / count >= min_agreement:
+                threshold = predictions[index][1]
+        self.threshold = threshold
+        return threshold
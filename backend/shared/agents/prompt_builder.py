@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from shared.schemas import FactCheckArticleContent
+from shared.agents.token_counter import TokenCounter
+
+
+# Replaces the Input section of the system prompts, which describes the JSON of model_dump_json()
+INPUT_FORMAT_SECTION = '''# Input
+
+Du erhältst den Artikel als Klartext: zuerst Dachzeile, Überschrift und Teaser, jeweils mit ihrer Bezeichnung, danach den Anfang des Artikeltextes. Zwischenüberschriften sind mit "## " markiert. Lange Artikel sind gekürzt, ein gekürzter Absatz endet mit "…".
+'''
+
+HEADER_LABELS = (('kicker', 'Dachzeile'), ('headline', 'Überschrift'), ('teaser', 'Teaser'))
+
+
+@dataclass
+class ArticlePrompt():
+    '''
+    A built article prompt with its token count and the count of the full JSON it replaces.
+    '''
+    text: str
+    tokens: int
+    full_tokens: int
+    truncated: bool = False
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(0, self.full_tokens - self.tokens)
+
+
+class ArticlePromptBuilder():
+    '''
+    Turns a FactCheckArticleContent into compact plain text within a token budget, instead of
+    the JSON-escaped, unbounded body block list of model_dump_json().
+
+    Kicker, headline and teaser are always kept. Of the body, the subheadlines are kept (using
+    at most half of the remaining budget) and paragraphs are added in order until max_tokens is
+    reached; the paragraph that crosses the budget is cut at a word boundary if at least
+    min_paragraph_tokens of it fit. Blocks keep their order in the article.
+    '''
+    def __init__(self, max_tokens: int = 600, token_counter: Optional[TokenCounter] = None, min_paragraph_tokens: int = 20):
+        self.max_tokens = max_tokens
+        self.token_counter = token_counter or TokenCounter()
+        self.min_paragraph_tokens = min_paragraph_tokens
+
+
+    def with_input_format(self, system_prompt: str) -> str:
+        '''
+        Replace the Input section of a system prompt (or append one) with the plain-text format.
+        '''
+        position = system_prompt.find('# Input')
+        if position == -1:
+            return f'{system_prompt.rstrip()}\n\n{INPUT_FORMAT_SECTION}'
+        return system_prompt[:position] + INPUT_FORMAT_SECTION
+
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        '''
+        Cut text at a word boundary so that it stays within max_tokens, marked with an ellipsis.
+        '''
+        tokens = self.token_counter.count(text)
+        length = int(len(text) * max_tokens / tokens)
+        while length > 0:
+            cut = text[:length].rsplit(' ', 1)[0] + ' …'
+            if self.token_counter.count(cut) <= max_tokens:
+                return cut
+            length = int(length * 0.9)
+        return ''
+
+
+    def build(self, article_content: FactCheckArticleContent) -> ArticlePrompt:
+        header = '\n'.join(
+            f'{label}: {getattr(article_content, field).strip()}'
+            for field, label in HEADER_LABELS
+            if getattr(article_content, field) and getattr(article_content, field).strip()
+        )
+        used = self.token_counter.count(header)
+
+        kept: Dict[int, str] = {}
+        subheadline_budget = max(0, self.max_tokens - used) // 2
+        subheadline_tokens = 0
+        for index, block in enumerate(article_content.body):
+            if block.type == 'subheadline' and block.text.strip():
+                text = f'## {block.text.strip()}'
+                tokens = self.token_counter.count(text) + 1
+                if subheadline_tokens + tokens <= subheadline_budget:
+                    kept[index] = text
+                    subheadline_tokens += tokens
+        used += subheadline_tokens
+
+        truncated = False
+        for index, block in enumerate(article_content.body):
+            if block.type != 'paragraph' or not block.text.strip():
+                continue
+            text = block.text.strip()
+            tokens = self.token_counter.count(text) + 1
+            if used + tokens <= self.max_tokens:
+                kept[index] = text
+                used += tokens
+                continue
+            truncated = True
+            remaining = self.max_tokens - used - 1
+            if remaining >= self.min_paragraph_tokens:
+                kept[index] = self._truncate(text, remaining)
+            break
+
+        parts = [header] + [kept[index] for index in sorted(kept)]
+        text = '\n\n'.join(part for part in parts if part)
+        return ArticlePrompt(
+            text=text,
+            tokens=self.token_counter.count(text),
+            full_tokens=self.token_counter.count(article_content.model_dump_json()),
+            truncated=truncated
+        )
@@ -0,0 +1,47 @@
+import math
+import threading
+from typing import Any, Optional
+
+
+# Characters per token of German news text for the common BPE tokenizers, used when no encoding is available
+DEFAULT_CHARS_PER_TOKEN = 3.5
+
+
+class TokenCounter():
+    '''
+    Counts the tokens of prompt texts to size LLM requests against a token budget.
+
+    Uses a tiktoken encoding if tiktoken is installed and its encoding file can be loaded,
+    otherwise estimates the count from the text length. Either way the count approximates
+    the tokenizer of the OpenRouter model, which is close enough for budgeting. The encoding
+    is loaded on first use.
+    '''
+    def __init__(self, encoding_name: Optional[str] = 'cl100k_base', chars_per_token: float = DEFAULT_CHARS_PER_TOKEN):
+        self.encoding_name = encoding_name
+        self.chars_per_token = chars_per_token
+        self.encoding: Optional[Any] = None
+        self.loaded = False
+        self.lock = threading.Lock()
+
+
+    def _load(self) -> Optional[Any]:
+        with self.lock:
+            if not self.loaded:
+                self.loaded = True
+                if self.encoding_name:
+                    try:
+                        import tiktoken
+                        self.encoding = tiktoken.get_encoding(self.encoding_name)
+                    except Exception:
+                        # tiktoken is not installed or cannot download the encoding, fall back to the estimate
+                        self.encoding = None
+        return self.encoding
+
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        encoding = self._load()
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / self.chars_per_token)
@@ -1,58 +1,336 @@
 import os
-from typing import Optional
+import json
+import logging
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+from pydantic import BaseModel, create_model
 from pydantic_ai.agent import Agent
+from pydantic_ai.models import Model
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openrouter import OpenRouterProvider
 
 from shared.schemas import FactCheckArticleContent, Topic
+from shared.agents.batch_runner import BatchRunner, BatchResult
+from shared.agents.llm_cache import LLMResultCache
+from shared.agents.token_counter import TokenCounter
+from shared.agents.prompt_builder import ArticlePromptBuilder
+
+
+logger = logging.getLogger(__name__)
+
+
+# Tokens a packed request spends per article on top of the article itself (the article_id wrapper)
+PACKED_ARTICLE_OVERHEAD_TOKENS = 12
+
+# The user prompt of an article and the article tokens the prompt builder saved on it
+ArticleInput = Tuple[str, int]
+# An article waiting for a packed request: its index in the input, the article and its built input
+PackItem = Tuple[int, FactCheckArticleContent, ArticleInput]
+
+
+@lru_cache(maxsize=None)
+def packed_output_type(output_type: Type[BaseModel]) -> Type[BaseModel]:
+    '''
+    The output schema of a packed request: a list of output_type results, each keyed by article_id.
+    '''
+    item_type = create_model(f'Packed{output_type.__name__}', __base__=output_type, article_id=(int, ...))
+    return create_model(f'Packed{output_type.__name__}Results', results=(List[item_type], ...))
 
 
 class TopicClassifierAgent():
     '''
     An instance of this class represents a PydanticAI agent that takes an article
     and classifies it into one of the Axis-1 supervised topic labels.
+    Subclasses can change the output schema and the default system prompt.
+
+    run_many_packed() sends several articles per request, so the system prompt is paid once
+    per pack instead of once per article. With a prompt_builder, articles are sent as compact
+    plain text within its token budget instead of as JSON. usage counts the requests and tokens
+    actually sent and the article tokens the prompt builder saved.
     '''
+    output_type = Topic
+    system_prompt_file = 'shared/system_prompts/system_prompt_topic_classifier.md'
+    packed_prompt_file = 'shared/system_prompts/system_prompt_packed.md'
+
     def __init__(
         self,
         model_name: str,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        model: Optional[Model] = None,
+        cache: Optional[LLMResultCache] = None,
+        prompt_builder: Optional[ArticlePromptBuilder] = None
     ):
         self.model_name = model_name if model_name else 'mistralai/devstral-2512:free'
         self.system_prompt = system_prompt if system_prompt else self._load_system_prompt()
+        self.prompt_builder = prompt_builder
+        if prompt_builder:
+            self.system_prompt = prompt_builder.with_input_format(self.system_prompt)
+        self.model = model
+        self.cache = cache
+        self.token_counter = prompt_builder.token_counter if prompt_builder else TokenCounter()
+        self.usage = {
+            'requests': 0, 'input_tokens': 0, 'output_tokens': 0, 'packed_requests': 0, 'fallback_articles': 0,
+            'prompt_tokens_saved': 0
+        }
         self.agent = self._create_agent()
+        self.packed_system_prompt: Optional[str] = None
+        self.packed_agent: Optional[Agent] = None
 
 
     def _load_system_prompt(self) -> str:
         '''
         Load the system prompt from the system_prompts directory.
         '''
-        with open('shared/system_prompts/system_prompt_topic_classifier.md', 'r') as f:
+        with open(self.system_prompt_file, 'r') as f:
             return f.read()
 
 
-    def _create_agent(self) -> Agent:
+    def _create_agent(self, system_prompt: Optional[str] = None, output_type: Optional[type] = None) -> Agent:
         '''
-        Create a PydanticAI agent with the given system prompt and model.
+        Create a PydanticAI agent with the given system prompt and model (by default the
+        single-article prompt and output type).
+        If no model instance was passed in, an OpenRouter model is created from model_name.
         '''
-        provider = OpenRouterProvider(
-            api_key=os.getenv('OPENROUTER_API_KEY')
-        )
-        model = OpenAIChatModel(
-            self.model_name,
-            provider=provider
-        )
+        model = self.model
+        if model is None:
+            provider = OpenRouterProvider(
+                api_key=os.getenv('OPENROUTER_API_KEY')
+            )
+            model = OpenAIChatModel(
+                self.model_name,
+                provider=provider
+            )
         agent = Agent(
             model=model,
-            system_prompt=self.system_prompt,
-            output_type=Topic
+            system_prompt=system_prompt or self.system_prompt,
+            output_type=output_type or self.output_type
         )
         return agent
+
+
+    def _get_packed_agent(self) -> Agent:
+        '''
+        The agent for packed requests: the system prompt plus the instructions for a list of
+        articles, answering with packed_output_type(output_type).
+        '''
+        if self.packed_agent is None:
+            with open(self.packed_prompt_file, 'r') as f:
+                self.packed_system_prompt = f'{self.system_prompt}\n\n{f.read()}'
+            self.packed_agent = self._create_agent(
+                system_prompt=self.packed_system_prompt,
+                output_type=packed_output_type(self.output_type)
+            )
+        return self.packed_agent
+
+
+    def _record_usage(self, response: Any):
+        usage = response.usage
+        self.usage['requests'] += usage.requests
+        self.usage['input_tokens'] += usage.input_tokens
+        self.usage['output_tokens'] += usage.output_tokens
         
 
+    def _article_input(self, article_content: FactCheckArticleContent) -> ArticleInput:
+        '''
+        The user prompt for one article and the article tokens the prompt builder saved on it:
+        the prompt builder's plain text if there is one, else the article as JSON (nothing saved).
+        '''
+        if not self.prompt_builder:
+            return article_content.model_dump_json(), 0
+        prompt = self.prompt_builder.build(article_content)
+        logger.debug(
+            'Article prompt %r: %d tokens instead of %d (%d saved%s)',
+            (article_content.headline or '')[:60], prompt.tokens, prompt.full_tokens, prompt.saved_tokens,
+            ', truncated' if prompt.truncated else ''
+        )
+        return prompt.text, prompt.saved_tokens
+
+
+    def _cache_key(self, article_content: FactCheckArticleContent, article_text: Optional[str] = None) -> str:
+        if article_text is None:
+            article_text, _ = self._article_input(article_content)
+        return LLMResultCache.make_key(self.model_name, self.system_prompt, article_text)
+
+
+    def _get_cached(self, article_content: FactCheckArticleContent, article_text: Optional[str] = None) -> Optional[Topic]:
+        '''
+        Return the cached output for an article, or None if there is no cache or no entry.
+        '''
+        if not self.cache:
+            return None
+        return self.cache.get(self._cache_key(article_content, article_text), self.output_type)
+
+
+    async def _run_uncached(self, article_content: FactCheckArticleContent, article_input: Optional[ArticleInput] = None) -> Topic:
+        '''
+        Sends the article to the model and stores the output in the cache. The saved prompt
+        tokens are counted once the request succeeded, so a retried request counts them once.
+        '''
+        article_text, saved_tokens = article_input if article_input else self._article_input(article_content)
+        response = await self.agent.run(article_text)
+        self._record_usage(response)
+        self.usage['prompt_tokens_saved'] += saved_tokens
+        if self.cache:
+            self.cache.set(self._cache_key(article_content, article_text), response.output, model_name=self.model_name)
+        return response.output
+
+
     async def run(self, article_content: FactCheckArticleContent) -> Topic:
         '''
         Runs the agent on one article and returns the classified topic.
+        Served from the cache if the same article was already sent with the same model and prompt.
         '''
-        response = await self.agent.run(article_content.model_dump_json())
-        return response.output
+        cached = self._get_cached(article_content)
+        if cached is not None:
+            return cached
+        return await self._run_uncached(article_content)
+
+
+    async def run_many(
+        self,
+        article_contents: Sequence[FactCheckArticleContent],
+        max_concurrency: int = 5,
+        requests_per_minute: Optional[float] = None,
+        max_retries: int = 4,
+        on_result: Optional[Callable[[BatchResult], Any]] = None
+    ) -> List[BatchResult]:
+        '''
+        Runs the agent on many articles concurrently. Returns one BatchResult per article
+        in input order, holding either the Topic or the exception raised for it.
+        Cached articles are resolved up front and do not count against the rate limit.
+        '''
+        runner = BatchRunner(
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            model_name=self.model_name,
+            max_retries=max_retries
+        )
+        return await runner.run(
+            self._run_uncached,
+            article_contents,
+            on_result=on_result,
+            lookup=self._get_cached
+        )
+
+
+    def _make_packs(
+        self,
+        items: Sequence[PackItem],
+        max_request_tokens: int,
+        max_pack_size: int
+    ) -> List[List[PackItem]]:
+        '''
+        Group (index, article, input) items in input order into packs that fit the token budget
+        of one request, counting the packed system prompt once. An article that does not fit any
+        pack on its own becomes a pack of one and is sent as a single-article request.
+        '''
+        self._get_packed_agent()
+        article_budget = max_request_tokens - self.token_counter.count(self.packed_system_prompt)
+        packs, pack, pack_tokens = [], [], 0
+        for item in items:
+            article_text, _ = item[2]
+            tokens = self.token_counter.count(article_text) + PACKED_ARTICLE_OVERHEAD_TOKENS
+            if pack and (pack_tokens + tokens > article_budget or len(pack) >= max_pack_size):
+                packs.append(pack)
+                pack, pack_tokens = [], 0
+            pack.append(item)
+            pack_tokens += tokens
+        if pack:
+            packs.append(pack)
+        return packs
+
+
+    async def _run_pack(self, pack: Sequence[PackItem]) -> Dict[int, Any]:
+        '''
+        Send a pack of (index, article, input) items in one request and return the outputs by
+        index. Only articles that received exactly one result are returned, and only their saved
+        prompt tokens are counted; the caller sends the others on their own. A pack of one is
+        sent as a normal single-article request.
+        '''
+        if len(pack) == 1:
+            index, article_content, article_input = pack[0]
+            return {index: await self._run_uncached(article_content, article_input)}
+        items = {index: (article_content, article_input) for index, article_content, article_input in pack}
+        article_texts = {index: article_text for index, (_, (article_text, _)) in items.items()}
+        if self.prompt_builder:
+            # Plain-text articles go into the list as JSON strings
+            article_texts = {index: json.dumps(article_text, ensure_ascii=False) for index, article_text in article_texts.items()}
+        packed_input = '[' + ','.join(
+            f'{{"article_id":{index},"article":{article_text}}}' for index, article_text in article_texts.items()
+        ) + ']'
+        response = await self._get_packed_agent().run(packed_input)
+        self._record_usage(response)
+        self.usage['packed_requests'] += 1
+
+        counts = Counter(result.article_id for result in response.output.results)
+        outputs = {}
+        for result in response.output.results:
+            if result.article_id in items and counts[result.article_id] == 1:
+                article_content, (article_text, saved_tokens) = items[result.article_id]
+                output = self.output_type.model_validate(result.model_dump(exclude={'article_id'}))
+                outputs[result.article_id] = output
+                self.usage['prompt_tokens_saved'] += saved_tokens
+                if self.cache:
+                    self.cache.set(self._cache_key(article_content, article_text), output, model_name=self.model_name)
+        return outputs
+
+
+    async def run_many_packed(
+        self,
+        article_contents: Sequence[FactCheckArticleContent],
+        max_request_tokens: int = 8000,
+        max_pack_size: int = 20,
+        max_concurrency: int = 5,
+        requests_per_minute: Optional[float] = None,
+        max_retries: int = 4
+    ) -> List[BatchResult]:
+        '''
+        Like run_many(), but sends as many articles per request as fit into max_request_tokens
+        (system prompt included, counted with the token counter), at most max_pack_size.
+        Every article must come back with exactly one result; articles the model skipped or
+        answered twice, and those of packs that failed, are retried as single-article requests.
+        Each article prompt is built once and reused for the cache lookup, the packing and the
+        request. Returns one BatchResult per article in input order.
+        '''
+        runner = BatchRunner(
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            model_name=self.model_name,
+            max_retries=max_retries
+        )
+        results: List[Optional[BatchResult]] = [None] * len(article_contents)
+        pending: List[PackItem] = []
+        for index, article_content in enumerate(article_contents):
+            article_input = self._article_input(article_content)
+            cached = self._get_cached(article_content, article_input[0])
+            if cached is not None:
+                results[index] = BatchResult(index=index, input=article_content, output=cached)
+            else:
+                pending.append((index, article_content, article_input))
+
+        missing: List[PackItem] = []
+        packs = self._make_packs(pending, max_request_tokens, max_pack_size)
+        for pack_result in await runner.run(self._run_pack, packs):
+            outputs = pack_result.output or {}
+            for index, article_content, article_input in pack_result.input:
+                if index in outputs:
+                    results[index] = BatchResult(index=index, input=article_content, output=outputs[index], attempts=pack_result.attempts)
+                elif len(pack_result.input) == 1:
+                    # Already a single-article request, falling back would send it again
+                    results[index] = BatchResult(index=index, input=article_content, error=pack_result.error, attempts=pack_result.attempts)
+                else:
+                    missing.append((index, article_content, article_input))
+
+        if missing:
+            self.usage['fallback_articles'] += len(missing)
+
+            async def run_single(item: PackItem) -> Any:
+                return await self._run_uncached(item[1], item[2])
 
+            single_results = await runner.run(run_single, missing)
+            for (index, article_content, _), result in zip(missing, single_results):
+                result.index = index
+                result.input = article_content
+                results[index] = result
+        return results
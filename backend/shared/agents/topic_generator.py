@@ -1,7 +1,8 @@
 import os, sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, List, Optional, Sequence
 from pydantic_ai.agent import Agent
+from pydantic_ai.models import Model
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openrouter import OpenRouterProvider
 
@@ -9,6 +10,8 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from shared.schemas import LLMGeneratedTopic, FactCheckArticleContent
+from shared.agents.batch_runner import BatchRunner, BatchResult
+from shared.agents.llm_cache import LLMResultCache
 
 
 class TopicGeneratorAgent():
@@ -19,10 +22,14 @@ class TopicGeneratorAgent():
     def __init__(
         self,
         model_name: str,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        model: Optional[Model] = None,
+        cache: Optional[LLMResultCache] = None
     ):
         self.model_name = model_name
         self.system_prompt = system_prompt if system_prompt else self._load_system_prompt()
+        self.model = model
+        self.cache = cache
         self.agent = self._create_agent()
 
 
@@ -38,14 +45,17 @@ class TopicGeneratorAgent():
     def _create_agent(self) -> Agent:
         '''
         Create a PydanticAI agent with the given system prompt and model.
+        If no model instance was passed in, an OpenRouter model is created from model_name.
         '''
-        provider = OpenRouterProvider(
-            api_key=os.getenv('OPENROUTER_API_KEY')
-        )
-        model = OpenAIChatModel(
-            self.model_name,
-            provider=provider
-        )
+        model = self.model
+        if model is None:
+            provider = OpenRouterProvider(
+                api_key=os.getenv('OPENROUTER_API_KEY')
+            )
+            model = OpenAIChatModel(
+                self.model_name,
+                provider=provider
+            )
         agent = Agent(
             model=model,
             system_prompt=self.system_prompt,
@@ -54,9 +64,62 @@ class TopicGeneratorAgent():
         return agent
         
 
+    def _cache_key(self, article_content: FactCheckArticleContent) -> str:
+        return LLMResultCache.make_key(self.model_name, self.system_prompt, article_content.model_dump_json())
+
+
+    def _get_cached(self, article_content: FactCheckArticleContent) -> Optional[LLMGeneratedTopic]:
+        '''
+        Return the cached output for an article, or None if there is no cache or no entry.
+        '''
+        if not self.cache:
+            return None
+        return self.cache.get(self._cache_key(article_content), LLMGeneratedTopic)
+
+
+    async def _run_uncached(self, article_content: FactCheckArticleContent) -> LLMGeneratedTopic:
+        '''
+        Sends the article to the model and stores the output in the cache.
+        '''
+        response = await self.agent.run(article_content.model_dump_json())
+        if self.cache:
+            self.cache.set(self._cache_key(article_content), response.output, model_name=self.model_name)
+        return response.output
+
+
     async def run(self, article_content: FactCheckArticleContent) -> LLMGeneratedTopic:
         '''
         Runs the agent on one article of type LLMGeneratedTopic.
+        Served from the cache if the same article was already sent with the same model and prompt.
         '''
-        response = await self.agent.run(article_content.model_dump_json())
-        return response.output
\ No newline at end of file
+        cached = self._get_cached(article_content)
+        if cached is not None:
+            return cached
+        return await self._run_uncached(article_content)
+
+
+    async def run_many(
+        self,
+        article_contents: Sequence[FactCheckArticleContent],
+        max_concurrency: int = 5,
+        requests_per_minute: Optional[float] = None,
+        max_retries: int = 4,
+        on_result: Optional[Callable[[BatchResult], Any]] = None
+    ) -> List[BatchResult]:
+        '''
+        Runs the agent on many articles concurrently. Returns one BatchResult per article
+        in input order, holding either the LLMGeneratedTopic or the exception raised for it.
+        Cached articles are resolved up front and do not count against the rate limit.
+        '''
+        runner = BatchRunner(
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            model_name=self.model_name,
+            max_retries=max_retries
+        )
+        return await runner.run(
+            self._run_uncached,
+            article_contents,
+            on_result=on_result,
+            lookup=self._get_cached
+        )
@@ -4,13 +4,130 @@ from pathlib import Path
 project_root = str(Path(__file__).parent)
 sys.path.append(project_root)
 
-from contextlib import contextmanager
-from typing import Generator
-from sqlalchemy import create_engine
+from contextlib import contextmanager, asynccontextmanager
+from typing import Any, Dict, Generator, AsyncGenerator, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, URL, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from models import Base
 import os
 from dotenv import load_dotenv
+import threading
+import time
+
+
+def pool_options() -> Dict[str, Any]:
+    '''
+    Connection pool settings for create_engine/create_async_engine, read from the environment:
+    DB_POOL_SIZE (default 5), DB_MAX_OVERFLOW (default 10), DB_POOL_TIMEOUT seconds to wait
+    for a connection (default 30), DB_POOL_RECYCLE seconds after which connections are
+    replaced (default 1800) and DB_POOL_PRE_PING (default true).
+    '''
+    return {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '5')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '10')),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', '30')),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes'),
+    }
+
+
+def default_statement_timeout_ms() -> int:
+    '''
+    Server-side statement timeout from DB_STATEMENT_TIMEOUT_MS (default 30000), 0 disables it.
+    '''
+    return int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '30000'))
+
+
+def set_statement_timeout(engine: Engine, statement_timeout_ms: int):
+    '''
+    Apply statement_timeout to every new Postgres connection of the engine.
+    '''
+    if engine.dialect.name != 'postgresql':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f'SET statement_timeout = {int(statement_timeout_ms)}')
+        cursor.close()
+
+
+class PoolMetrics:
+    '''
+    Connection pool metrics collected through SQLAlchemy pool events.
+
+    Counts new connections, checkouts, checkins and invalidations and tracks the peak
+    number of checked out connections and of overflow connections. The time sessions
+    wait for a connection is recorded by the session context managers via observe_wait.
+    '''
+    def __init__(self, engine: Engine):
+        self.pool = engine.pool
+        self.lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+        self.waits = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+        event.listen(engine, 'connect', self.on_connect)
+        event.listen(engine, 'checkout', self.on_checkout)
+        event.listen(engine, 'checkin', self.on_checkin)
+        event.listen(engine, 'invalidate', self.on_invalidate)
+
+    def on_connect(self, dbapi_connection, connection_record):
+        with self.lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self.lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            self.peak_overflow = max(self.peak_overflow, self.overflow())
+
+    def on_checkin(self, dbapi_connection, connection_record):
+        with self.lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self.lock:
+            self.invalidations += 1
+
+    def overflow(self) -> int:
+        return max(self.pool.overflow(), 0) if hasattr(self.pool, 'overflow') else 0
+
+    def observe_wait(self, seconds: float, timed_out: bool = False):
+        with self.lock:
+            self.waits += 1
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'pool_size': self.pool.size() if hasattr(self.pool, 'size') else None,
+            'checked_out': self.checked_out,
+            'overflow': self.overflow(),
+            'peak_checked_out': self.peak_checked_out,
+            'peak_overflow': self.peak_overflow,
+            'connects': self.connects,
+            'checkouts': self.checkouts,
+            'checkins': self.checkins,
+            'invalidations': self.invalidations,
+            'timeouts': self.timeouts,
+            'avg_wait_ms': 1000 * self.total_wait_seconds / self.waits if self.waits else 0.0,
+            'max_wait_ms': 1000 * self.max_wait_seconds
+        }
 
 
 class Database:
@@ -18,14 +135,20 @@ class Database:
     Database connection manager that handles SQLAlchemy session lifecycle.
     
     Exposes a context manager for handling database sessions with automatic commit/rollback
-    and cleanup.
+    and cleanup. Pool settings come from the environment (see pool_options), statement_timeout_ms
+    overrides DB_STATEMENT_TIMEOUT_MS, e.g. 0 for migrations that run longer than the API limit.
     '''
-    def __init__(self):
+    def __init__(self, statement_timeout_ms: Optional[int] = None):
         load_dotenv()
         self.connection_string = os.getenv('DATABASE_URL')
         if not self.connection_string:
             raise ValueError('DATABASE_URL not found in environment variables')
-        self.engine = create_engine(self.connection_string)
+        self.engine = create_engine(self.connection_string, **pool_options())
+        if statement_timeout_ms is None:
+            statement_timeout_ms = default_statement_timeout_ms()
+        if statement_timeout_ms:
+            set_statement_timeout(self.engine, statement_timeout_ms)
+        self.pool_metrics = PoolMetrics(self.engine)
         self.Session = sessionmaker(bind=self.engine)
     
     def init_db(self):
@@ -35,10 +158,83 @@ class Database:
     def get_session(self) -> Generator[Session, None, None]:
         session = self.Session()
         try:
+            self.acquire_connection(session)
             yield session
             session.commit()
         except Exception:
             session.rollback()
             raise
         finally:
-            session.close() 
\ No newline at end of file
+            session.close()
+
+    def acquire_connection(self, session: Session):
+        '''Check out the session's connection up front to record the pool wait.'''
+        start = time.perf_counter()
+        try:
+            session.connection()
+        except PoolTimeoutError:
+            self.pool_metrics.observe_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.pool_metrics.observe_wait(time.perf_counter() - start)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return self.pool_metrics.stats()
+
+
+class AsyncDatabase:
+    '''
+    Async counterpart of Database for the API, backed by an asyncpg engine.
+
+    Uses ASYNC_DATABASE_URL if set, otherwise DATABASE_URL with its driver switched to asyncpg.
+    Exposes an async context manager for sessions with automatic commit/rollback and cleanup.
+    Pool settings, statement timeout and pool metrics work as in Database.
+    '''
+    def __init__(self, statement_timeout_ms: Optional[int] = None):
+        load_dotenv()
+        self.connection_string = os.getenv('ASYNC_DATABASE_URL') or os.getenv('DATABASE_URL')
+        if not self.connection_string:
+            raise ValueError('DATABASE_URL not found in environment variables')
+        self.engine = create_async_engine(self.to_async_url(self.connection_string), **pool_options())
+        if statement_timeout_ms is None:
+            statement_timeout_ms = default_statement_timeout_ms()
+        if statement_timeout_ms:
+            set_statement_timeout(self.engine.sync_engine, statement_timeout_ms)
+        self.pool_metrics = PoolMetrics(self.engine.sync_engine)
+        # Keep loaded attributes after commit, responses are serialized after the session ends
+        self.Session = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    @staticmethod
+    def to_async_url(connection_string: str) -> URL:
+        url = make_url(connection_string)
+        if url.drivername in ('postgresql', 'postgresql+psycopg2'):
+            url = url.set(drivername='postgresql+asyncpg')
+        return url
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        session = self.Session()
+        try:
+            await self.acquire_connection(session)
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    async def acquire_connection(self, session: AsyncSession):
+        '''Check out the session's connection up front to record the pool wait.'''
+        start = time.perf_counter()
+        try:
+            await session.connection()
+        except PoolTimeoutError:
+            self.pool_metrics.observe_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.pool_metrics.observe_wait(time.perf_counter() - start)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return self.pool_metrics.stats()
+
+    async def dispose(self):
+        await self.engine.dispose()
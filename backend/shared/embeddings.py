@@ -0,0 +1,81 @@
+import os
+import hashlib
+import threading
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from shared.models import EMBEDDING_DIMENSIONS
+
+
+# Multilingual sentence-transformers model, small enough to encode on the CPU
+DEFAULT_EMBEDDING_MODEL = 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'
+
+
+def embedding_text(article: Any) -> str:
+    '''
+    The text an article is embedded from: headline, teaser and claim (ORM object or schema).
+    These carry the claim being checked; the body would mostly add the outlet's own wording.
+    '''
+    parts = (article.headline, article.teaser, getattr(article, 'claim', None))
+    return '\n'.join(part.strip() for part in parts if part and part.strip())
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ArticleEmbedder():
+    '''
+    Encodes texts into normalized vectors with a local sentence-transformers model on the CPU.
+
+    The model is loaded on first use, so importing this module (e.g. in the API) stays cheap.
+    Texts are encoded in vectorized batches of batch_size. Instead of a model name an already
+    loaded model with the SentenceTransformer.encode() interface can be passed.
+    '''
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        batch_size: int = 64,
+        device: str = 'cpu',
+        model: Optional[Any] = None
+    ):
+        self.model_name = model_name or os.getenv('EMBEDDING_MODEL', DEFAULT_EMBEDDING_MODEL)
+        self.batch_size = batch_size
+        self.device = device
+        self.model = model
+        self.lock = threading.Lock()
+
+
+    def _load(self):
+        with self.lock:
+            if self.model is None:
+                from sentence_transformers import SentenceTransformer
+                self.model = SentenceTransformer(self.model_name, device=self.device)
+        return self.model
+
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        '''
+        Encode texts into a (len(texts), EMBEDDING_DIMENSIONS) float32 array of unit vectors.
+        '''
+        if not texts:
+            return np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
+        vectors = self._load().encode(
+            list(texts),
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.shape[1] != EMBEDDING_DIMENSIONS:
+            raise ValueError(
+                f'{self.model_name} produces {vectors.shape[1]}-dimensional vectors, '
+                f'article_embeddings stores {EMBEDDING_DIMENSIONS}'
+            )
+        return vectors
+
+
+    def encode_one(self, text: str) -> np.ndarray:
+        return self.encode([text])[0]
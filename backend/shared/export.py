@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from shared.schemas import FactCheckArticlesSchema, FactCheckArticleSummarySchema
+
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+EXPORT_MEDIA_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+
+def export_columns(fields: Optional[Sequence[str]] = None, summary: bool = False) -> List[str]:
+    '''
+    Columns of an export for a fields/summary selection. Raises ValueError for unknown fields,
+    call it before streaming starts so the error can still be reported.
+    '''
+    if summary:
+        return list(FactCheckArticleSummarySchema.model_fields)
+    if fields:
+        unknown = [name for name in fields if name not in FactCheckArticlesSchema.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown article fields: {', '.join(unknown)}")
+        return ['id'] + [name for name in fields if name != 'id']
+    return list(FactCheckArticlesSchema.model_fields)
+
+
+def to_ndjson_line(article: BaseModel, columns: Sequence[str]) -> str:
+    return article.model_dump_json(include=set(columns)) + '\n'
+
+
+def to_csv_line(values: Sequence) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def to_csv_row(article: BaseModel, columns: Sequence[str]) -> str:
+    '''
+    One CSV line for an article. Nested fields like body and entities are written as JSON.
+    '''
+    data = article.model_dump(mode='json', include=set(columns))
+    values = []
+    for name in columns:
+        value = data.get(name)
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value, ensure_ascii=False)
+        values.append('' if value is None else value)
+    return to_csv_line(values)
+
+
+def export_lines(articles: Iterable[BaseModel], format: str, columns: Sequence[str]) -> Iterator[str]:
+    '''
+    Serialize articles one line at a time as NDJSON or CSV (with a header line).
+    '''
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {format}")
+    if format == 'csv':
+        yield to_csv_line(columns)
+        for article in articles:
+            yield to_csv_row(article, columns)
+    else:
+        for article in articles:
+            yield to_ndjson_line(article, columns)
+
+
+async def aexport_lines(articles: AsyncIterable[BaseModel], format: str, columns: Sequence[str]) -> AsyncIterator[str]:
+    '''
+    Async counterpart of export_lines for articles streamed from an AsyncSession.
+    '''
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {format}")
+    if format == 'csv':
+        yield to_csv_line(columns)
+        async for article in articles:
+            yield to_csv_row(article, columns)
+    else:
+        async for article in articles:
+            yield to_ndjson_line(article, columns)
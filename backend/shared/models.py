@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Integer, DateTime, UniqueConstraint
+from sqlalchemy import Column, String, Integer, BigInteger, Date, DateTime, ForeignKey, UniqueConstraint, Index, DDL, event, text
 from sqlalchemy.dialects.postgresql import JSONB
+from pgvector.sqlalchemy import Vector
 from sqlalchemy.ext.declarative import declarative_base
 import datetime
 
@@ -23,7 +24,194 @@ class FactCheckArticles(Base):
     image_url = Column(String)
     published_at = Column(DateTime)
     topic = Column(String)
+    # Who assigned the topic: 'llm' or 'local' (the LocalTopicClassifier), NULL if unknown.
+    # Added by scripts/migrate_add_topic_source.py
+    topic_source = Column(String)
     claim = Column(String)
     instrumentalizer = Column(String)
     entities = Column(JSONB)
-    last_updated = Column(DateTime, default=datetime.datetime.now(datetime.UTC))
\ No newline at end of file
+    # SHA-256 of headline, teaser and body (see compute_content_hash), set at ingest
+    content_hash = Column(String(64))
+    # content_hash of the version the topic was classified on
+    classified_hash = Column(String(64))
+    last_updated = Column(DateTime, default=lambda: datetime.datetime.now(datetime.UTC).replace(tzinfo=None))
+
+
+# Indexes for the API's access paths, created on existing databases by scripts/migrate_add_indexes.py
+# Listings and keyset pagination, newest first. Includes medium and topic so that
+# topic counts and publication histograms over a date range are index-only scans.
+Index(
+    'idx_fact_check_articles_published_at_id',
+    FactCheckArticles.published_at.desc().nulls_last(),
+    FactCheckArticles.id.desc(),
+    postgresql_include=['medium', 'topic']
+)
+# Listings filtered by topic (/articles-by-topic) or medium, in keyset order
+Index(
+    'idx_fact_check_articles_topic_published_at_id',
+    FactCheckArticles.topic,
+    FactCheckArticles.published_at.desc().nulls_last(),
+    FactCheckArticles.id.desc()
+)
+Index(
+    'idx_fact_check_articles_medium_published_at_id',
+    FactCheckArticles.medium,
+    FactCheckArticles.published_at.desc().nulls_last(),
+    FactCheckArticles.id.desc()
+)
+# Articles still waiting for classification, read in ID order by the classification pipeline
+Index(
+    'idx_fact_check_articles_unclassified_id',
+    FactCheckArticles.id,
+    postgresql_where=text('topic IS NULL')
+)
+# Articles without a topic or whose content changed since classification, read in ID order
+# by the classification pipeline. Created by scripts/migrate_add_content_hash.py
+Index(
+    'idx_fact_check_articles_to_classify_id',
+    FactCheckArticles.id,
+    postgresql_where=text('topic IS NULL OR classified_hash IS DISTINCT FROM content_hash')
+)
+# Articles with the same content, e.g. syndicated fact-checks under several URLs
+Index('idx_fact_check_articles_content_hash', FactCheckArticles.content_hash)
+# Containment queries on entities, e.g. entities @> '[{"name": "..."}]'
+Index(
+    'idx_fact_check_articles_entities',
+    FactCheckArticles.entities,
+    postgresql_using='gin',
+    postgresql_ops={'entities': 'jsonb_path_ops'}
+)
+
+
+class TopicCountRollup(Base):
+    '''
+    Number of articles per publication day, medium and topic, kept up to date by the
+    fact_check_articles_topic_rollup trigger, with one row per key.
+    '''
+    __tablename__ = 'topic_count_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date)
+    medium = Column(String)
+    topic = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+
+# One row per key, also for articles without a day or medium, so the trigger can upsert
+Index(
+    'uq_topic_count_rollups_day_medium_topic',
+    TopicCountRollup.day,
+    TopicCountRollup.medium,
+    TopicCountRollup.topic,
+    unique=True,
+    postgresql_nulls_not_distinct=True
+)
+
+
+class DataVersion(Base):
+    '''
+    Single-row counter that is incremented whenever articles are written through
+    FactCheckArticlesService. Readers use it to invalidate cached responses.
+    '''
+    __tablename__ = 'data_version'
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+class CrawlState(Base):
+    '''
+    How far link discovery has read each medium's feed: the newest publication date and the
+    highest source-side item ID seen, and the validators of the last feed response for
+    conditional requests. Advanced only after a crawl stored all new articles.
+    '''
+    __tablename__ = 'crawl_states'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    medium = Column(String, nullable=False, unique=True)
+    last_published_at = Column(DateTime)
+    last_item_id = Column(BigInteger)
+    etag = Column(String)
+    last_modified = Column(String)
+    last_crawled_at = Column(DateTime)
+
+
+# Output size of the default embedding model (paraphrase-multilingual-MiniLM-L12-v2)
+EMBEDDING_DIMENSIONS = 384
+
+
+class ArticleEmbedding(Base):
+    '''
+    Embedding of an article's headline, teaser and claim for semantic search and near-duplicate
+    detection. text_hash identifies the text that was encoded, so the embedding pipeline only
+    re-encodes articles whose text changed. Rows are removed with their article.
+    '''
+    __tablename__ = 'article_embeddings'
+
+    article_id = Column(Integer, ForeignKey('fact_check_articles.id', ondelete='CASCADE'), primary_key=True)
+    model = Column(String, nullable=False)
+    text_hash = Column(String(64), nullable=False)
+    embedding = Column(Vector(EMBEDDING_DIMENSIONS), nullable=False)
+    created_at = Column(DateTime, default=lambda: datetime.datetime.now(datetime.UTC).replace(tzinfo=None))
+
+
+# Approximate nearest neighbours by cosine distance. HNSW is updated on every insert,
+# so new articles are searchable without rebuilding the index.
+Index(
+    'idx_article_embeddings_embedding_hnsw',
+    ArticleEmbedding.embedding,
+    postgresql_using='hnsw',
+    postgresql_with={'m': 16, 'ef_construction': 64},
+    postgresql_ops={'embedding': 'vector_cosine_ops'}
+)
+
+event.listen(
+    ArticleEmbedding.__table__,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS vector').execute_if(dialect='postgresql')
+)
+
+
+# Keeps topic_count_rollups in sync with every insert, delete and change of topic,
+# medium or published_at on fact_check_articles, whichever code path writes them.
+TOPIC_COUNT_ROLLUP_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION topic_count_rollup_add(p_day DATE, p_medium TEXT, p_topic TEXT, p_delta INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO topic_count_rollups (day, medium, topic, count) VALUES (p_day, p_medium, p_topic, p_delta)
+    ON CONFLICT (day, medium, topic) DO UPDATE SET count = topic_count_rollups.count + EXCLUDED.count;
+    DELETE FROM topic_count_rollups
+    WHERE day IS NOT DISTINCT FROM p_day AND medium IS NOT DISTINCT FROM p_medium AND topic = p_topic AND count = 0;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION fact_check_articles_topic_rollup()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND OLD.topic IS NOT DISTINCT FROM NEW.topic
+        AND OLD.medium IS NOT DISTINCT FROM NEW.medium
+        AND OLD.published_at::date IS NOT DISTINCT FROM NEW.published_at::date THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.topic IS NOT NULL THEN
+        PERFORM topic_count_rollup_add(OLD.published_at::date, OLD.medium, OLD.topic, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.topic IS NOT NULL THEN
+        PERFORM topic_count_rollup_add(NEW.published_at::date, NEW.medium, NEW.topic, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS fact_check_articles_topic_rollup ON fact_check_articles;
+CREATE TRIGGER fact_check_articles_topic_rollup
+AFTER INSERT OR DELETE OR UPDATE OF topic, medium, published_at ON fact_check_articles
+FOR EACH ROW EXECUTE FUNCTION fact_check_articles_topic_rollup();
+"""
+
+event.listen(
+    Base.metadata,
+    'after_create',
+    DDL(TOPIC_COUNT_ROLLUP_TRIGGER_SQL).execute_if(dialect='postgresql')
+)
@@ -0,0 +1,133 @@
+from typing import Optional, List, Dict, Any
+
+from shared.database import Database
+from shared.schemas import FactCheckArticleContent, FactCheckArticlesSchema, ArticleAxes, AXIS_COLUMNS
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+from shared.agents.axis_extractor import AxisExtractorAgent
+from shared.agents.batch_runner import BatchResult
+from shared.pipelines.topic_classification import PipelineCheckpoint
+
+
+class AxisExtractionPipeline():
+    '''
+    Fills the four axes (topic, claim, instrumentalizer, entities) of articles directly from
+    and into the database, sending every article to the LLM only once.
+
+    Articles with at least one empty axis are read in keyset-paginated chunks, extracted
+    concurrently with AxisExtractorAgent.run_many() and written back with one bulk UPDATE per
+    group of written columns, after which the last ID is checkpointed. With only_missing
+    (the default) only the axes that are still NULL are written and existing values are kept;
+    otherwise all four axes are overwritten and articles whose content changed since their
+    classification are extracted again. Whenever the topic is written, the content_hash it was
+    extracted on is recorded as classified_hash and its topic_source as 'llm', as the
+    TopicClassificationPipeline does.
+    With pack_request_tokens, several articles are packed per request up to that token budget.
+    '''
+    def __init__(
+        self,
+        db: Database,
+        extractor_agent: AxisExtractorAgent,
+        chunk_size: int = 100,
+        only_missing: bool = True,
+        max_concurrency: int = 5,
+        requests_per_minute: Optional[float] = None,
+        checkpoint: Optional[PipelineCheckpoint] = None,
+        pack_request_tokens: Optional[int] = None
+    ):
+        self.db = db
+        self.extractor_agent = extractor_agent
+        self.chunk_size = chunk_size
+        self.only_missing = only_missing
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.checkpoint = checkpoint if checkpoint else PipelineCheckpoint('axis_extraction')
+        self.pack_request_tokens = pack_request_tokens
+
+
+    def _fetch_chunk(self, after_id: int, limit: int) -> List[FactCheckArticlesSchema]:
+        with self.db.get_session() as session:
+            service = FactCheckArticlesService(session)
+            return service.get_articles_to_extract(
+                after_id=after_id,
+                limit=limit,
+                include_changed=not self.only_missing
+            )
+
+
+    def _column_updates(self, article: FactCheckArticlesSchema, axes: ArticleAxes) -> Dict[str, Any]:
+        '''
+        The columns to write for one article: all axes, or with only_missing just the empty ones.
+        '''
+        columns = axes.to_columns()
+        if self.only_missing:
+            columns = {axis: value for axis, value in columns.items() if getattr(article, axis) is None}
+        if 'topic' in columns:
+            columns['topic_source'] = 'llm'
+            columns['classified_hash'] = article.content_hash
+        return columns
+
+
+    def _write_axes(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        if not updates:
+            return 0
+        with self.db.get_session() as session:
+            return FactCheckArticlesService(session).bulk_update_articles(updates)
+
+
+    async def run(self, max_articles: Optional[int] = None, restart: bool = False) -> Dict[str, int]:
+        '''
+        Run the pipeline until no article with an empty axis is left or max_articles were processed.
+        Returns counts of processed, extracted and failed articles and of the written axis values.
+        '''
+        if restart:
+            self.checkpoint.clear()
+        after_id = self.checkpoint.load()
+        if after_id:
+            print(f"Resuming after article ID {after_id}.")
+        stats = {'processed': 0, 'extracted': 0, 'failed': 0, **{axis: 0 for axis in AXIS_COLUMNS}}
+
+        while max_articles is None or stats['processed'] < max_articles:
+            limit = self.chunk_size
+            if max_articles is not None:
+                limit = min(limit, max_articles - stats['processed'])
+            articles = self._fetch_chunk(after_id, limit)
+            if not articles:
+                # A full pass is done, the next run starts from the beginning again
+                self.checkpoint.clear()
+                break
+
+            contents = [FactCheckArticleContent.from_article(article) for article in articles]
+            if self.pack_request_tokens:
+                batch_results: List[BatchResult] = await self.extractor_agent.run_many_packed(
+                    contents,
+                    max_request_tokens=self.pack_request_tokens,
+                    max_concurrency=self.max_concurrency,
+                    requests_per_minute=self.requests_per_minute
+                )
+            else:
+                batch_results = await self.extractor_agent.run_many(
+                    contents,
+                    max_concurrency=self.max_concurrency,
+                    requests_per_minute=self.requests_per_minute
+                )
+            updates = {}
+            for article, result in zip(articles, batch_results):
+                if not result.ok:
+                    print(f"  ❌ Error extracting the axes of article {article.id}: {result.error}")
+                    stats['failed'] += 1
+                    continue
+                stats['extracted'] += 1
+                columns = self._column_updates(article, result.output)
+                for axis in AXIS_COLUMNS:
+                    stats[axis] += axis in columns
+                if columns:
+                    updates[article.id] = columns
+
+            self._write_axes(updates)
+            after_id = articles[-1].id
+            self.checkpoint.save(after_id)
+
+            stats['processed'] += len(articles)
+            print(f"Extracted the axes of {stats['extracted']}/{stats['processed']} articles (up to ID {after_id}).")
+
+        return stats
@@ -0,0 +1,53 @@
+from typing import Dict, Optional
+
+from shared.database import Database
+from shared.embeddings import ArticleEmbedder
+from shared.services.article_embeddings_service import ArticleEmbeddingsService
+
+
+class EmbeddingPipeline():
+    '''
+    Keeps article_embeddings up to date with the articles.
+
+    Scans the articles in keyset-paginated chunks of scan_size IDs, reading only headline,
+    teaser, claim and the stored text hash, and encodes just the articles that are new or whose
+    text changed, in vectorized batches. Each chunk's embeddings are written in one transaction,
+    and the HNSW index takes them in place, so a run after scraping only costs the new articles.
+    '''
+    def __init__(
+        self,
+        db: Database,
+        embedder: ArticleEmbedder,
+        scan_size: int = 1000
+    ):
+        self.db = db
+        self.embedder = embedder
+        self.scan_size = scan_size
+
+
+    def run(self, max_articles: Optional[int] = None, after_id: int = 0) -> Dict[str, int]:
+        '''
+        Embed all articles after after_id without an up-to-date embedding, or at most
+        max_articles of them. Returns the number of embedded articles.
+        '''
+        stats = {'embedded': 0}
+        while max_articles is None or stats['embedded'] < max_articles:
+            with self.db.get_session() as session:
+                to_embed, last_id = ArticleEmbeddingsService(session).get_texts_to_embed(
+                    self.embedder.model_name, after_id=after_id, limit=self.scan_size
+                )
+            if last_id is None:
+                break
+            if max_articles is not None:
+                to_embed = to_embed[:max_articles - stats['embedded']]
+            if to_embed:
+                article_ids = [article_id for article_id, _ in to_embed]
+                texts = [article_text for _, article_text in to_embed]
+                vectors = self.embedder.encode(texts)
+                with self.db.get_session() as session:
+                    stats['embedded'] += ArticleEmbeddingsService(session).save_embeddings(
+                        self.embedder.model_name, article_ids, texts, vectors
+                    )
+                print(f"Embedded {stats['embedded']} articles (up to ID {last_id}).")
+            after_id = last_id
+        return stats
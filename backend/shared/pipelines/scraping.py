@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from shared.database import Database
+from shared.schemas import FactCheckArticlesSchema
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+from shared.agents.batch_runner import BatchRunner, BatchResult, RETRYABLE_STATUS_CODES
+
+
+# A worker scrapes one article URL into a news_scraper article dict (or None if the page
+# has no article). Workers are blocking and keep their browser or HTTP client between
+# calls; they may expose close() to release it.
+ScrapeWorker = Callable[[str], Optional[Dict[str, Any]]]
+
+
+@dataclass
+class ScrapeJob():
+    '''
+    What to scrape for one medium: how to find article links, how to create a worker,
+    and the politeness limits for the medium's site.
+    '''
+    medium: str
+    get_links: Callable[[], List[str]]
+    make_worker: Callable[[], ScrapeWorker]
+    max_workers: int = 2
+    requests_per_minute: Optional[float] = 30
+    # Called once all articles of the run are saved with the number of links that failed
+    # transiently (a later run may still get them), e.g. to advance the medium's crawl state
+    on_complete: Optional[Callable[[int], None]] = None
+
+
+def is_retryable_scrape(error: BaseException) -> bool:
+    '''
+    Transport errors, timeouts, rate limits and server errors are retried, anything
+    else (404, parse errors) fails the URL right away.
+    '''
+    response = getattr(error, 'response', None)
+    status_code = getattr(error, 'status_code', None) or getattr(error, 'code', None) or getattr(response, 'status_code', None)
+    if isinstance(status_code, int):
+        return status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (TimeoutError, ConnectionError))
+
+
+class ScrapingPipeline():
+    '''
+    Scrapes the jobs of several media concurrently and streams the articles into the database.
+
+    Links already stored are dropped up front with get_missing_urls. Each job gets its own
+    pool of max_workers threads, each thread owning one long-lived worker, and a per-medium
+    token bucket (requests_per_minute) so every site sees polite traffic while the media run
+    in parallel. Scraped articles are saved in batches of write_batch_size as they complete,
+    so a crash loses at most one batch and a re-run resumes with the missing links.
+    '''
+    def __init__(
+        self,
+        db: Database,
+        jobs: List[ScrapeJob],
+        write_batch_size: int = 20,
+        max_retries: int = 2
+    ):
+        self.db = db
+        self.jobs = jobs
+        self.write_batch_size = write_batch_size
+        self.max_retries = max_retries
+        self.pending: List[FactCheckArticlesSchema] = []
+        self.write_lock = threading.Lock()
+        self.stats = {'links': 0, 'skipped': 0, 'scraped': 0, 'empty': 0, 'failed': 0, 'saved': 0}
+
+
+    def _missing_links(self, links: List[str]) -> List[str]:
+        if not links:
+            return []
+        with self.db.get_session() as session:
+            return FactCheckArticlesService(session).get_missing_urls(links)
+
+
+    def _save(self, articles: List[FactCheckArticlesSchema]):
+        with self.db.get_session() as session:
+            counts = FactCheckArticlesService(session).save_articles(articles)
+        with self.write_lock:
+            self.stats['saved'] += counts['inserted']
+
+
+    def _add_article(self, article: FactCheckArticlesSchema) -> Optional[List[FactCheckArticlesSchema]]:
+        '''
+        Queue an article for writing and return a full batch when one is ready.
+        '''
+        with self.write_lock:
+            self.pending.append(article)
+            if len(self.pending) < self.write_batch_size:
+                return None
+            batch, self.pending = self.pending, []
+            return batch
+
+
+    def _flush(self) -> List[FactCheckArticlesSchema]:
+        with self.write_lock:
+            batch, self.pending = self.pending, []
+            return batch
+
+
+    async def _run_job(self, job: ScrapeJob) -> int:
+        '''
+        Scrape the job's new links and return how many of them failed transiently.
+        '''
+        # Keep the link order but drop duplicates, listings often repeat articles
+        links = list(dict.fromkeys(await asyncio.to_thread(job.get_links)))
+        missing = await asyncio.to_thread(self._missing_links, links)
+        self.stats['links'] += len(links)
+        self.stats['skipped'] += len(links) - len(missing)
+        print(f"[{job.medium}] {len(links)} links, {len(missing)} not yet stored.")
+        if not missing:
+            return 0
+
+        local = threading.local()
+        workers: List[ScrapeWorker] = []
+
+        def scrape(url: str) -> Optional[Dict[str, Any]]:
+            # Runs in the job's thread pool, each thread creates its worker once
+            if not hasattr(local, 'worker'):
+                local.worker = job.make_worker()
+                workers.append(local.worker)
+            return local.worker(url)
+
+        executor = ThreadPoolExecutor(max_workers=job.max_workers, thread_name_prefix=f'scrape-{job.medium}')
+        loop = asyncio.get_running_loop()
+        writes: List[asyncio.Future] = []
+        retryable = 0
+
+        async def scrape_url(url: str) -> Optional[Dict[str, Any]]:
+            return await loop.run_in_executor(executor, scrape, url)
+
+        def on_result(result: BatchResult):
+            nonlocal retryable
+            # Pages without an article and permanent errors (404) stay that way on a re-run
+            if not result.ok and is_retryable_scrape(result.error):
+                retryable += 1
+            if not result.ok:
+                self.stats['failed'] += 1
+                print(f"  ❌ [{job.medium}] {result.input}: {result.error}")
+                return
+            if not result.output:
+                self.stats['empty'] += 1
+                return
+            self.stats['scraped'] += 1
+            article = FactCheckArticlesSchema.from_news_scraper({'medium': job.medium, 'url': result.input, **result.output})
+            batch = self._add_article(article)
+            if batch:
+                writes.append(asyncio.ensure_future(asyncio.to_thread(self._save, batch)))
+
+        runner = BatchRunner(
+            max_concurrency=job.max_workers,
+            requests_per_minute=job.requests_per_minute,
+            model_name=f'scrape:{job.medium}',
+            max_retries=self.max_retries,
+            retry_on=is_retryable_scrape
+        )
+        try:
+            await runner.run(scrape_url, missing, on_result=on_result)
+            await asyncio.gather(*writes)
+            return retryable
+        finally:
+            executor.shutdown(wait=True)
+            for worker in workers:
+                close = getattr(worker, 'close', None)
+                if close:
+                    close()
+
+
+    async def run(self) -> Dict[str, int]:
+        '''
+        Run all jobs concurrently and return counts of links, skipped (already stored),
+        scraped, empty (no article found), failed and saved articles.
+        '''
+        try:
+            retryable = await asyncio.gather(*(self._run_job(job) for job in self.jobs))
+        finally:
+            batch = self._flush()
+            if batch:
+                await asyncio.to_thread(self._save, batch)
+        for job, job_retryable in zip(self.jobs, retryable):
+            if job.on_complete:
+                await asyncio.to_thread(job.on_complete, job_retryable)
+        return self.stats
@@ -0,0 +1,210 @@
+import os
+import json
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+import pandas as pd
+
+from shared.database import Database
+from shared.schemas import FactCheckArticleContent, FactCheckArticlesSchema
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+from shared.agents.topic_classifier import TopicClassifierAgent
+from shared.agents.local_topic_classifier import LocalTopicClassifier
+from shared.agents.batch_runner import BatchResult
+
+
+DEFAULT_CHECKPOINT_DIR = Path(__file__).resolve().parent.parent.parent / '.checkpoints'
+
+
+class PipelineCheckpoint():
+    '''
+    Remembers the last article ID a pipeline has fully processed, stored as a small JSON file.
+    '''
+    def __init__(self, name: str, path: Optional[str] = None):
+        self.path = Path(path) if path else DEFAULT_CHECKPOINT_DIR / f'{name}.json'
+
+
+    def load(self) -> int:
+        if not self.path.exists():
+            return 0
+        with open(self.path, 'r') as f:
+            return json.load(f).get('last_id', 0)
+
+
+    def save(self, last_id: int):
+        # Write to a temp file first so a crash never leaves a half-written checkpoint
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'last_id': last_id}, f)
+        os.replace(tmp_path, self.path)
+
+
+    def clear(self):
+        if self.path.exists():
+            self.path.unlink()
+
+
+class TopicClassificationPipeline():
+    '''
+    Classifies articles without a topic, or whose content changed since they were classified,
+    directly from and into the database.
+
+    Articles are read in keyset-paginated chunks (WHERE (topic IS NULL OR classified_hash
+    IS DISTINCT FROM content_hash) AND id > last_id), classified concurrently with
+    TopicClassifierAgent.run_many() and written back with one bulk UPDATE per chunk, together
+    with the content_hash they were classified on. After each chunk the last ID is checkpointed,
+    so a crashed run resumes where it stopped. Articles that failed to classify keep their
+    previous topic and hash and are picked up again by the next full pass. No transaction is
+    held open while the LLM runs.
+
+    With a local_classifier, each chunk is first labelled locally in one vectorized call and
+    only the articles below its confidence threshold are sent to the LLM. Every written topic
+    records its topic_source ('local' or 'llm'), so retraining can leave the local labels out. With
+    pack_request_tokens, the LLM articles are packed several per request up to that token budget.
+    '''
+    def __init__(
+        self,
+        db: Database,
+        classifier_agent: TopicClassifierAgent,
+        chunk_size: int = 100,
+        include_stale: bool = False,
+        include_changed: bool = True,
+        max_concurrency: int = 5,
+        requests_per_minute: Optional[float] = None,
+        checkpoint: Optional[PipelineCheckpoint] = None,
+        export_csv: Optional[str] = None,
+        local_classifier: Optional[LocalTopicClassifier] = None,
+        pack_request_tokens: Optional[int] = None
+    ):
+        self.db = db
+        self.classifier_agent = classifier_agent
+        self.local_classifier = local_classifier
+        self.chunk_size = chunk_size
+        self.include_stale = include_stale
+        self.include_changed = include_changed
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.checkpoint = checkpoint if checkpoint else PipelineCheckpoint('topic_classification')
+        self.export_csv = export_csv
+        self.pack_request_tokens = pack_request_tokens
+
+
+    def _fetch_chunk(self, after_id: int, limit: int) -> List[FactCheckArticlesSchema]:
+        with self.db.get_session() as session:
+            service = FactCheckArticlesService(session)
+            return service.get_articles_to_classify(
+                after_id=after_id,
+                limit=limit,
+                include_stale=self.include_stale,
+                include_changed=self.include_changed
+            )
+
+
+    def _write_topics(self, topics: Dict[int, str], sources: Dict[int, str], content_hashes: Dict[int, Optional[str]]) -> int:
+        if not topics:
+            return 0
+        with self.db.get_session() as session:
+            service = FactCheckArticlesService(session)
+            # Record the content the topic was classified on, so only later changes re-classify it
+            return service.bulk_update_articles({
+                article_id: {'topic': topic, 'topic_source': sources[article_id], 'classified_hash': content_hashes[article_id]}
+                for article_id, topic in topics.items()
+            })
+
+
+    def _export_chunk(self, articles: List[FactCheckArticlesSchema], topics: Dict[int, str], sources: Dict[int, str]):
+        '''
+        Append the classified articles of a chunk to the optional CSV export,
+        using the same columns as build_topic_classification_csv.py.
+        '''
+        rows = []
+        for article in articles:
+            if article.id not in topics:
+                continue
+            row: Dict[str, Any] = article.model_dump(mode='json')
+            row['body'] = json.dumps(row['body']) if row['body'] else None
+            row['entities'] = json.dumps(row['entities']) if row['entities'] else None
+            row['topic'] = topics[article.id]
+            row['topic_source'] = sources[article.id]
+            rows.append(row)
+        if rows:
+            write_header = not os.path.exists(self.export_csv)
+            pd.DataFrame(rows).to_csv(self.export_csv, mode='a', header=write_header, index=False)
+
+
+    async def run(self, max_articles: Optional[int] = None, restart: bool = False) -> Dict[str, int]:
+        '''
+        Run the pipeline until no unclassified articles are left or max_articles were processed.
+        Returns counts of processed, classified (locally and by the LLM) and failed articles.
+        '''
+        if restart:
+            self.checkpoint.clear()
+        after_id = self.checkpoint.load()
+        if after_id:
+            print(f"Resuming after article ID {after_id}.")
+        stats = {'processed': 0, 'classified': 0, 'local': 0, 'llm': 0, 'failed': 0}
+
+        while max_articles is None or stats['processed'] < max_articles:
+            limit = self.chunk_size
+            if max_articles is not None:
+                limit = min(limit, max_articles - stats['processed'])
+            articles = self._fetch_chunk(after_id, limit)
+            if not articles:
+                # A full pass is done, the next run starts from the beginning again
+                self.checkpoint.clear()
+                break
+
+            contents = [FactCheckArticleContent.from_article(article) for article in articles]
+            topics = {}
+            sources = {}
+            llm_articles, llm_contents = articles, contents
+            if self.local_classifier:
+                llm_articles, llm_contents = [], []
+                predictions = self.local_classifier.predict(contents)
+                for article, content, (topic, confidence) in zip(articles, contents, predictions):
+                    if self.local_classifier.is_confident(confidence):
+                        topics[article.id] = topic
+                        sources[article.id] = 'local'
+                    else:
+                        llm_articles.append(article)
+                        llm_contents.append(content)
+                stats['local'] += len(topics)
+
+            batch_results: List[BatchResult] = []
+            if llm_contents and self.pack_request_tokens:
+                batch_results = await self.classifier_agent.run_many_packed(
+                    llm_contents,
+                    max_request_tokens=self.pack_request_tokens,
+                    max_concurrency=self.max_concurrency,
+                    requests_per_minute=self.requests_per_minute
+                )
+            elif llm_contents:
+                batch_results = await self.classifier_agent.run_many(
+                    llm_contents,
+                    max_concurrency=self.max_concurrency,
+                    requests_per_minute=self.requests_per_minute
+                )
+            for article, result in zip(llm_articles, batch_results):
+                if result.ok:
+                    topics[article.id] = result.output.topic_label
+                    sources[article.id] = 'llm'
+                    stats['llm'] += 1
+                else:
+                    print(f"  ❌ Error classifying article {article.id}: {result.error}")
+
+            self._write_topics(topics, sources, {article.id: article.content_hash for article in articles})
+            if self.export_csv:
+                self._export_chunk(articles, topics, sources)
+            after_id = articles[-1].id
+            self.checkpoint.save(after_id)
+
+            stats['processed'] += len(articles)
+            stats['classified'] += len(topics)
+            stats['failed'] += len(articles) - len(topics)
+            print(
+                f"Classified {stats['classified']}/{stats['processed']} articles, {stats['local']} locally "
+                f"(up to ID {after_id})."
+            )
+
+        return stats
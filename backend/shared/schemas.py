@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any, Literal, Union
+from typing import List, Optional, Dict, Any, Literal, Union, get_args
 import datetime
 
 
@@ -34,9 +34,12 @@ class FactCheckArticlesSchema(BaseModel):
     image_url: Optional[str] = None
     published_at: Optional[datetime.datetime] = None
     topic: Optional[str] = None
+    topic_source: Optional[str] = None
     claim: Optional[str] = None
     instrumentalizer: Optional[str] = None
     entities: Optional[List[Dict[str, Any]]] = None
+    content_hash: Optional[str] = None
+    classified_hash: Optional[str] = None
     last_updated: datetime.datetime = None
 
     @classmethod
@@ -66,6 +69,42 @@ class FactCheckArticlesSchema(BaseModel):
         from_attributes = True
 
 
+class FactCheckArticleSummarySchema(BaseModel):
+    '''
+    Lightweight version of FactCheckArticlesSchema for article lists. Leaves out the
+    body and entities JSONB columns, which are only needed on the detail view.
+    '''
+    id: int
+    url: str
+    medium: Optional[str] = None
+    kicker: Optional[str] = None
+    headline: Optional[str] = None
+    teaser: Optional[str] = None
+    image_url: Optional[str] = None
+    published_at: Optional[datetime.datetime] = None
+    topic: Optional[str] = None
+    claim: Optional[str] = None
+    instrumentalizer: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class CrawlStateSchema(BaseModel):
+    '''
+    Equivalent to the crawl_states db schema
+    '''
+    medium: str
+    last_published_at: Optional[datetime.datetime] = None
+    last_item_id: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    last_crawled_at: Optional[datetime.datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class FactCheckArticleContent(BaseModel):
     '''
     This is what is passed into the LLM to determine the topic of an article.
@@ -75,6 +114,18 @@ class FactCheckArticleContent(BaseModel):
     teaser: Optional[str] = None
     body: List[BodyBlock]
 
+    @classmethod
+    def from_article(cls, article: Any) -> 'FactCheckArticleContent':
+        '''
+        Build the LLM input from an article row (ORM object or FactCheckArticlesSchema).
+        '''
+        return cls(
+            kicker=article.kicker if article.kicker else "",
+            headline=article.headline if article.headline else "",
+            teaser=article.teaser if article.teaser else "",
+            body=article.body if article.body else []
+        )
+
 
 class LLMGeneratedTopic(BaseModel):
     '''
@@ -105,6 +156,44 @@ class Topic(BaseModel):
     ]
 
 
+# All valid Axis-1 labels, e.g. to tell real topics apart from error markers in the topic column
+TOPIC_LABELS = get_args(Topic.model_fields['topic_label'].annotation)
+
+
+class Entity(BaseModel):
+    '''
+    An entity that is part of the fact-checked claim (Axis 4), stored in the entities column.
+    '''
+    name: str
+    type: Literal['person', 'organization', 'country', 'institution', 'other']
+
+
+class ArticleAxes(Topic):
+    '''
+    All four axes of an article from one LLM call by the AxisExtractor: the topic label
+    (Axis 1), the fact-checked claim (Axis 2), the instrumentalizer (Axis 3) and the
+    entities of the claim (Axis 4).
+    '''
+    claim: str
+    instrumentalizer: str
+    entities: List[Entity]
+
+    def to_columns(self) -> Dict[str, Any]:
+        '''
+        The axes as values of the topic, claim, instrumentalizer and entities columns.
+        '''
+        return {
+            'topic': self.topic_label,
+            'claim': self.claim,
+            'instrumentalizer': self.instrumentalizer,
+            'entities': [entity.model_dump() for entity in self.entities],
+        }
+
+
+# The columns filled by the AxisExtractor
+AXIS_COLUMNS = ('topic', 'claim', 'instrumentalizer', 'entities')
+
+
 ##################
 ## API Schemas ##
 ##################
@@ -114,4 +203,32 @@ class TopicCount(BaseModel):
     Schema for returning topic counts via API.
     '''
     topic: str
-    count: int
\ No newline at end of file
+    count: int
+
+
+class PublicationFrequency(BaseModel):
+    '''
+    Schema for returning the number of articles published per period via API.
+    topic is only set when the histogram is grouped by topic.
+    '''
+    period: datetime.datetime
+    medium: Optional[str] = None
+    topic: Optional[str] = None
+    count: int
+
+
+class SimilarArticle(FactCheckArticleSummarySchema):
+    '''
+    An article found by /similar or /search, with the cosine similarity (1 = same direction)
+    of its embedding to the source article or the query.
+    '''
+    similarity: float
+
+
+class ArticlePage(BaseModel):
+    '''
+    One page of an article listing. Pass next_cursor as cursor to get the following page,
+    it is None on the last page.
+    '''
+    items: Union[List[FactCheckArticleSummarySchema], List[FactCheckArticlesSchema]]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,159 @@
+import sys
+from pathlib import Path
+import datetime
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from shared.schemas import FactCheckArticleSummarySchema, SimilarArticle
+from shared.models import ArticleEmbedding, FactCheckArticles
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+from shared.embeddings import embedding_text, text_hash
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from sqlalchemy import func, text
+from sqlalchemy.orm import load_only
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+
+class ArticleEmbeddingsService():
+    '''
+    Service for handling operations on the ArticleEmbedding table: finding articles whose
+    embedding is missing or outdated, storing embeddings and nearest-neighbour queries.
+    '''
+
+    def __init__(self, db_session):
+        '''Initialize with a database session.'''
+        self.db_session = db_session
+
+
+    def get_texts_to_embed(
+        self,
+        model: str,
+        after_id: int = 0,
+        limit: int = 1000
+    ) -> Tuple[List[Tuple[int, str]], Optional[int]]:
+        '''
+        Scan the next chunk of articles in ID order after after_id and return the (id, text)
+        pairs whose text has no embedding yet, or changed or was encoded with another model
+        since, together with the last scanned ID (None when the scan is done). Only the
+        headline, teaser and claim columns are read.
+        '''
+        rows = (
+            self.db_session.query(
+                FactCheckArticles.id, FactCheckArticles.headline, FactCheckArticles.teaser, FactCheckArticles.claim,
+                ArticleEmbedding.model, ArticleEmbedding.text_hash
+            )
+            .outerjoin(ArticleEmbedding, ArticleEmbedding.article_id == FactCheckArticles.id)
+            .filter(FactCheckArticles.id > after_id)
+            .order_by(FactCheckArticles.id)
+            .limit(limit)
+            .all()
+        )
+        if not rows:
+            return [], None
+        to_embed = []
+        for row in rows:
+            article_text = embedding_text(row)
+            if article_text and (row.model != model or row.text_hash != text_hash(article_text)):
+                to_embed.append((row.id, article_text))
+        return to_embed, rows[-1].id
+
+
+    def save_embeddings(
+        self,
+        model: str,
+        article_ids: Sequence[int],
+        texts: Sequence[str],
+        vectors: np.ndarray,
+        chunk_size: int = 500
+    ) -> int:
+        '''
+        Insert or replace the embeddings of the given articles in one transaction.
+        Returns the number of stored embeddings.
+        '''
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        rows = [
+            {'article_id': article_id, 'model': model, 'text_hash': text_hash(article_text), 'embedding': vector, 'created_at': now}
+            for article_id, article_text, vector in zip(article_ids, texts, vectors)
+        ]
+        for start in range(0, len(rows), chunk_size):
+            statement = pg_insert(ArticleEmbedding).values(rows[start:start + chunk_size])
+            statement = statement.on_conflict_do_update(
+                index_elements=[ArticleEmbedding.article_id],
+                set_={key: statement.excluded[key] for key in ('model', 'text_hash', 'embedding', 'created_at')}
+            )
+            self.db_session.execute(statement)
+        if rows:
+            # /similar and /search responses are cached per data version
+            FactCheckArticlesService(self.db_session).bump_data_version()
+        self.db_session.commit()
+        return len(rows)
+
+
+    def get_embedding(self, article_id: int, model: str) -> Optional[np.ndarray]:
+        embedding = self.db_session.query(ArticleEmbedding.embedding).filter(
+            ArticleEmbedding.article_id == article_id,
+            ArticleEmbedding.model == model
+        ).scalar()
+        return np.asarray(embedding, dtype=np.float32) if embedding is not None else None
+
+
+    def get_nearest_articles(
+        self,
+        vector: np.ndarray,
+        model: str,
+        limit: int = 10,
+        medium: Optional[str] = None,
+        exclude_medium: Optional[str] = None,
+        exclude_article_id: Optional[int] = None
+    ) -> List[SimilarArticle]:
+        '''
+        Return the articles whose embeddings are closest to vector by cosine distance, most
+        similar first, optionally restricted to a medium or leaving one out. Uses the HNSW
+        index; ef_search is raised with the limit so filtered queries still fill the page.
+        '''
+        self.db_session.execute(text(f'SET LOCAL hnsw.ef_search = {max(100, 4 * limit)}'))
+        distance = ArticleEmbedding.embedding.cosine_distance(vector)
+        query = (
+            self.db_session.query(FactCheckArticles, distance.label('distance'))
+            .join(ArticleEmbedding, ArticleEmbedding.article_id == FactCheckArticles.id)
+            .options(load_only(*(getattr(FactCheckArticles, name) for name in FactCheckArticleSummarySchema.model_fields)))
+            .filter(ArticleEmbedding.model == model)
+        )
+        if medium:
+            query = query.filter(FactCheckArticles.medium == medium)
+        if exclude_medium:
+            query = query.filter(func.coalesce(FactCheckArticles.medium, '') != exclude_medium)
+        if exclude_article_id is not None:
+            query = query.filter(FactCheckArticles.id != exclude_article_id)
+        rows = query.order_by(distance).limit(limit).all()
+        return [
+            SimilarArticle(
+                **FactCheckArticleSummarySchema.model_validate(article).model_dump(),
+                similarity=1 - float(distance_value)
+            )
+            for article, distance_value in rows
+        ]
+
+
+    def get_similar_articles(
+        self,
+        article_id: int,
+        model: str,
+        limit: int = 10,
+        other_media_only: bool = False
+    ) -> Optional[List[SimilarArticle]]:
+        '''
+        Return the articles most similar to an article, e.g. fact-checks of the same claim by
+        other outlets with other_media_only. None if the article has no embedding.
+        '''
+        vector = self.get_embedding(article_id, model)
+        if vector is None:
+            return None
+        exclude_medium = None
+        if other_media_only:
+            exclude_medium = self.db_session.query(FactCheckArticles.medium).filter(FactCheckArticles.id == article_id).scalar() or ''
+        return self.get_nearest_articles(
+            vector, model, limit=limit, exclude_medium=exclude_medium, exclude_article_id=article_id
+        )
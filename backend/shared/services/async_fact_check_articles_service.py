@@ -0,0 +1,182 @@
+import sys
+from pathlib import Path
+import datetime
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from shared.schemas import (
+    FactCheckArticlesSchema, FactCheckArticleSummarySchema, ArticlePage, TopicCount, PublicationFrequency, SimilarArticle
+)
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+from shared.services.article_embeddings_service import ArticleEmbeddingsService
+from typing import AsyncIterator, List, Optional, Sequence, Union
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AsyncFactCheckArticlesService():
+    '''
+    Async read access to the FactCheckArticles table for the API.
+
+    Every method runs the corresponding FactCheckArticlesService (or, for similarity
+    queries, ArticleEmbeddingsService) method through
+    AsyncSession.run_sync, so the queries are defined once and the database I/O
+    does not block the event loop.
+    '''
+
+    def __init__(self, db_session: AsyncSession):
+        '''Initialize with an async database session.'''
+        self.db_session = db_session
+
+
+    async def get_article(self, article_id: int) -> Optional[FactCheckArticlesSchema]:
+        '''Retrieve a FactCheckArticle by ID.'''
+        def get_article(session) -> Optional[FactCheckArticlesSchema]:
+            article = FactCheckArticlesService(session).get_article(article_id)
+            return FactCheckArticlesSchema.model_validate(article) if article else None
+        return await self.db_session.run_sync(get_article)
+
+
+    async def get_articles(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        medium: Optional[str] = None,
+        topic: Optional[str] = None,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+        summary: bool = False
+    ) -> Union[List[FactCheckArticlesSchema], List[FactCheckArticleSummarySchema]]:
+        '''See FactCheckArticlesService.get_articles.'''
+        return await self.db_session.run_sync(lambda session: FactCheckArticlesService(session).get_articles(
+            limit=limit,
+            offset=offset,
+            medium=medium,
+            topic=topic,
+            published_after=published_after,
+            published_before=published_before,
+            fields=fields,
+            summary=summary
+        ))
+
+
+    async def get_articles_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        medium: Optional[str] = None,
+        topic: Optional[str] = None,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+        summary: bool = False
+    ) -> ArticlePage:
+        '''See FactCheckArticlesService.get_articles_page.'''
+        return await self.db_session.run_sync(lambda session: FactCheckArticlesService(session).get_articles_page(
+            limit=limit,
+            cursor=cursor,
+            medium=medium,
+            topic=topic,
+            published_after=published_after,
+            published_before=published_before,
+            fields=fields,
+            summary=summary
+        ))
+
+
+    async def stream_articles(
+        self,
+        medium: Optional[str] = None,
+        topic: Optional[str] = None,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+        summary: bool = False,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Union[FactCheckArticlesSchema, FactCheckArticleSummarySchema]]:
+        '''
+        Async counterpart of FactCheckArticlesService.iter_articles, streams the matching
+        articles in id order through a server-side cursor, batch_size rows at a time.
+        '''
+        service = FactCheckArticlesService(self.db_session.sync_session)
+        statement, columns = service.export_statement(medium, topic, published_after, published_before, fields, summary)
+        result = await self.db_session.stream_scalars(statement.execution_options(yield_per=batch_size))
+        async for articles in result.partitions():
+            for article in service._to_schemas(articles, columns, summary):
+                yield article
+
+
+    async def get_topic_counts_by_period(
+        self,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        medium: Optional[str] = None
+    ) -> List[TopicCount]:
+        '''See FactCheckArticlesService.get_topic_counts_by_period.'''
+        return await self.db_session.run_sync(lambda session: FactCheckArticlesService(session).get_topic_counts_by_period(
+            published_after=published_after,
+            published_before=published_before,
+            medium=medium
+        ))
+
+
+    async def get_publication_histogram(
+        self,
+        interval: str = 'week',
+        medium: Optional[str] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+        group_by_topic: bool = False
+    ) -> List[PublicationFrequency]:
+        '''See FactCheckArticlesService.get_publication_histogram.'''
+        return await self.db_session.run_sync(lambda session: FactCheckArticlesService(session).get_publication_histogram(
+            interval=interval,
+            medium=medium,
+            start=start,
+            end=end,
+            group_by_topic=group_by_topic
+        ))
+
+
+    async def get_missing_urls(self, urls: List[str]) -> List[str]:
+        '''See FactCheckArticlesService.get_missing_urls.'''
+        return await self.db_session.run_sync(lambda session: FactCheckArticlesService(session).get_missing_urls(urls))
+
+
+    async def get_data_version(self) -> int:
+        '''See FactCheckArticlesService.get_data_version.'''
+        return await self.db_session.run_sync(lambda session: FactCheckArticlesService(session).get_data_version())
+
+
+    async def get_similar_articles(
+        self,
+        article_id: int,
+        model: str,
+        limit: int = 10,
+        other_media_only: bool = False
+    ) -> Optional[List[SimilarArticle]]:
+        '''See ArticleEmbeddingsService.get_similar_articles.'''
+        return await self.db_session.run_sync(lambda session: ArticleEmbeddingsService(session).get_similar_articles(
+            article_id,
+            model,
+            limit=limit,
+            other_media_only=other_media_only
+        ))
+
+
+    async def get_nearest_articles(
+        self,
+        vector: np.ndarray,
+        model: str,
+        limit: int = 10,
+        medium: Optional[str] = None
+    ) -> List[SimilarArticle]:
+        '''See ArticleEmbeddingsService.get_nearest_articles.'''
+        return await self.db_session.run_sync(lambda session: ArticleEmbeddingsService(session).get_nearest_articles(
+            vector,
+            model,
+            limit=limit,
+            medium=medium
+        ))
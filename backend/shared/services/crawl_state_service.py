@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+import datetime
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from shared.schemas import CrawlStateSchema
+from shared.models import CrawlState
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+
+class CrawlStateService():
+    '''
+    Service for handling operations on the CrawlState table.
+    '''
+
+    def __init__(self, db_session):
+        '''Initialize with a database session.'''
+        self.db_session = db_session
+
+
+    def get_state(self, medium: str) -> CrawlStateSchema:
+        '''
+        Return the crawl state of a medium, an empty state if it was never crawled.
+        '''
+        state = self.db_session.query(CrawlState).filter(CrawlState.medium == medium).first()
+        if not state:
+            return CrawlStateSchema(medium=medium)
+        return CrawlStateSchema.model_validate(state)
+
+
+    def save_state(self, state: CrawlStateSchema):
+        '''
+        Insert or replace the crawl state of a medium.
+        '''
+        values = state.model_dump()
+        values['last_crawled_at'] = values['last_crawled_at'] or datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        statement = pg_insert(CrawlState).values(**values).on_conflict_do_update(
+            index_elements=[CrawlState.medium],
+            set_={name: value for name, value in values.items() if name != 'medium'}
+        )
+        self.db_session.execute(statement)
+        self.db_session.commit()
+
+
+    def reset_state(self, medium: str):
+        '''
+        Forget the crawl state of a medium, the next crawl reads its whole feed again.
+        '''
+        self.db_session.query(CrawlState).filter(CrawlState.medium == medium).delete()
+        self.db_session.commit()
@@ -1,14 +1,58 @@
 import sys
 from pathlib import Path
 import datetime
+import base64
+import hashlib
+import json
 
 project_root = str(Path(__file__).parent.parent)
 sys.path.append(project_root)
 
-from shared.schemas import FactCheckArticlesSchema, TopicCount
-from shared.models import FactCheckArticles
-from typing import List, Dict, Any, Optional
-from sqlalchemy import func
+from shared.schemas import (
+    FactCheckArticlesSchema, FactCheckArticleSummarySchema, ArticlePage, TopicCount, PublicationFrequency, TOPIC_LABELS, AXIS_COLUMNS
+)
+from shared.models import FactCheckArticles, TopicCountRollup, DataVersion
+from typing import List, Dict, Any, Iterator, Optional, Mapping, Sequence, Tuple, Union
+from sqlalchemy import func, or_, and_, tuple_, cast, select, insert, update, values, column, literal_column, text, Date, Integer
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+
+PUBLICATION_INTERVALS = ('day', 'week', 'month')
+# The fields content_hash is computed from
+CONTENT_FIELDS = ('headline', 'teaser', 'body')
+
+
+def encode_cursor(published_at: Optional[datetime.datetime], article_id: int) -> str:
+    '''
+    Encode the sort key of the last article of a page into an opaque, URL-safe cursor.
+    '''
+    payload = {'p': published_at.isoformat() if published_at else None, 'i': article_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime.datetime], int]:
+    '''
+    Decode a cursor created by encode_cursor. Raises ValueError for malformed cursors.
+    '''
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        published_at = datetime.datetime.fromisoformat(payload['p']) if payload['p'] else None
+        return published_at, int(payload['i'])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f'Invalid cursor: {cursor}') from e
+
+
+def compute_content_hash(headline: Optional[str], teaser: Optional[str], body: Optional[Sequence[Any]]) -> str:
+    '''
+    SHA-256 over the canonical JSON of headline, teaser and body blocks (models or dicts),
+    so the hash of a scraped article matches the hash of the same article read from the database.
+    '''
+    blocks = [block.model_dump() if hasattr(block, 'model_dump') else block for block in body or []]
+    payload = json.dumps([headline, teaser, blocks], ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
 
 
 class FactCheckArticlesService():
@@ -39,10 +83,33 @@ class FactCheckArticlesService():
                 continue
             if hasattr(article, key):
                 setattr(article, key, value)
+        if any(key in update_data for key in CONTENT_FIELDS):
+            article.content_hash = compute_content_hash(article.headline, article.teaser, article.body)
+        self.bump_data_version()
         self.db_session.commit()
         return article
 
 
+    def get_data_version(self) -> int:
+        '''
+        Return the current data version, which changes whenever articles are written.
+        '''
+        version = self.db_session.query(DataVersion.version).filter(DataVersion.id == 1).scalar()
+        return version or 0
+
+
+    def bump_data_version(self):
+        '''
+        Increment the data version as part of the current transaction.
+        Called by every method that writes articles.
+        '''
+        statement = pg_insert(DataVersion).values(id=1, version=1).on_conflict_do_update(
+            index_elements=[DataVersion.id],
+            set_={'version': DataVersion.version + 1}
+        )
+        self.db_session.execute(statement)
+
+
     def delete_article(self, article_id: int) -> bool:
         '''Delete a FactCheckArticle by ID.'''
         pass
@@ -56,11 +123,125 @@ class FactCheckArticlesService():
         topic: Optional[str] = None,
         published_after: Optional[datetime.datetime] = None,
         published_before: Optional[datetime.datetime] = None,
-    ) -> List[FactCheckArticlesSchema]:
+        fields: Optional[Sequence[str]] = None,
+        summary: bool = False
+    ) -> Union[List[FactCheckArticlesSchema], List[FactCheckArticleSummarySchema]]:
         '''
         Retrieve articles with optional filtering by medium, topic, and published_at date range, with pagination.
+        With summary=True only the columns of FactCheckArticleSummarySchema are selected and summaries
+        are returned. With fields, only those columns (plus id) are selected and all other fields of
+        the returned schemas are left empty. Columns that are not requested are never fetched.
+        '''
+        columns = self._resolve_columns(fields, summary)
+        query = self.db_session.query(FactCheckArticles)
+        if columns:
+            query = query.options(load_only(*(getattr(FactCheckArticles, name) for name in columns)))
+        query = self._filter_articles(query, medium, topic, published_after, published_before)
+        articles = query.order_by(FactCheckArticles.id).offset(offset).limit(limit).all()
+        return self._to_schemas(articles, columns, summary)
+
+
+    def get_articles_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        medium: Optional[str] = None,
+        topic: Optional[str] = None,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+        summary: bool = False
+    ) -> ArticlePage:
         '''
+        Retrieve one page of articles, newest first, with the same filters as get_articles.
+        Uses keyset pagination on (published_at, id) instead of OFFSET, so every page costs
+        the same no matter how deep it is. Articles without published_at come last.
+        '''
+        columns = self._resolve_columns(fields, summary)
+        if columns:
+            for name in ('published_at', 'id'):
+                if name not in columns:
+                    columns.append(name)
         query = self.db_session.query(FactCheckArticles)
+        if columns:
+            query = query.options(load_only(*(getattr(FactCheckArticles, name) for name in columns)))
+        query = self._filter_articles(query, medium, topic, published_after, published_before)
+        if cursor:
+            last_published_at, last_id = decode_cursor(cursor)
+            if last_published_at is not None:
+                query = query.filter(or_(
+                    tuple_(FactCheckArticles.published_at, FactCheckArticles.id) < tuple_(last_published_at, last_id),
+                    FactCheckArticles.published_at.is_(None)
+                ))
+            else:
+                query = query.filter(and_(
+                    FactCheckArticles.published_at.is_(None),
+                    FactCheckArticles.id < last_id
+                ))
+        query = query.order_by(FactCheckArticles.published_at.desc().nulls_last(), FactCheckArticles.id.desc())
+        # Fetch one extra row to know whether there is a next page
+        articles = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(articles) > limit:
+            articles = articles[:limit]
+            next_cursor = encode_cursor(articles[-1].published_at, articles[-1].id)
+        return ArticlePage(items=self._to_schemas(articles, columns, summary), next_cursor=next_cursor)
+
+
+    def iter_articles(
+        self,
+        medium: Optional[str] = None,
+        topic: Optional[str] = None,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+        summary: bool = False,
+        batch_size: int = 1000
+    ) -> Iterator[Union[FactCheckArticlesSchema, FactCheckArticleSummarySchema]]:
+        '''
+        Stream all articles matching the get_articles filters in id order, for exports.
+        Rows are fetched batch_size at a time through a server-side cursor, so memory use
+        does not grow with the number of exported articles.
+        '''
+        statement, columns = self.export_statement(medium, topic, published_after, published_before, fields, summary)
+        result = self.db_session.execute(statement.execution_options(yield_per=batch_size)).scalars()
+        for articles in result.partitions():
+            yield from self._to_schemas(articles, columns, summary)
+
+
+    def export_statement(
+        self,
+        medium: Optional[str] = None,
+        topic: Optional[str] = None,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+        summary: bool = False
+    ) -> Tuple[Select, Optional[List[str]]]:
+        '''
+        Build the select behind iter_articles, together with the loaded columns.
+        Shared with the async service, which streams it with AsyncSession.stream_scalars.
+        '''
+        columns = self._resolve_columns(fields, summary)
+        statement = select(FactCheckArticles)
+        if columns:
+            statement = statement.options(load_only(*(getattr(FactCheckArticles, name) for name in columns)))
+        statement = self._filter_articles(statement, medium, topic, published_after, published_before)
+        return statement.order_by(FactCheckArticles.id), columns
+
+
+    def _filter_articles(
+        self,
+        query,
+        medium: Optional[str] = None,
+        topic: Optional[str] = None,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None
+    ):
+        '''
+        Apply the medium, topic and published_at range filters shared by the listing methods,
+        to either a Query or a select.
+        '''
         if medium:
             query = query.filter(FactCheckArticles.medium == medium)
         if topic:
@@ -69,37 +250,141 @@ class FactCheckArticlesService():
             query = query.filter(FactCheckArticles.published_at >= published_after)
         if published_before:
             query = query.filter(FactCheckArticles.published_at <= published_before)
-        articles = query.order_by(FactCheckArticles.id).offset(offset).limit(limit).all()
-        return [FactCheckArticlesSchema.from_orm(article) for article in articles]
+        return query
+
+
+    def _resolve_columns(self, fields: Optional[Sequence[str]], summary: bool) -> Optional[List[str]]:
+        '''
+        Return the column names to load for a fields/summary selection, or None for full rows.
+        '''
+        if summary:
+            return list(FactCheckArticleSummarySchema.model_fields)
+        if not fields:
+            return None
+        table_columns = FactCheckArticles.__table__.c
+        unknown = [name for name in fields if name not in table_columns]
+        if unknown:
+            raise ValueError(f"Unknown article fields: {', '.join(unknown)}")
+        return ['id'] + [name for name in fields if name != 'id']
+
+
+    def _to_schemas(
+        self,
+        articles: List[FactCheckArticles],
+        columns: Optional[List[str]],
+        summary: bool
+    ) -> Union[List[FactCheckArticlesSchema], List[FactCheckArticleSummarySchema]]:
+        if summary:
+            return [FactCheckArticleSummarySchema.model_validate(article) for article in articles]
+        if columns:
+            # Only read the loaded attributes, touching a deferred one would trigger a lazy load per row
+            return [
+                FactCheckArticlesSchema(**{name: getattr(article, name) for name in columns})
+                for article in articles
+            ]
+        return [FactCheckArticlesSchema.model_validate(article) for article in articles]
 
 
-    def save_articles(self, articles: List[FactCheckArticlesSchema]):
+    def save_articles(self, articles: List[FactCheckArticlesSchema]) -> Dict[str, int]:
         '''
         Bulk insert a list of FactCheckArticlesSchema objects into the database,
-        skipping articles whose URLs already exist.
+        skipping articles whose URLs already exist. See upsert_articles for the counts returned.
         '''
-        urls = [article.url for article in articles if article.url]
-        existing_urls = set(
-            url for (url,) in self.db_session.query(FactCheckArticles.url)
-            .filter(FactCheckArticles.url.in_(urls))
-            .all()
-        )
-        new_articles = [article for article in articles if article.url not in existing_urls]
-        article_objs = [FactCheckArticles(**article.model_dump(exclude_unset=True)) for article in new_articles]
-        self.db_session.bulk_save_objects(article_objs)
+        return self.upsert_articles(articles, update_existing=False)
+
+
+    def upsert_articles(
+        self,
+        articles: List[FactCheckArticlesSchema],
+        update_existing: bool = True,
+        chunk_size: int = 500
+    ) -> Dict[str, int]:
+        '''
+        Insert articles and, with update_existing, refresh the stored articles with the same URL,
+        using INSERT ... ON CONFLICT on constraint_fact_check_articles. Safe against concurrent
+        writers: a URL inserted in the meantime is updated or skipped instead of failing the batch.
+
+        Only the fields set on an article are written, so a re-scrape does not clear the
+        classification columns. content_hash is computed here from headline, teaser and body;
+        a stored article whose hash and other written fields are unchanged is not touched.
+
+        Articles are grouped by their set of fields and written in chunks of chunk_size rows
+        per statement, all in one transaction. Returns the counts of inserted, updated and
+        skipped articles; skipped are articles without a URL, repeated URLs within the batch
+        (the last one wins) and stored articles that are unchanged or, without update_existing,
+        exist at all.
+        '''
+        table = FactCheckArticles.__table__
+        counts = {'inserted': 0, 'updated': 0, 'skipped': 0}
+        rows_by_url: Dict[str, Dict[str, Any]] = {}
+        for article in articles:
+            if not article.url:
+                counts['skipped'] += 1
+                continue
+            if article.url in rows_by_url:
+                counts['skipped'] += 1
+            rows_by_url[article.url] = {
+                key: value for key, value in article.model_dump(exclude_unset=True).items()
+                if key not in ('id', 'last_updated', 'content_hash', 'classified_hash') and key in table.c
+            }
+            if any(key in rows_by_url[article.url] for key in CONTENT_FIELDS):
+                rows_by_url[article.url]['content_hash'] = compute_content_hash(article.headline, article.teaser, article.body)
+
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in rows_by_url.values():
+            row['last_updated'] = now
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        for columns, rows in groups.items():
+            update_columns = [key for key in columns if key not in ('url', 'last_updated')]
+            # The hash stands in for the content fields, so the JSONB body is never compared
+            compare_columns = [
+                key for key in update_columns if 'content_hash' not in columns or key not in CONTENT_FIELDS
+            ]
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                statement = pg_insert(FactCheckArticles).values(chunk)
+                if update_existing and update_columns:
+                    statement = statement.on_conflict_do_update(
+                        constraint='constraint_fact_check_articles',
+                        set_={key: statement.excluded[key] for key in (*update_columns, 'last_updated')},
+                        # Unchanged articles are skipped and keep their last_updated
+                        where=or_(*(table.c[key].is_distinct_from(statement.excluded[key]) for key in compare_columns))
+                    )
+                else:
+                    statement = statement.on_conflict_do_nothing(constraint='constraint_fact_check_articles')
+                # xmax is 0 for rows inserted by this statement, set for rows it updated
+                written = self.db_session.execute(
+                    statement.returning(literal_column('xmax = 0'))
+                ).scalars().all()
+                inserted = sum(1 for is_insert in written if is_insert)
+                counts['inserted'] += inserted
+                counts['updated'] += len(written) - inserted
+                counts['skipped'] += len(chunk) - len(written)
+
+        if counts['inserted'] or counts['updated']:
+            self.bump_data_version()
         self.db_session.commit()
+        return counts
 
 
     def get_topic_counts_by_period(
         self,
         published_after: Optional[datetime.datetime] = None,
         published_before: Optional[datetime.datetime] = None,
-        medium: Optional[str] = None
+        medium: Optional[str] = None,
+        use_rollup: bool = True
     ) -> List[TopicCount]:
         '''
         Retrieve a list of topic counts for a given time period and optional medium.
         Returns topics and their article counts, sorted by count descending.
+        Whole-day periods are answered from the daily topic_count_rollups table, so the cost
+        depends on the number of days and not on the number of articles. Periods that start
+        or end within a day fall back to counting the articles.
         '''
+        if use_rollup and self._rollup_covers(published_after, published_before):
+            return self._get_topic_counts_from_rollup(published_after, published_before, medium)
         query = self.db_session.query(FactCheckArticles.topic, func.count(FactCheckArticles.id))
         if published_after:
             query = query.filter(FactCheckArticles.published_at >= published_after)
@@ -109,11 +394,167 @@ class FactCheckArticlesService():
             query = query.filter(FactCheckArticles.medium == medium)
         query = query.filter(FactCheckArticles.topic.isnot(None))
         query = query.group_by(FactCheckArticles.topic)
-        query = query.order_by(func.count(FactCheckArticles.id).desc())
+        query = query.order_by(func.count(FactCheckArticles.id).desc(), FactCheckArticles.topic)
+        results = query.all()
+        return [TopicCount(topic=topic, count=count) for topic, count in results]
+
+
+    def _rollup_covers(
+        self,
+        published_after: Optional[datetime.datetime],
+        published_before: Optional[datetime.datetime]
+    ) -> bool:
+        '''
+        The rollup can only answer periods made of whole days: starting at midnight
+        and ending at the last second of a day (as the API sends them).
+        '''
+        starts_at_midnight = published_after is None or published_after.time() == datetime.time.min
+        ends_at_day_end = published_before is None or published_before.time() >= datetime.time(23, 59, 59)
+        return starts_at_midnight and ends_at_day_end
+
+
+    def _get_topic_counts_from_rollup(
+        self,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        medium: Optional[str] = None
+    ) -> List[TopicCount]:
+        total = func.sum(TopicCountRollup.count)
+        query = self.db_session.query(TopicCountRollup.topic, total)
+        if published_after:
+            query = query.filter(TopicCountRollup.day >= published_after.date())
+        if published_before:
+            query = query.filter(TopicCountRollup.day <= published_before.date())
+        if medium:
+            query = query.filter(TopicCountRollup.medium == medium)
+        query = query.group_by(TopicCountRollup.topic).having(total > 0)
+        query = query.order_by(total.desc(), TopicCountRollup.topic)
         results = query.all()
         return [TopicCount(topic=topic, count=count) for topic, count in results]
 
 
+    def check_topic_count_rollup(self) -> List[Dict[str, Any]]:
+        '''
+        Compare the rollup with counts computed from the articles, per day, medium and topic.
+        Returns one entry per mismatching bucket, an empty list means the rollup is consistent.
+        '''
+        day = cast(FactCheckArticles.published_at, Date)
+        raw_counts = {
+            (row_day, row_medium, row_topic): count
+            for row_day, row_medium, row_topic, count in (
+                self.db_session.query(day, FactCheckArticles.medium, FactCheckArticles.topic, func.count(FactCheckArticles.id))
+                .filter(FactCheckArticles.topic.isnot(None))
+                .group_by(day, FactCheckArticles.medium, FactCheckArticles.topic)
+                .all()
+            )
+        }
+        rollup_counts = {
+            (row_day, row_medium, row_topic): count
+            for row_day, row_medium, row_topic, count in (
+                self.db_session.query(TopicCountRollup.day, TopicCountRollup.medium, TopicCountRollup.topic, func.sum(TopicCountRollup.count))
+                .group_by(TopicCountRollup.day, TopicCountRollup.medium, TopicCountRollup.topic)
+                .all()
+            )
+            if count != 0
+        }
+        mismatches = []
+        for key in sorted(raw_counts.keys() | rollup_counts.keys(), key=str):
+            if raw_counts.get(key, 0) != rollup_counts.get(key, 0):
+                mismatches.append({
+                    'day': key[0],
+                    'medium': key[1],
+                    'topic': key[2],
+                    'article_count': raw_counts.get(key, 0),
+                    'rollup_count': rollup_counts.get(key, 0)
+                })
+        return mismatches
+
+
+    def rebuild_topic_count_rollup(self) -> int:
+        '''
+        Recompute the whole rollup from the articles in one transaction.
+        Writes to the articles wait until the rebuild is committed.
+        Returns the number of rollup rows.
+        '''
+        self.db_session.execute(text('LOCK TABLE fact_check_articles IN SHARE ROW EXCLUSIVE MODE'))
+        self.db_session.query(TopicCountRollup).delete(synchronize_session=False)
+        day = cast(FactCheckArticles.published_at, Date)
+        counts = (
+            select(day, FactCheckArticles.medium, FactCheckArticles.topic, func.count(FactCheckArticles.id))
+            .where(FactCheckArticles.topic.isnot(None))
+            .group_by(day, FactCheckArticles.medium, FactCheckArticles.topic)
+        )
+        result = self.db_session.execute(
+            insert(TopicCountRollup).from_select(['day', 'medium', 'topic', 'count'], counts)
+        )
+        self.db_session.commit()
+        return result.rowcount
+
+
+    def get_publication_histogram(
+        self,
+        interval: str = 'week',
+        medium: Optional[str] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+        group_by_topic: bool = False
+    ) -> List[PublicationFrequency]:
+        '''
+        Count published articles per day, week or month and medium (and optionally topic).
+        The bucketing and counting happen in Postgres with date_trunc + GROUP BY, so only
+        the aggregated rows are transferred. Articles without published_at are skipped.
+        '''
+        if interval not in PUBLICATION_INTERVALS:
+            raise ValueError(f"Invalid interval '{interval}', must be one of {PUBLICATION_INTERVALS}")
+        period = func.date_trunc(interval, FactCheckArticles.published_at).label('period')
+        group_columns = [period, FactCheckArticles.medium]
+        if group_by_topic:
+            group_columns.append(FactCheckArticles.topic)
+        query = self.db_session.query(*group_columns, func.count(FactCheckArticles.id))
+        query = query.filter(FactCheckArticles.published_at.isnot(None))
+        if medium:
+            query = query.filter(FactCheckArticles.medium == medium)
+        if start:
+            query = query.filter(FactCheckArticles.published_at >= start)
+        if end:
+            query = query.filter(FactCheckArticles.published_at <= end)
+        query = query.group_by(*group_columns).order_by(*group_columns)
+        results = query.all()
+        return [
+            PublicationFrequency(
+                period=row[0],
+                medium=row[1],
+                topic=row[2] if group_by_topic else None,
+                count=row[-1]
+            )
+            for row in results
+        ]
+
+
+    def get_published_at_range(self, medium: Optional[str] = None) -> Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]:
+        '''
+        Return the earliest and latest published_at, optionally for one medium.
+        '''
+        query = self.db_session.query(func.min(FactCheckArticles.published_at), func.max(FactCheckArticles.published_at))
+        if medium:
+            query = query.filter(FactCheckArticles.medium == medium)
+        earliest, latest = query.one()
+        return earliest, latest
+
+
+    def get_media(self) -> List[str]:
+        '''
+        Return the names of all media with at least one article, sorted.
+        '''
+        return [
+            medium for (medium,) in self.db_session.query(FactCheckArticles.medium)
+            .filter(FactCheckArticles.medium.isnot(None))
+            .distinct()
+            .order_by(FactCheckArticles.medium)
+            .all()
+        ]
+
+
     def get_missing_urls(self, urls: List[str]) -> List[str]:
         '''
         Given a list of URLs, return only those that are not already present in the database.
@@ -125,4 +566,108 @@ class FactCheckArticlesService():
             .filter(FactCheckArticles.url.in_(urls))
             .all()
         )
-        return [url for url in urls if url not in existing_urls]
\ No newline at end of file
+        return [url for url in urls if url not in existing_urls]
+
+
+    def get_articles_to_classify(
+        self,
+        after_id: int = 0,
+        limit: int = 100,
+        include_stale: bool = False,
+        include_changed: bool = True
+    ) -> List[FactCheckArticlesSchema]:
+        '''
+        Retrieve the next chunk of articles without a topic, ordered by ID and starting after after_id
+        (keyset pagination, so every chunk is an index range scan on the primary key).
+        With include_changed, articles whose content_hash differs from the classified_hash their
+        topic was classified at are returned as well. With include_stale, articles whose topic is
+        not one of the current Axis-1 labels (e.g. error markers or retired labels) are returned too.
+        '''
+        conditions = [FactCheckArticles.topic.is_(None)]
+        if include_changed:
+            conditions.append(FactCheckArticles.classified_hash.is_distinct_from(FactCheckArticles.content_hash))
+        if include_stale:
+            conditions.append(FactCheckArticles.topic.notin_(TOPIC_LABELS))
+        query = (
+            self.db_session.query(FactCheckArticles)
+            .filter(FactCheckArticles.id > after_id)
+            .filter(or_(*conditions))
+        )
+        articles = query.order_by(FactCheckArticles.id).limit(limit).all()
+        return [FactCheckArticlesSchema.model_validate(article) for article in articles]
+
+
+    def get_articles_to_extract(
+        self,
+        after_id: int = 0,
+        limit: int = 100,
+        include_changed: bool = False
+    ) -> List[FactCheckArticlesSchema]:
+        '''
+        Retrieve the next chunk of articles with at least one empty axis (topic, claim,
+        instrumentalizer or entities), ordered by ID and starting after after_id.
+        With include_changed, articles whose content changed since their topic was classified
+        are returned as well.
+        '''
+        conditions = [getattr(FactCheckArticles, axis).is_(None) for axis in AXIS_COLUMNS]
+        if include_changed:
+            conditions.append(FactCheckArticles.classified_hash.is_distinct_from(FactCheckArticles.content_hash))
+        query = (
+            self.db_session.query(FactCheckArticles)
+            .filter(FactCheckArticles.id > after_id)
+            .filter(or_(*conditions))
+        )
+        articles = query.order_by(FactCheckArticles.id).limit(limit).all()
+        return [FactCheckArticlesSchema.model_validate(article) for article in articles]
+
+
+    def bulk_update_articles(self, updates: Mapping[int, Dict[str, Any]], chunk_size: int = 1000) -> int:
+        '''
+        Apply column updates to many articles at once, given as {article_id: {column: value}}.
+        Articles are grouped by the set of columns they update and every chunk of a group is
+        written with a single UPDATE ... FROM (VALUES ...) statement in one transaction.
+        Like update_article, 'id' and unknown keys are ignored and a change of headline, teaser or
+        body also updates content_hash, computed from the new values and the stored values of the
+        other content fields. Returns the number of updated rows.
+        '''
+        table = FactCheckArticles.__table__
+        content_ids = [article_id for article_id, update_data in updates.items() if any(key in update_data for key in CONTENT_FIELDS)]
+        stored_content: Dict[int, Dict[str, Any]] = {}
+        for start in range(0, len(content_ids), chunk_size):
+            rows = (
+                self.db_session.query(FactCheckArticles.id, *(getattr(FactCheckArticles, key) for key in CONTENT_FIELDS))
+                .filter(FactCheckArticles.id.in_(content_ids[start:start + chunk_size]))
+                .all()
+            )
+            stored_content.update({row.id: {key: getattr(row, key) for key in CONTENT_FIELDS} for row in rows})
+
+        groups: Dict[tuple, List[tuple]] = {}
+        for article_id, update_data in updates.items():
+            if article_id in stored_content:
+                content = {**stored_content[article_id], **{key: update_data[key] for key in CONTENT_FIELDS if key in update_data}}
+                update_data = {**update_data, 'content_hash': compute_content_hash(content['headline'], content['teaser'], content['body'])}
+            columns = tuple(sorted(key for key in update_data if key != 'id' and key in table.c))
+            if columns:
+                groups.setdefault(columns, []).append(
+                    (article_id, *(update_data[key] for key in columns))
+                )
+
+        updated_count = 0
+        for columns, rows in groups.items():
+            for start in range(0, len(rows), chunk_size):
+                new_values = values(
+                    column('id', Integer),
+                    *(column(key, table.c[key].type) for key in columns),
+                    name='new_values'
+                ).data(rows[start:start + chunk_size])
+                statement = (
+                    update(FactCheckArticles)
+                    .where(FactCheckArticles.id == new_values.c.id)
+                    .values({key: new_values.c[key] for key in columns})
+                    .execution_options(synchronize_session=False)
+                )
+                updated_count += self.db_session.execute(statement).rowcount
+        if updated_count:
+            self.bump_data_version()
+        self.db_session.commit()
+        return updated_count
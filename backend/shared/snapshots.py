@@ -0,0 +1,166 @@
+import os
+import shutil
+import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+
+
+DEFAULT_SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / '.snapshots' / 'fact_check_articles'
+
+# Metadata and classification columns, body and entities stay in the database
+SNAPSHOT_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('url', pa.string()),
+    ('category', pa.string()),
+    ('author', pa.string()),
+    ('kicker', pa.string()),
+    ('headline', pa.string()),
+    ('teaser', pa.string()),
+    ('image_url', pa.string()),
+    ('published_at', pa.timestamp('us')),
+    ('topic', pa.string()),
+    ('claim', pa.string()),
+    ('instrumentalizer', pa.string()),
+    ('last_updated', pa.timestamp('us')),
+    ('month', pa.string()),
+    ('medium', pa.string()),
+])
+PARTITIONING = ds.partitioning(
+    pa.schema([('month', pa.string()), ('medium', pa.string())]),
+    flavor='hive'
+)
+
+
+class ArticleSnapshotStore():
+    '''
+    Columnar snapshot of the FactCheckArticles metadata as Parquet, partitioned by
+    publication month and medium (hive layout: month=2024-05/medium=correctiv/).
+
+    write() materializes the table from the database, load() reads it back with column
+    pruning and predicate pushdown, so readers only touch the partitions, row groups and
+    columns they need. Defaults to backend/.snapshots/fact_check_articles, override with
+    the SNAPSHOT_DIR environment variable.
+    '''
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or os.getenv('SNAPSHOT_DIR') or DEFAULT_SNAPSHOT_DIR)
+
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+
+    def write(self, db_session, batch_size: int = 5000) -> int:
+        '''
+        Materialize all articles into a fresh snapshot, streaming batch_size rows at a time.
+        The snapshot is written next to the current one and swapped in when complete, so
+        readers never see a partial snapshot. Returns the number of articles written.
+        '''
+        service = FactCheckArticlesService(db_session)
+        columns = [name for name in SNAPSHOT_SCHEMA.names if name != 'month']
+        articles = service.iter_articles(fields=columns, batch_size=batch_size)
+        written = 0
+
+        def batches() -> Iterator[pa.RecordBatch]:
+            nonlocal written
+            while True:
+                chunk = list(islice(articles, batch_size))
+                if not chunk:
+                    return
+                rows = [article.model_dump(include=set(columns)) for article in chunk]
+                for row in rows:
+                    row['month'] = row['published_at'].strftime('%Y-%m') if row['published_at'] else None
+                written += len(rows)
+                yield pa.RecordBatch.from_pylist(rows, schema=SNAPSHOT_SCHEMA)
+
+        staging_path = self.path.with_name(f'{self.path.name}.staging')
+        shutil.rmtree(staging_path, ignore_errors=True)
+        ds.write_dataset(
+            batches(),
+            staging_path,
+            schema=SNAPSHOT_SCHEMA,
+            format='parquet',
+            partitioning=PARTITIONING,
+            # One partition per medium and month, this covers decades of archives
+            max_partitions=100000,
+            existing_data_behavior='error'
+        )
+        previous_path = self.path.with_name(f'{self.path.name}.previous')
+        shutil.rmtree(previous_path, ignore_errors=True)
+        if self.path.exists():
+            self.path.rename(previous_path)
+        staging_path.rename(self.path)
+        shutil.rmtree(previous_path, ignore_errors=True)
+        return written
+
+
+    def dataset(self, memory_map: bool = False) -> ds.Dataset:
+        '''
+        The snapshot as an Arrow dataset, for readers that want to build their own scans.
+        With memory_map, files are memory-mapped instead of read into buffers.
+        '''
+        return ds.dataset(
+            str(self.path),
+            format='parquet',
+            partitioning=PARTITIONING,
+            filesystem=fs.LocalFileSystem(use_mmap=memory_map)
+        )
+
+
+    def load(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        medium: Optional[str] = None,
+        topic: Optional[str] = None,
+        published_after: Optional[datetime.datetime] = None,
+        published_before: Optional[datetime.datetime] = None,
+        memory_map: bool = False
+    ) -> pd.DataFrame:
+        '''
+        Load the snapshot into a DataFrame with only the given columns (default: all).
+        The filters are pushed down: medium and the date range prune whole partitions,
+        topic and the exact date range skip row groups by their statistics.
+        '''
+        if columns:
+            unknown = [name for name in columns if name not in SNAPSHOT_SCHEMA.names]
+            if unknown:
+                raise ValueError(f"Unknown snapshot columns: {', '.join(unknown)}")
+        table = self.dataset(memory_map=memory_map).to_table(
+            columns=list(columns) if columns else None,
+            filter=self._filter_expression(medium, topic, published_after, published_before)
+        )
+        return table.to_pandas()
+
+
+    def _filter_expression(
+        self,
+        medium: Optional[str],
+        topic: Optional[str],
+        published_after: Optional[datetime.datetime],
+        published_before: Optional[datetime.datetime]
+    ) -> Optional[ds.Expression]:
+        conditions: List[ds.Expression] = []
+        if medium:
+            conditions.append(ds.field('medium') == medium)
+        if topic:
+            conditions.append(ds.field('topic') == topic)
+        if published_after:
+            # The month condition lets the scanner skip partitions without opening their files
+            conditions.append(ds.field('month') >= published_after.strftime('%Y-%m'))
+            conditions.append(ds.field('published_at') >= pa.scalar(published_after, pa.timestamp('us')))
+        if published_before:
+            conditions.append(ds.field('month') <= published_before.strftime('%Y-%m'))
+            conditions.append(ds.field('published_at') <= pa.scalar(published_before, pa.timestamp('us')))
+        if not conditions:
+            return None
+        expression = conditions[0]
+        for condition in conditions[1:]:
+            expression = expression & condition
+        return expression
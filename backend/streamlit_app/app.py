@@ -2,45 +2,112 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import sys
+import datetime
 from pathlib import Path
-import os
+from typing import Optional
 
 # Add the project root to sys.path for absolute imports
 python_project_root = Path(__file__).resolve().parent.parent
 if str(python_project_root) not in sys.path:
     sys.path.insert(0, str(python_project_root))
 
+from shared.database import Database
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+
 # --- Streamlit App --- #
 st.set_page_config(layout="wide", page_title="Fact-Checking Topic Observatory")
 st.title("Fact-Checking Topic Observatory")
 
-# Define the path to the CSV file
-csv_file = "topic_classification_test.csv"
+DRILL_DOWN_PAGE_SIZE = 50
+
+
+@st.cache_resource
+def get_database() -> Database:
+    """One connection pool for all sessions of the app."""
+    return Database()
+
+
+def to_range(start_date: datetime.date, end_date: datetime.date):
+    """Inclusive datetime range for a date range, as used by the API."""
+    return (
+        datetime.datetime.combine(start_date, datetime.time.min),
+        datetime.datetime.combine(end_date, datetime.time(23, 59, 59))
+    )
+
 
+# Aggregates and drill-down pages are cached per filter combination
 @st.cache_data(ttl=300)  # Cache for 5 minutes
-def load_csv_data(csv_path):
-    """Load data from the CSV file."""
-    if os.path.exists(csv_path):
-        df = pd.read_csv(csv_path)
-        df['published_at'] = pd.to_datetime(df['published_at'])
-        return df
-    else:
-        return pd.DataFrame()
+def load_filter_options():
+    """Media and the published_at range for the sidebar filters."""
+    with get_database().get_session() as session:
+        service = FactCheckArticlesService(session)
+        earliest, latest = service.get_published_at_range()
+        return service.get_media(), earliest, latest
 
-# Load data
-df = load_csv_data(csv_file)
 
-if df.empty:
-    st.warning(f"CSV file '{csv_file}' not found or is empty. Please run `build_topic_classification_csv.py` to generate the data.")
-else:
-    st.success(f"Loaded {len(df)} articles from {csv_file}")
+@st.cache_data(ttl=300)
+def load_topic_counts(start_date: datetime.date, end_date: datetime.date, medium: Optional[str]) -> pd.DataFrame:
+    """Article count per topic, served from the topic count rollup."""
+    published_after, published_before = to_range(start_date, end_date)
+    with get_database().get_session() as session:
+        topic_counts = FactCheckArticlesService(session).get_topic_counts_by_period(
+            published_after=published_after,
+            published_before=published_before,
+            medium=medium
+        )
+    return pd.DataFrame([topic_count.model_dump() for topic_count in topic_counts], columns=['topic', 'count'])
+
+
+@st.cache_data(ttl=300)
+def load_publication_frequency(start_date: datetime.date, end_date: datetime.date, medium: Optional[str]) -> pd.DataFrame:
+    """Articles per month and medium, including unclassified ones."""
+    published_after, published_before = to_range(start_date, end_date)
+    with get_database().get_session() as session:
+        frequencies = FactCheckArticlesService(session).get_publication_histogram(
+            interval='month',
+            medium=medium,
+            start=published_after,
+            end=published_before
+        )
+    return pd.DataFrame([frequency.model_dump() for frequency in frequencies], columns=['period', 'medium', 'topic', 'count'])
+
+
+@st.cache_data(ttl=300)
+def load_topic_articles(
+    topic: str,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    medium: Optional[str],
+    cursor: Optional[str]
+):
+    """One page of article summaries for a topic, newest first."""
+    published_after, published_before = to_range(start_date, end_date)
+    with get_database().get_session() as session:
+        page = FactCheckArticlesService(session).get_articles_page(
+            limit=DRILL_DOWN_PAGE_SIZE,
+            cursor=cursor,
+            medium=medium,
+            topic=topic,
+            published_after=published_after,
+            published_before=published_before,
+            summary=True
+        )
+    articles = pd.DataFrame([article.model_dump() for article in page.items])
+    return articles, page.next_cursor
+
 
+# Load filter options
+media, earliest, latest = load_filter_options()
+
+if earliest is None:
+    st.warning("No articles found in the database. Please run the scraper first.")
+else:
     # --- Sidebar Filters --- #
     st.sidebar.header("Filters")
 
     # Date range filter
-    min_date = df['published_at'].min().date()
-    max_date = df['published_at'].max().date()
+    min_date = earliest.date()
+    max_date = latest.date()
     date_range = st.sidebar.date_input(
         "Select Date Range",
         value=(min_date, max_date),
@@ -50,73 +117,99 @@ else:
 
     if len(date_range) == 2:
         start_date, end_date = date_range
-        filtered_df = df[(df['published_at'].dt.date >= start_date) & (df['published_at'].dt.date <= end_date)]
     else:
-        filtered_df = df.copy()
+        start_date, end_date = min_date, max_date
+
+    medium_option = st.sidebar.selectbox("Medium", ["All media"] + media)
+    medium = None if medium_option == "All media" else medium_option
+
+    frequency_data = load_publication_frequency(start_date, end_date, medium)
+    topic_data = load_topic_counts(start_date, end_date, medium)
 
     # --- Summary Statistics --- #
-    total_articles = len(filtered_df)
+    total_articles = int(frequency_data['count'].sum()) if not frequency_data.empty else 0
     st.markdown(f"### 📊 Summary for {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
     st.metric("Total Fact-Checks", total_articles)
 
+    # --- Publication Timeline --- #
+    if not frequency_data.empty:
+        timeline = frequency_data.pivot_table(index='period', columns='medium', values='count', aggfunc='sum', fill_value=0)
+        st.subheader("Fact-Checks per Month")
+        st.bar_chart(timeline)
+
     # --- Bubble Chart --- #
-    if not filtered_df.empty and filtered_df['topic'].notna().sum() > 0:
-        # Aggregate by topic
-        topic_data = filtered_df[filtered_df['topic'].notna()].groupby('topic').size().reset_index(name='count')
-        
-        if not topic_data.empty:
-            # Calculate percentages
-            topic_data['percentage'] = (topic_data['count'] / topic_data['count'].sum() * 100).round(1)
-            
-            # Create bubble chart using scatter plot
-            # Position bubbles in a grid-like pattern for better visualization
-            num_topics = len(topic_data)
-            
-            # Sort by count ascending for horizontal bar chart (bottom to top)
-            topic_data = topic_data.sort_values(by='count', ascending=True).reset_index(drop=True)
-            
-            # Create the bar chart
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                y=topic_data['topic'],
-                x=topic_data['count'],
-                orientation='h',
-                marker=dict(
-                    color=topic_data['count'],
-                    colorscale='Viridis',
-                    showscale=True,
-                    colorbar=dict(title="Article<br>Count")
-                ),
-                text=topic_data['count'],
-                textposition='outside',
-                hovertext=[
-                    f"<b>{topic}</b><br>Articles: {count}<br>Percentage: {pct}%"
-                    for topic, count, pct in zip(topic_data['topic'], topic_data['count'], topic_data['percentage'])
-                ],
-                hoverinfo='text'
-            ))
-            
-            # Update layout for a cleaner bar chart appearance
-            fig.update_layout(
-                title="Topic Distribution - Article Count by Domain",
-                xaxis_title="Number of Articles",
-                yaxis_title="Topic Domain",
-                plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                hovermode='closest',
-                height=600,
-                showlegend=False
+    if not topic_data.empty:
+        # Calculate percentages
+        topic_data['percentage'] = (topic_data['count'] / topic_data['count'].sum() * 100).round(1)
+
+        # Sort by count ascending for horizontal bar chart (bottom to top)
+        topic_data = topic_data.sort_values(by='count', ascending=True).reset_index(drop=True)
+
+        # Create the bar chart
+        fig = go.Figure()
+
+        fig.add_trace(go.Bar(
+            y=topic_data['topic'],
+            x=topic_data['count'],
+            orientation='h',
+            marker=dict(
+                color=topic_data['count'],
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title="Article<br>Count")
+            ),
+            text=topic_data['count'],
+            textposition='outside',
+            hovertext=[
+                f"<b>{topic}</b><br>Articles: {count}<br>Percentage: {pct}%"
+                for topic, count, pct in zip(topic_data['topic'], topic_data['count'], topic_data['percentage'])
+            ],
+            hoverinfo='text'
+        ))
+
+        # Update layout for a cleaner bar chart appearance
+        fig.update_layout(
+            title="Topic Distribution - Article Count by Domain",
+            xaxis_title="Number of Articles",
+            yaxis_title="Topic Domain",
+            plot_bgcolor='rgba(240, 240, 240, 0.5)',
+            hovermode='closest',
+            height=600,
+            showlegend=False
+        )
+
+        st.plotly_chart(fig, use_container_width=True)
+
+        # --- Topic Breakdown Table --- #
+        st.subheader("Topic Breakdown")
+        topic_display = topic_data[['topic', 'count', 'percentage']].copy()
+        topic_display.columns = ['Topic', 'Count', 'Percentage (%)']
+        topic_display = topic_display.sort_values('Count', ascending=False).reset_index(drop=True)
+        st.dataframe(topic_display, use_container_width=True)
+
+        # --- Drill-Down --- #
+        # Article rows are only fetched here, one page at a time
+        st.subheader("Articles by Topic")
+        selected_topic = st.selectbox("Topic", topic_display['Topic'].tolist())
+        drill_down_key = (selected_topic, start_date, end_date, medium)
+        if st.session_state.get('drill_down_key') != drill_down_key:
+            st.session_state['drill_down_key'] = drill_down_key
+            st.session_state['drill_down_cursors'] = [None]
+        cursors = st.session_state['drill_down_cursors']
+
+        articles = []
+        next_cursor = None
+        for cursor in cursors:
+            page, next_cursor = load_topic_articles(selected_topic, start_date, end_date, medium, cursor)
+            articles.append(page)
+        articles = pd.concat(articles, ignore_index=True)
+        if not articles.empty:
+            st.dataframe(
+                articles[['published_at', 'medium', 'headline', 'claim', 'url']],
+                use_container_width=True
             )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # --- Topic Breakdown Table --- #
-            st.subheader("Topic Breakdown")
-            topic_display = topic_data[['topic', 'count', 'percentage']].copy()
-            topic_display.columns = ['Topic', 'Count', 'Percentage (%)']
-            topic_display = topic_display.sort_values('Count', ascending=False).reset_index(drop=True)
-            st.dataframe(topic_display, use_container_width=True)
-        else:
-            st.info("No topics available for the selected date range.")
+        if next_cursor and st.button("Load more"):
+            cursors.append(next_cursor)
+            st.rerun()
     else:
         st.info("No classified articles found for the selected date range. Please ensure topics are assigned in your data.")
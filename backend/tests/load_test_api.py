@@ -0,0 +1,103 @@
+import sys, os, time, asyncio
+import datetime
+from pathlib import Path
+import argparse
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import httpx
+from fastapi import FastAPI
+from typing import List
+from shared.database import Database
+from shared.schemas import TopicCount, ArticlePage
+from shared.services.fact_check_articles_service import FactCheckArticlesService
+
+# --- CONFIG ---
+# Read paths that hit the database, the response cache is disabled for the run
+PATHS = [
+    '/topic-counts?published_after=2023-01-01&published_before=2023-06-30',
+    '/articles?limit=50&summary=true&topic=Gesundheit',
+    '/articles?limit=50&summary=true&medium=correctiv',
+]
+
+
+def create_sync_app() -> FastAPI:
+    '''
+    The same read endpoints with blocking sessions, as served before the async stack:
+    the data version lookup and the query, run in FastAPI's worker thread pool.
+    '''
+    sync_app = FastAPI()
+    db = Database()
+
+    @sync_app.get('/topic-counts', response_model=List[TopicCount])
+    def get_topic_counts(published_after: datetime.date, published_before: datetime.date) -> List[TopicCount]:
+        with db.get_session() as session:
+            service = FactCheckArticlesService(session)
+            service.get_data_version()
+            return service.get_topic_counts_by_period(
+                published_after=datetime.datetime.combine(published_after, datetime.time.min),
+                published_before=datetime.datetime.combine(published_before, datetime.time(23, 59, 59))
+            )
+
+    @sync_app.get('/articles', response_model=ArticlePage)
+    def get_articles_page(limit: int = 100, topic: str = None, medium: str = None, summary: bool = False) -> ArticlePage:
+        with db.get_session() as session:
+            service = FactCheckArticlesService(session)
+            service.get_data_version()
+            return service.get_articles_page(
+                limit=limit, topic=topic, medium=medium, summary=summary
+            )
+
+    return sync_app
+
+
+async def run_load(app: FastAPI, num_requests: int, concurrency: int) -> float:
+    '''
+    Send num_requests GET requests over PATHS with at most concurrency in flight, returns requests per second.
+    '''
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://loadtest', timeout=60) as client:
+        async def request(i: int):
+            async with semaphore:
+                response = await client.get(PATHS[i % len(PATHS)])
+                assert response.status_code == 200, f"{response.status_code}: {response.text[:200]}"
+
+        # Warm up the connection pools before measuring
+        await asyncio.gather(*(request(i) for i in range(concurrency)))
+        start = time.perf_counter()
+        await asyncio.gather(*(request(i) for i in range(num_requests)))
+        return num_requests / (time.perf_counter() - start)
+
+
+async def main(num_requests: int, concurrency_levels: List[int]):
+    # Never run against DATABASE_URL, use a local database seeded by tests/test_query_plans.py
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        print("Set TEST_DATABASE_URL to a local Postgres database seeded by tests/test_query_plans.py to run this test.")
+        return
+    os.environ['DATABASE_URL'] = database_url
+
+    from api.main import app as async_app, db as async_db, response_cache
+    response_cache.max_entries = 0
+    sync_app = create_sync_app()
+
+    print(f"{'Concurrency':>11} {'sync req/s':>12} {'async req/s':>12} {'Speedup':>8}")
+    print("-" * 46)
+    for concurrency in concurrency_levels:
+        sync_rps = await run_load(sync_app, num_requests, concurrency)
+        async_rps = await run_load(async_app, num_requests, concurrency)
+        print(f"{concurrency:>11} {sync_rps:>12.0f} {async_rps:>12.0f} {async_rps / sync_rps:>7.2f}x")
+    await async_db.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare throughput of the sync and async API endpoints under concurrency.")
+    parser.add_argument("--requests", type=int, default=600, help="Requests per run (default: 600).")
+    parser.add_argument("--concurrency", type=int, nargs='+', default=[1, 10, 50, 100], help="Concurrency levels (default: 1 10 50 100).")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
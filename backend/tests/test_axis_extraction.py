@@ -0,0 +1,137 @@
+import sys, os, asyncio, tempfile
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import FunctionModel, AgentInfo
+
+from shared.schemas import FactCheckArticlesSchema, ParagraphBlock
+from shared.agents.axis_extractor import AxisExtractorAgent
+
+# --- CONFIG ---
+NUM_ARTICLES = 60
+URL_PREFIX = 'https://axis-extraction-test.example/'
+
+
+def make_stub_llm():
+    '''
+    Stub LLM that returns all four axes for an article in one answer, counting calls.
+    '''
+    calls = []
+
+    async def respond(messages, info: AgentInfo) -> ModelResponse:
+        prompt = messages[-1].parts[-1].content
+        calls.append(prompt)
+        number = prompt.split('Artikel ')[1].split('"')[0]
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {
+            'topic_label': 'Gesundheit',
+            'claim': f'Behauptung {number}',
+            'instrumentalizer': 'Unbekannt',
+            'entities': [{'name': f'Person {number}', 'type': 'person'}],
+        })])
+
+    return FunctionModel(respond), calls
+
+
+def main():
+    # Never run against DATABASE_URL, this test writes fixture articles
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        print("Set TEST_DATABASE_URL to a local, disposable Postgres database to run this test.")
+        return
+    os.environ['DATABASE_URL'] = database_url
+
+    from sqlalchemy import text
+    from shared.database import Database
+    from shared.models import Base
+    from shared.services.fact_check_articles_service import FactCheckArticlesService
+    from shared.pipelines.axis_extraction import AxisExtractionPipeline
+    from shared.pipelines.topic_classification import PipelineCheckpoint
+
+    db = Database()
+    Base.metadata.create_all(db.engine)
+
+    def cleanup():
+        with db.engine.begin() as connection:
+            connection.execute(text("DELETE FROM fact_check_articles WHERE url LIKE :prefix"), {'prefix': URL_PREFIX + '%'})
+
+    def load_rows():
+        with db.engine.connect() as connection:
+            return {row.url: row for row in connection.execute(
+                text("SELECT url, topic, topic_source, claim, instrumentalizer, entities, classified_hash = content_hash AS hash_matches "
+                     "FROM fact_check_articles WHERE url LIKE :prefix"),
+                {'prefix': URL_PREFIX + '%'}
+            )}
+
+    cleanup()
+    # Every third article already has a topic and a claim that must survive the only-missing mode
+    articles = [
+        FactCheckArticlesSchema(
+            url=f'{URL_PREFIX}{n}',
+            medium='correctiv',
+            headline=f'Artikel {n}',
+            body=[ParagraphBlock(type='paragraph', text='Ein Faktencheck.')],
+            topic='Technologie' if n % 3 == 0 else None,
+            claim=f'Vorhandene Behauptung {n}' if n % 3 == 0 else None
+        )
+        for n in range(NUM_ARTICLES)
+    ]
+    with db.get_session() as session:
+        FactCheckArticlesService(session).upsert_articles(articles)
+    with db.engine.connect() as connection:
+        first_id = connection.execute(text("SELECT min(id) FROM fact_check_articles WHERE url LIKE :prefix"), {'prefix': URL_PREFIX + '%'}).scalar()
+
+    stub_model, calls = make_stub_llm()
+    agent = AxisExtractorAgent(model_name='stub', system_prompt='Stub', model=stub_model)
+    with tempfile.TemporaryDirectory() as directory:
+        # Start right before the test articles, leave the rest of the test database alone
+        checkpoint = PipelineCheckpoint('axis-extraction-test', path=os.path.join(directory, 'checkpoint.json'))
+        checkpoint.save(first_id - 1)
+        pipeline = AxisExtractionPipeline(db=db, extractor_agent=agent, chunk_size=25, checkpoint=checkpoint)
+        stats = asyncio.run(pipeline.run())
+        print(f"Only missing: {stats}, {len(calls)} LLM calls")
+
+        # One call per article for all four axes, existing values only counted where they were empty
+        assert len(calls) == NUM_ARTICLES and stats['extracted'] == NUM_ARTICLES, (stats, len(calls))
+        preset = NUM_ARTICLES // 3
+        assert stats['topic'] == stats['claim'] == NUM_ARTICLES - preset, stats
+        assert stats['instrumentalizer'] == stats['entities'] == NUM_ARTICLES, stats
+
+        rows = load_rows()
+        for n in range(NUM_ARTICLES):
+            row = rows[f'{URL_PREFIX}{n}']
+            if n % 3 == 0:
+                assert row.topic == 'Technologie' and row.claim == f'Vorhandene Behauptung {n}', row
+                assert not row.hash_matches and row.topic_source is None, row
+            else:
+                assert row.topic == 'Gesundheit' and row.claim == f'Behauptung {n}', row
+                assert row.hash_matches and row.topic_source == 'llm', row
+            assert row.instrumentalizer == 'Unbekannt', row
+            assert row.entities == [{'name': f'Person {n}', 'type': 'person'}], row
+
+        # Nothing is missing anymore: a second run sends nothing
+        checkpoint.save(first_id - 1)
+        stats = asyncio.run(pipeline.run())
+        assert stats['processed'] == 0 and len(calls) == NUM_ARTICLES, stats
+
+        # Overwrite mode replaces all axes of the articles whose topic was not classified on their content
+        checkpoint.save(first_id - 1)
+        overwrite = AxisExtractionPipeline(db=db, extractor_agent=agent, chunk_size=25, only_missing=False, checkpoint=checkpoint)
+        stats = asyncio.run(overwrite.run())
+        print(f"Overwrite: {stats}")
+        assert stats['extracted'] == preset and all(stats[axis] == preset for axis in ('topic', 'claim')), stats
+
+    rows = load_rows()
+    assert all(row.topic == 'Gesundheit' and row.claim.startswith('Behauptung') and row.hash_matches for row in rows.values())
+
+    cleanup()
+    print("Axis extraction test passed.")
+
+
+if __name__ == "__main__":
+    main()
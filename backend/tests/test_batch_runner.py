@@ -0,0 +1,73 @@
+import sys, asyncio, time
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import FunctionModel, AgentInfo
+
+from shared.agents.topic_classifier import TopicClassifierAgent
+from shared.schemas import FactCheckArticleContent, ParagraphBlock
+
+# --- CONFIG ---
+NUM_ARTICLES = 40
+MAX_CONCURRENCY = 8
+STUB_LATENCY = 0.2  # Simulated LLM round-trip in seconds
+
+
+def make_stub_model():
+    '''
+    A local stand-in for OpenRouter: sleeps like a real round-trip, answers with a fixed
+    topic, rate-limits article 5 once (429) and always fails the article whose
+    headline contains "broken" with a non-retryable 400.
+    '''
+    calls = {}
+
+    async def respond(messages, info: AgentInfo) -> ModelResponse:
+        prompt = messages[-1].parts[-1].content
+        calls[prompt] = calls.get(prompt, 0) + 1
+        await asyncio.sleep(STUB_LATENCY)
+        if 'broken' in prompt:
+            raise ModelHTTPError(status_code=400, model_name='stub')
+        if '"headline":"Artikel 5"' in prompt and calls[prompt] == 1:
+            raise ModelHTTPError(status_code=429, model_name='stub')
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {'topic_label': 'Gesundheit'})])
+
+    return FunctionModel(respond), calls
+
+
+def main():
+    stub_model, calls = make_stub_model()
+    agent = TopicClassifierAgent(model_name='stub', system_prompt='Stub', model=stub_model)
+    articles = [
+        FactCheckArticleContent(
+            headline=f'Artikel {i}' if i != 7 else 'broken article',
+            body=[ParagraphBlock(type='paragraph', text='Text')]
+        )
+        for i in range(NUM_ARTICLES)
+    ]
+
+    start = time.perf_counter()
+    results = asyncio.run(agent.run_many(articles, max_concurrency=MAX_CONCURRENCY, max_retries=2))
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r.ok]
+    retried = [r for r in results if r.attempts > 1]
+    print(f"Classified {len(results)} articles in {elapsed:.2f}s "
+          f"(sequential would take ~{NUM_ARTICLES * STUB_LATENCY:.2f}s)")
+    print(f"Succeeded: {len(results) - len(failed)}, failed: {len(failed)}, retried: {len(retried)}")
+
+    assert [r.index for r in results] == list(range(NUM_ARTICLES)), 'results must keep input order'
+    assert [r.index for r in failed] == [7], 'only the broken article should fail'
+    assert isinstance(failed[0].error, ModelHTTPError)
+    assert failed[0].attempts == 1, 'non-retryable errors must not be retried'
+    assert all(r.output.topic_label == 'Gesundheit' for r in results if r.ok)
+    assert [r.index for r in retried] == [5] and retried[0].attempts == 2, 'rate-limited articles are retried'
+    assert elapsed < NUM_ARTICLES * STUB_LATENCY / 2, 'batch should run concurrently'
+    print("✅ Batch runner behaves as expected.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import sys, os, json, asyncio, hashlib, datetime, threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+# --- CONFIG ---
+MEDIUM = 'fixture-wordpress'
+NUM_POSTS = 250
+PER_PAGE = 100
+FAILING_POST = NUM_POSTS + 2  # Answers 503 until fixed, must keep the crawl state
+CATEGORY = 5
+NUM_OTHER_POSTS = 10  # In another category, must never be listed
+
+
+class WordPressHandler(BaseHTTPRequestHandler):
+    '''
+    Serves /wp-json/wp/v2/posts like WordPress (categories, after, dates_are_gmt, orderby=date,
+    order=asc, page, per_page, X-WP-TotalPages) behind a cache that answers If-None-Match with 304, and
+    /posts/<id> as article pages.
+    '''
+    posts = []
+    feed_requests = []
+    failing = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send(self, status: int, body: bytes = b'', headers: dict = {}):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.startswith('/posts/'):
+            post_id = int(url.path.rsplit('/', 1)[1])
+            if post_id == FAILING_POST and self.failing:
+                self.send(503)
+            else:
+                self.send(200, json.dumps({'id': post_id}).encode('utf-8'))
+            return
+
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        self.feed_requests.append(query)
+        posts = sorted(self.posts, key=lambda post: post['date_gmt'])
+        if 'categories' in query:
+            posts = [post for post in posts if post['category'] == int(query['categories'])]
+        if 'after' in query:
+            assert query.get('dates_are_gmt') == 'true'
+            posts = [post for post in posts if post['date_gmt'] > query['after']]
+        per_page, page = int(query['per_page']), int(query.get('page', 1))
+        total_pages = max(1, -(-len(posts) // per_page))
+        if page > total_pages:
+            self.send(400, b'{"code": "rest_post_invalid_page_number"}')
+            return
+        fields = query['_fields'].split(',')
+        body = json.dumps([
+            {field: post[field] for field in fields} for post in posts[(page - 1) * per_page:page * per_page]
+        ]).encode('utf-8')
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send(304, headers={'ETag': etag})
+            return
+        self.send(200, body, {'Content-Type': 'application/json', 'ETag': etag, 'X-WP-TotalPages': str(total_pages)})
+
+
+def add_post(base_url: str, post_id: int, hours: int = None, category: int = CATEGORY):
+    published_at = datetime.datetime(2024, 1, 1) + datetime.timedelta(hours=post_id if hours is None else hours)
+    WordPressHandler.posts.append({
+        'id': post_id,
+        'link': f'{base_url}/posts/{post_id}',
+        'date_gmt': published_at.isoformat(),
+        'category': category
+    })
+
+
+def main():
+    # Never run against DATABASE_URL, this test writes crawl states and fixture articles
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        print("Set TEST_DATABASE_URL to a local, disposable Postgres database to run this test.")
+        return
+    os.environ['DATABASE_URL'] = database_url
+
+    from sqlalchemy import text
+    from shared.database import Database
+    from shared.models import Base
+    from shared.services.crawl_state_service import CrawlStateService
+    from shared.pipelines.scraping import ScrapingPipeline, ScrapeJob
+    from scraping.wordpress_feed import WordPressFeed
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), WordPressHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    # The feed URL carries its own filter, like CORRECTIV.links_url
+    feed_url = f'{base_url}/wp-json/wp/v2/posts?categories={CATEGORY}'
+    for post_id in range(1, NUM_POSTS + 1):
+        add_post(base_url, post_id)
+    for n in range(1, NUM_OTHER_POSTS + 1):
+        add_post(base_url, 10_000 + n, hours=n * NUM_POSTS // NUM_OTHER_POSTS, category=CATEGORY + 1)
+
+    db = Database()
+    Base.metadata.create_all(db.engine)
+    with db.get_session() as session:
+        CrawlStateService(session).reset_state(MEDIUM)
+    with db.engine.begin() as connection:
+        connection.execute(text("DELETE FROM fact_check_articles WHERE url LIKE 'http://127.0.0.1:%'"))
+
+    def crawl(feed: WordPressFeed):
+        def worker(url: str):
+            import httpx
+            response = httpx.get(url)
+            response.raise_for_status()
+            post_id = response.json()['id']
+            return {
+                'url': url,
+                'headline': f'Post {post_id}',
+                'datetime_published': datetime.datetime(2024, 1, 1) + datetime.timedelta(hours=post_id),
+                'body_structured': [('paragraph', f'Claim {post_id}')],
+            }
+        job = ScrapeJob(
+            medium=MEDIUM,
+            get_links=feed.get_links,
+            on_complete=feed.on_complete,
+            make_worker=lambda: worker,
+            max_workers=4,
+            requests_per_minute=None
+        )
+        return asyncio.run(ScrapingPipeline(db=db, jobs=[job], max_retries=0).run())
+
+    def stored_state():
+        with db.get_session() as session:
+            return CrawlStateService(session).get_state(MEDIUM)
+
+    # First crawl: the whole feed, page by page, oldest first
+    feed = WordPressFeed(db, MEDIUM, feed_url, per_page=PER_PAGE)
+    stats = crawl(feed)
+    print(f"First crawl: {stats}, {feed.transferred_bytes} bytes of feed")
+    assert stats['links'] == NUM_POSTS and stats['saved'] == NUM_POSTS, stats
+    assert len(WordPressHandler.feed_requests) == 3, WordPressHandler.feed_requests
+    assert all(query['categories'] == str(CATEGORY) for query in WordPressHandler.feed_requests)
+    state = stored_state()
+    assert state.last_item_id == NUM_POSTS, state
+    assert state.last_published_at == datetime.datetime(2024, 1, 1) + datetime.timedelta(hours=NUM_POSTS), state
+    assert state.etag and state.last_crawled_at, state
+
+    # Second crawl: only posts after the last one are requested, there are none
+    WordPressHandler.feed_requests.clear()
+    feed = WordPressFeed(db, MEDIUM, feed_url, per_page=PER_PAGE)
+    stats = crawl(feed)
+    print(f"Second crawl: {stats}, {feed.transferred_bytes} bytes of feed")
+    assert stats['links'] == 0, stats
+    assert WordPressHandler.feed_requests[0]['after'] == state.last_published_at.isoformat()
+
+    # Third crawl: the unchanged feed answers 304 without a body
+    feed = WordPressFeed(db, MEDIUM, feed_url, per_page=PER_PAGE)
+    stats = crawl(feed)
+    print(f"Third crawl: {stats}, {feed.transferred_bytes} bytes of feed")
+    assert stats['links'] == 0 and feed.transferred_bytes == 0, (stats, feed.transferred_bytes)
+
+    # New posts: only they are listed; one fails transiently, so the state stays put
+    add_post(base_url, NUM_POSTS + 1)
+    add_post(base_url, FAILING_POST)
+    state = stored_state()
+    feed = WordPressFeed(db, MEDIUM, feed_url, per_page=PER_PAGE)
+    stats = crawl(feed)
+    print(f"Crawl with a failure: {stats}")
+    assert stats['links'] == 2 and stats['saved'] == 1 and stats['failed'] == 1, stats
+    assert stored_state().last_item_id == state.last_item_id
+
+    # Once the page works again the same posts are listed, the stored one is skipped
+    WordPressHandler.failing = False
+    feed = WordPressFeed(db, MEDIUM, feed_url, per_page=PER_PAGE)
+    stats = crawl(feed)
+    print(f"Crawl after the fix: {stats}")
+    assert stats['links'] == 2 and stats['skipped'] == 1 and stats['saved'] == 1, stats
+    assert stored_state().last_item_id == FAILING_POST
+
+    with db.get_session() as session:
+        CrawlStateService(session).reset_state(MEDIUM)
+    with db.engine.begin() as connection:
+        connection.execute(text("DELETE FROM fact_check_articles WHERE url LIKE 'http://127.0.0.1:%'"))
+    server.shutdown()
+    print("Crawl state test passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import sys, os, re, time, zlib
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import numpy as np
+
+# --- CONFIG ---
+URL_PREFIX = 'https://embedding-test.example/'
+NUM_FILLER_ARTICLES = 300
+
+
+class BagOfWordsModel():
+    '''
+    Deterministic stand-in for a sentence-transformers model (same encode() interface):
+    hashes lower-cased words into the vector, so texts sharing words are similar. Lets the
+    test run without downloading model weights; pass EMBEDDING_TEST_REAL_MODEL=1 to use
+    the real model instead.
+    '''
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        self.calls = 0
+        self.encoded = 0
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, convert_to_numpy=True, show_progress_bar=False):
+        self.calls += 1
+        self.encoded += len(texts)
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in re.findall(r'\w+', text.lower()):
+                vectors[row, zlib.crc32(word.encode('utf-8')) % self.dimensions] += 1
+        if normalize_embeddings:
+            vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+        return vectors
+
+
+ARTICLES = [
+    ('correctiv', 'Nein, dieses Foto zeigt nicht Olaf Scholz beim Feiern in Kiew', 'Ein Bild geht viral.', 'Foto zeigt Scholz beim Feiern in Kiew'),
+    ('br-faktenfuchs', 'Foto zeigt nicht Olaf Scholz beim Feiern in Kiew', 'Faktenfuchs prüft ein virales Bild.', 'Scholz feiert in Kiew'),
+    ('correctiv', 'Foto von Scholz in Kiew ist alt', 'Das Bild stammt aus dem Jahr 2019.', 'Scholz beim Feiern in Kiew'),
+    ('tagesschau-faktenfinder', 'Windräder töten keine Millionen Vögel pro Jahr', 'Eine Studie wird falsch zitiert.', 'Windräder töten Millionen Vögel'),
+]
+
+
+def main():
+    # Never run against DATABASE_URL, this test writes fixture articles and embeddings
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        print("Set TEST_DATABASE_URL to a local, disposable Postgres database to run this test.")
+        return
+    os.environ['DATABASE_URL'] = database_url
+
+    from sqlalchemy import text
+    from fastapi.testclient import TestClient
+    from shared.database import Database
+    from shared.models import Base, EMBEDDING_DIMENSIONS
+    from shared.schemas import FactCheckArticlesSchema
+    from shared.services.fact_check_articles_service import FactCheckArticlesService
+    from shared.services.article_embeddings_service import ArticleEmbeddingsService
+    from shared.embeddings import ArticleEmbedder
+    from shared.pipelines.embedding import EmbeddingPipeline
+    from api import main as api_main
+
+    model = None if os.getenv('EMBEDDING_TEST_REAL_MODEL') else BagOfWordsModel(EMBEDDING_DIMENSIONS)
+    embedder = ArticleEmbedder(model_name='test-bag-of-words' if model else None, batch_size=32, model=model)
+
+    db = Database()
+    Base.metadata.create_all(db.engine)
+
+    def cleanup():
+        with db.engine.begin() as connection:
+            connection.execute(text("DELETE FROM fact_check_articles WHERE url LIKE :prefix"), {'prefix': URL_PREFIX + '%'})
+            connection.execute(text("DELETE FROM article_embeddings WHERE model = :model"), {'model': embedder.model_name})
+
+    cleanup()
+    articles = [
+        FactCheckArticlesSchema(url=f'{URL_PREFIX}{n}', medium=medium, headline=headline, teaser=teaser, claim=claim)
+        for n, (medium, headline, teaser, claim) in enumerate(ARTICLES)
+    ] + [
+        FactCheckArticlesSchema(url=f'{URL_PREFIX}filler/{n}', medium='dpa', headline=f'Meldung {n} über Thema {n % 37}', teaser=f'Kurztext {n}')
+        for n in range(NUM_FILLER_ARTICLES)
+    ]
+    with db.get_session() as session:
+        FactCheckArticlesService(session).upsert_articles(articles)
+    with db.engine.connect() as connection:
+        ids = dict(connection.execute(
+            text("SELECT url, id FROM fact_check_articles WHERE url LIKE :prefix"), {'prefix': URL_PREFIX + '%'}
+        ).all())
+    source_id = ids[f'{URL_PREFIX}0']
+    # Leave the rest of the test database alone
+    after_id = min(ids.values()) - 1
+
+    # First run embeds every article in batches
+    pipeline = EmbeddingPipeline(db, embedder, scan_size=5000)
+    start = time.perf_counter()
+    stats = pipeline.run(after_id=after_id)
+    print(f"First run in {time.perf_counter() - start:.2f}s: {stats}")
+    assert stats['embedded'] == len(articles), stats
+
+    # Second run: nothing changed, nothing is encoded
+    stats = pipeline.run(after_id=after_id)
+    assert stats['embedded'] == 0, stats
+
+    # A new article and a changed claim: only these two are encoded
+    with db.get_session() as session:
+        FactCheckArticlesService(session).upsert_articles([
+            FactCheckArticlesSchema(url=f'{URL_PREFIX}new', medium='afp', headline='AFP: Foto zeigt nicht Scholz beim Feiern in Kiew', claim='Scholz feiert in Kiew')
+        ])
+        FactCheckArticlesService(session).update_article(ids[f'{URL_PREFIX}3'], {'claim': 'Windkraft tötet Vögel'})
+    stats = pipeline.run(after_id=after_id)
+    assert stats['embedded'] == 2, stats
+
+    with db.get_session() as session:
+        service = ArticleEmbeddingsService(session)
+        similar = service.get_similar_articles(source_id, embedder.model_name, limit=3)
+        print("Similar to article 0:", [(article.medium, article.headline, round(article.similarity, 2)) for article in similar])
+        assert source_id not in [article.id for article in similar]
+        assert {article.url for article in similar[:3]} == {f'{URL_PREFIX}1', f'{URL_PREFIX}2', f'{URL_PREFIX}new'}, similar
+        assert similar[0].similarity >= similar[-1].similarity
+
+        # Near-duplicates by other outlets only
+        others = service.get_similar_articles(source_id, embedder.model_name, limit=2, other_media_only=True)
+        assert all(article.medium != 'correctiv' for article in others), others
+        assert {article.url for article in others} == {f'{URL_PREFIX}1', f'{URL_PREFIX}new'}, others
+
+    # API: /similar and /search
+    api_main.embedder = embedder
+    with TestClient(api_main.app) as client:
+        response = client.get(f'/similar/{source_id}', params={'limit': 3, 'other_media_only': True})
+        assert response.status_code == 200, response.text
+        assert response.json()[0]['url'] in (f'{URL_PREFIX}1', f'{URL_PREFIX}new'), response.json()
+
+        response = client.get('/search', params={'q': 'Töten Windräder Vögel?', 'limit': 1})
+        assert response.status_code == 200, response.text
+        assert response.json()[0]['url'] == f'{URL_PREFIX}3', response.json()
+
+        response = client.get('/search', params={'q': 'Scholz Kiew', 'medium': 'br-faktenfuchs', 'limit': 5})
+        assert [article['medium'] for article in response.json()] == ['br-faktenfuchs'], response.json()
+
+        assert client.get('/similar/0').status_code == 404
+        assert client.get('/search', params={'q': '   '}).status_code == 400
+
+        # Query encoding latency through the API
+        start = time.perf_counter()
+        for n in range(50):
+            client.get('/search', params={'q': f'Faktencheck Nummer {n}'})
+        print(f"/search: {1000 * (time.perf_counter() - start) / 50:.1f} ms per uncached query")
+
+    cleanup()
+    print("Embeddings test passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import sys, time, threading, tracemalloc
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+import httpx
+from scraping.http_fetch import HttpArticleWorker
+from scraping.sources import CORRECTIV
+from shared.schemas import FactCheckArticlesSchema
+from shared.pipelines.scraping import is_retryable_scrape
+
+# --- CONFIG ---
+NUM_PAGES = 200
+
+# Trimmed-down copy of the markup of a correctiv fact-check
+CORRECTIV_PAGE = """
+<html><body>
+<div id="cmpwrapper"></div>
+<article>
+  <header>
+    <span class="topline">Faktencheck</span>
+    <h1>Nein, dieses Foto zeigt nicht   den Bundeskanzler</h1>
+    <p class="detail__excerpt">Ein Bild geht viral.</p>
+  </header>
+  <picture><source srcset="https://correctiv.org/image.jpg"></picture>
+  <time datetime="2024-03-05T14:30:00+01:00">5. März 2024</time>
+  <p class="detail__authors">von Anna Beispiel</p>
+  <div class="detail__content">
+    <p>Erster Absatz.</p>
+    <h2>Die Behauptung</h2>
+    <p>Zweiter <a href="#">Absatz</a> mit Link.</p>
+    <p>Alle Faktenchecks zu Politik</p>
+    <p>Redigatur: Max Muster</p>
+  </div>
+</article>
+</body></html>
+"""
+
+# Content rendered by JavaScript, the static HTML has no article
+JS_PAGE = '<html><body><div id="app"></div><script src="/app.js"></script></body></html>'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith('/faktencheck/'):
+            status, body = 200, CORRECTIV_PAGE
+        elif self.path == '/js-only':
+            status, body = 200, JS_PAGE
+        else:
+            status, body = 404, 'not found'
+        encoded = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+
+    fallback_urls = []
+    fallback_workers = []
+
+    def make_fallback():
+        fallback_workers.append(lambda url: fallback_urls.append(url) or None)
+        return fallback_workers[-1]
+
+    worker = HttpArticleWorker(CORRECTIV.selectors, make_fallback=make_fallback)
+
+    # The correctiv selectors work unchanged on the static HTML
+    article = worker(f'{base_url}/faktencheck/1')
+    assert article['headline'] == 'Nein, dieses Foto zeigt nicht den Bundeskanzler', article['headline']
+    assert article['kicker'] == 'Faktencheck'
+    assert article['teaser'] == 'Ein Bild geht viral.'
+    assert article['author'] == 'Anna Beispiel'
+    assert article['image_url'] == 'https://correctiv.org/image.jpg'
+    assert article['body'] == ['Erster Absatz.', 'Zweiter Absatz mit Link.'], article['body']
+    assert article['subheadlines'] == ['Die Behauptung']
+    assert article['body_structured'][:3] == [
+        ('paragraph', 'Erster Absatz.'), ('subheadline', 'Die Behauptung'), ('paragraph', 'Zweiter Absatz mit Link.')
+    ], article['body_structured']
+    assert article['datetime_published'].strftime('%Y-%m-%d') == '2024-03-05'
+    schema = FactCheckArticlesSchema.from_news_scraper({'medium': 'correctiv', **article})
+    assert schema.url == f'{base_url}/faktencheck/1' and len(schema.body) == 5
+
+    # The fallback (the Selenium worker in production) is only created for the first page without
+    # the required fields, and reused after that
+    assert not fallback_workers
+    assert worker(f'{base_url}/js-only') is None
+    assert worker(f'{base_url}/js-only') is None
+    assert fallback_urls == [f'{base_url}/js-only'] * 2 and len(fallback_workers) == 1
+
+    # HTTP errors surface as exceptions the pipeline can classify
+    try:
+        worker(f'{base_url}/missing')
+        raise AssertionError('404 did not raise')
+    except httpx.HTTPStatusError as e:
+        assert not is_retryable_scrape(e)
+
+    # Per-article latency and memory of the HTTP path over pooled connections
+    tracemalloc.start()
+    start = time.perf_counter()
+    for n in range(NUM_PAGES):
+        worker(f'{base_url}/faktencheck/{n}')
+    per_article_ms = 1000 * (time.perf_counter() - start) / NUM_PAGES
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"HTTP fetch path: {per_article_ms:.1f} ms per article, {peak / 1024 / 1024:.1f} MB peak Python memory")
+
+    worker.close()
+    server.shutdown()
+    print("HTTP fetch test passed.")
+
+
+if __name__ == "__main__":
+    main()
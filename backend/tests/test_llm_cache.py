@@ -0,0 +1,95 @@
+import sys, time, tempfile
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from shared.agents.llm_cache import LLMResultCache
+from shared.schemas import Topic, LLMGeneratedTopic
+
+# --- CONFIG ---
+MODEL_NAME = 'stub-model'
+SYSTEM_PROMPT = 'Ordne den Artikel einem Thema zu.'
+TTL_SECONDS = 0.5
+MAX_ENTRIES = 3
+
+
+def input_json(n: int) -> str:
+    return f'{{"headline": "Artikel {n}"}}'
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = str(Path(tmp_dir) / 'llm_cache.sqlite')
+        output = Topic(topic_label='Gesundheit')
+
+        # Miss before the write, hit after it, also from a second cache on the same file
+        cache = LLMResultCache(path=path)
+        key = LLMResultCache.make_key(MODEL_NAME, SYSTEM_PROMPT, input_json(0))
+        assert cache.get(key, Topic) is None
+        cache.set(key, output, model_name=MODEL_NAME)
+        assert cache.get(key, Topic) == output
+        assert LLMResultCache(path=path).get(key, Topic) == output
+        stats = cache.stats()
+        print(f"Hit and miss: {stats}")
+        assert stats['hits'] == 1 and stats['misses'] == 1 and stats['writes'] == 1, stats
+        assert stats['hit_rate'] == 0.5, stats
+
+        # A changed model, system prompt or input is a different key
+        for changed_key in (
+            LLMResultCache.make_key('other-model', SYSTEM_PROMPT, input_json(0)),
+            LLMResultCache.make_key(MODEL_NAME, SYSTEM_PROMPT + ' Antworte kurz.', input_json(0)),
+            LLMResultCache.make_key(MODEL_NAME, SYSTEM_PROMPT, input_json(1)),
+        ):
+            assert changed_key != key and cache.get(changed_key, Topic) is None
+        # Text shifted between the fields does not collide either
+        assert LLMResultCache.make_key('ab', 'c', '{}') != LLMResultCache.make_key('a', 'bc', '{}')
+
+        # An entry that no longer fits the output schema is a miss
+        assert cache.get(key, LLMGeneratedTopic) is None
+
+        # Bypass always misses but still writes, so the next normal lookup hits
+        bypass_cache = LLMResultCache(path=path, bypass=True)
+        bypass_key = LLMResultCache.make_key(MODEL_NAME, SYSTEM_PROMPT, input_json(2))
+        bypass_cache.set(bypass_key, output, model_name=MODEL_NAME)
+        assert bypass_cache.get(key, Topic) is None and bypass_cache.get(bypass_key, Topic) is None
+        assert bypass_cache.stats()['hits'] == 0 and bypass_cache.stats()['misses'] == 2
+        assert cache.get(bypass_key, Topic) == output
+
+        # Entries older than ttl_seconds are a miss and are deleted
+        ttl_cache = LLMResultCache(path=path, ttl_seconds=TTL_SECONDS)
+        ttl_key = LLMResultCache.make_key(MODEL_NAME, SYSTEM_PROMPT, input_json(3))
+        ttl_cache.set(ttl_key, output, model_name=MODEL_NAME)
+        assert ttl_cache.get(ttl_key, Topic) == output
+        time.sleep(TTL_SECONDS + 0.1)
+        assert ttl_cache.get(ttl_key, Topic) is None
+        assert cache.get(ttl_key, Topic) is None
+        assert ttl_cache.purge_expired() >= 1
+        print(f"Expiry: {ttl_cache.stats()}")
+        assert ttl_cache.stats()['evictions'] >= 2, ttl_cache.stats()
+
+        # Beyond max_entries the least recently used entries are evicted
+        ttl_cache.clear()
+        lru_cache = LLMResultCache(path=path, max_entries=MAX_ENTRIES)
+        keys = [LLMResultCache.make_key(MODEL_NAME, SYSTEM_PROMPT, input_json(n)) for n in range(10, 10 + MAX_ENTRIES + 1)]
+        for n in range(MAX_ENTRIES):
+            lru_cache.set(keys[n], output, model_name=MODEL_NAME)
+            time.sleep(0.01)
+        # Reading the oldest entry makes the second one the least recently used
+        assert lru_cache.get(keys[0], Topic) == output
+        time.sleep(0.01)
+        lru_cache.set(keys[MAX_ENTRIES], output, model_name=MODEL_NAME)
+        assert lru_cache.get(keys[1], Topic) is None
+        assert all(lru_cache.get(keys[n], Topic) == output for n in (0, 2, MAX_ENTRIES))
+        stats = lru_cache.stats()
+        print(f"Eviction: {stats}")
+        assert stats['evictions'] == 1 and stats['hits'] == 4 and stats['misses'] == 1, stats
+
+        for open_cache in (cache, bypass_cache, ttl_cache, lru_cache):
+            open_cache.close()
+
+    print("✅ LLM result cache behaves as expected.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import sys, os, time, random, asyncio, tempfile
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import FunctionModel, AgentInfo
+
+from shared.schemas import FactCheckArticlesSchema, ParagraphBlock, TOPIC_LABELS
+from shared.agents.local_topic_classifier import LocalTopicClassifier, article_text
+from shared.agents.topic_classifier import TopicClassifierAgent
+
+# --- CONFIG ---
+NUM_TRAINING_ARTICLES = 1100
+NUM_PIPELINE_ARTICLES = 200
+NUM_THROUGHPUT_ARTICLES = 10000
+AMBIGUOUS_SHARE = 0.15  # Articles mixing the words of two topics, the local classifier should defer them
+URL_PREFIX = 'https://local-classifier-test.example/'
+
+TOPIC_WORDS = {
+    'Demokratie & Wahlen': ['Wahl', 'Stimmzettel', 'Briefwahl', 'Wahlbetrug', 'Wahllokal', 'Auszählung'],
+    'Politik & Regierung': ['Bundesregierung', 'Minister', 'Kanzler', 'Gesetzentwurf', 'Koalition', 'Bundestag'],
+    'Medien & Öffentlichkeit': ['Zeitung', 'Rundfunk', 'Journalist', 'Interview', 'Talkshow', 'Pressefreiheit'],
+    'Umwelt & Klima': ['Klimawandel', 'CO2', 'Windräder', 'Hitzewelle', 'Gletscher', 'Emissionen'],
+    'Migration & Asyl': ['Geflüchtete', 'Asylbewerber', 'Abschiebung', 'Grenze', 'Einwanderung', 'Flüchtlingsheim'],
+    'Gesundheit': ['Impfung', 'Virus', 'Krankenhaus', 'Medikament', 'Ärzte', 'Nebenwirkungen'],
+    'Krieg & Konflikte': ['Ukraine', 'Soldaten', 'Raketen', 'Front', 'Waffenlieferung', 'Angriff'],
+    'Kriminalität & Sicherheit': ['Polizei', 'Messerangriff', 'Festnahme', 'Einbruch', 'Pfefferspray', 'Täter'],
+    'Technologie': ['KI', 'Smartphone', 'Deepfake', 'App', 'Algorithmus', 'Chatbot'],
+    'Wirtschaft & Soziales': ['Inflation', 'Bürgergeld', 'Rente', 'Arbeitslosigkeit', 'Steuern', 'Mindestlohn'],
+    'Verbraucherthemen': ['Supermarkt', 'Lebensmittel', 'Rückruf', 'Preise', 'Verbraucherzentrale', 'Stromtarif'],
+}
+FILLER_WORDS = ['Faktencheck', 'Behauptung', 'viral', 'Sozialen', 'Netzwerken', 'angeblich', 'falsch', 'Video', 'Bild', 'irreführend']
+
+
+def make_article(rng: random.Random, n: int) -> FactCheckArticlesSchema:
+    topic = rng.choice(TOPIC_LABELS)
+    words = rng.sample(TOPIC_WORDS[topic], 3)
+    if rng.random() < AMBIGUOUS_SHARE:
+        words = rng.sample(TOPIC_WORDS[topic], 2) + rng.sample(TOPIC_WORDS[rng.choice(TOPIC_LABELS)], 2)
+    fillers = rng.sample(FILLER_WORDS, 4)
+    return FactCheckArticlesSchema(
+        url=f'{URL_PREFIX}{n}',
+        medium='correctiv',
+        kicker='Faktencheck',
+        headline=' '.join(fillers[:2] + words[:2]),
+        teaser=' '.join(fillers[2:] + words[2:]),
+        body=[ParagraphBlock(type='paragraph', text=f'{fillers[0]} {words[0]} {fillers[3]}')],
+        topic=topic
+    )
+
+
+def make_stub_llm():
+    '''
+    Stub LLM that answers with the topic whose words occur most often in the article, counting calls.
+    '''
+    calls = []
+
+    async def respond(messages, info: AgentInfo) -> ModelResponse:
+        prompt = messages[-1].parts[-1].content
+        calls.append(prompt)
+        topic = max(TOPIC_LABELS, key=lambda label: sum(prompt.count(word) for word in TOPIC_WORDS[label]))
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {'topic_label': topic})])
+
+    return FunctionModel(respond), calls
+
+
+def main():
+    rng = random.Random(0)
+    articles = [make_article(rng, n) for n in range(NUM_TRAINING_ARTICLES)]
+    texts = [article_text(article) for article in articles]
+    labels = [article.topic for article in articles]
+    split = int(0.8 * len(articles))
+
+    start = time.perf_counter()
+    classifier = LocalTopicClassifier.train(texts[:split], labels[:split])
+    print(f"Trained on {split} articles in {time.perf_counter() - start:.2f}s")
+
+    # A threshold for 98% agreement takes most articles locally and leaves the ambiguous ones to the LLM
+    threshold = classifier.choose_threshold(texts[split:], labels[split:], min_agreement=0.98)
+    report = classifier.evaluate(texts[split:], labels[split:])
+    chosen = next(row for row in report['thresholds'] if row['threshold'] == threshold)
+    print(f"Threshold {threshold:.3f}: {chosen['coverage']:.0%} of held-out articles taken locally at {chosen['agreement']:.1%} agreement "
+          f"(overall agreement {report['agreement']:.1%})")
+    assert report['agreement'] >= 0.85, report
+    assert chosen['agreement'] >= 0.98 and chosen['coverage'] >= 0.6, chosen
+
+    # Save and load keep the model and the threshold
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'model.joblib')
+        classifier.save(path)
+        loaded = LocalTopicClassifier.load(path)
+    assert loaded.threshold == threshold
+    assert loaded.predict_texts(texts[split:split + 20]) == classifier.predict_texts(texts[split:split + 20])
+
+    # Vectorized throughput
+    many = [texts[n % len(texts)] for n in range(NUM_THROUGHPUT_ARTICLES)]
+    start = time.perf_counter()
+    classifier.predict_texts(many)
+    print(f"Local classifier: {NUM_THROUGHPUT_ARTICLES / (time.perf_counter() - start):.0f} articles/s")
+
+    # Pipeline: only the articles below the threshold are sent to the LLM
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        print("Set TEST_DATABASE_URL to a local, disposable Postgres database to run the pipeline part of this test.")
+        return
+    os.environ['DATABASE_URL'] = database_url
+
+    from sqlalchemy import text
+    from shared.database import Database
+    from shared.models import Base
+    from shared.services.fact_check_articles_service import FactCheckArticlesService
+    from shared.pipelines.topic_classification import TopicClassificationPipeline, PipelineCheckpoint
+
+    db = Database()
+    Base.metadata.create_all(db.engine)
+
+    def cleanup():
+        with db.engine.begin() as connection:
+            connection.execute(text("DELETE FROM fact_check_articles WHERE url LIKE :prefix"), {'prefix': URL_PREFIX + '%'})
+
+    cleanup()
+    new_articles = [make_article(rng, NUM_TRAINING_ARTICLES + n) for n in range(NUM_PIPELINE_ARTICLES)]
+    expected = {article.url: article.topic for article in new_articles}
+    with db.get_session() as session:
+        FactCheckArticlesService(session).upsert_articles([article.model_copy(update={'topic': None}) for article in new_articles])
+    with db.engine.connect() as connection:
+        first_id = connection.execute(text("SELECT min(id) FROM fact_check_articles WHERE url LIKE :prefix"), {'prefix': URL_PREFIX + '%'}).scalar()
+
+    stub_model, calls = make_stub_llm()
+    with tempfile.TemporaryDirectory() as directory:
+        # Start right before the test articles, leave the rest of the test database alone
+        checkpoint = PipelineCheckpoint('local-classifier-test', path=os.path.join(directory, 'checkpoint.json'))
+        checkpoint.save(first_id - 1)
+        pipeline = TopicClassificationPipeline(
+            db=db,
+            classifier_agent=TopicClassifierAgent(model_name='stub', system_prompt='Stub', model=stub_model),
+            chunk_size=50,
+            checkpoint=checkpoint,
+            local_classifier=classifier
+        )
+        stats = asyncio.run(pipeline.run(max_articles=NUM_PIPELINE_ARTICLES))
+    print(f"Pipeline: {stats}, {len(calls)} LLM calls")
+    assert stats['classified'] == NUM_PIPELINE_ARTICLES and stats['local'] + stats['llm'] == NUM_PIPELINE_ARTICLES, stats
+    assert len(calls) == stats['llm'] < NUM_PIPELINE_ARTICLES / 2, (stats, len(calls))
+
+    with db.engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT url, topic, classified_hash = content_hash, topic_source FROM fact_check_articles WHERE url LIKE :prefix"),
+            {'prefix': URL_PREFIX + '%'}
+        ).all()
+    agreement = sum(topic == expected[url] for url, topic, _, _ in rows) / len(rows)
+    print(f"Agreement of the stored topics with the generating labels: {agreement:.1%}")
+    assert all(hash_matches for _, _, hash_matches, _ in rows)
+    # Retraining only uses the LLM labels, so every topic records who assigned it
+    sources = [source for _, _, _, source in rows]
+    assert sources.count('local') == stats['local'] and sources.count('llm') == stats['llm'], stats
+    assert agreement >= 0.9, agreement
+
+    cleanup()
+    print("Local topic classifier test passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import sys, json, asyncio
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import FunctionModel, AgentInfo
+
+from shared.agents.topic_classifier import TopicClassifierAgent
+from shared.agents.axis_extractor import AxisExtractorAgent
+from shared.agents.prompt_builder import ArticlePromptBuilder
+from shared.schemas import FactCheckArticleContent, ParagraphBlock, TOPIC_LABELS
+
+# --- CONFIG ---
+NUM_ARTICLES = 200
+MAX_REQUEST_TOKENS = 2500
+SKIPPED = 'Artikel 13'     # The stub leaves this article out of its packed answer
+DUPLICATED = 'Artikel 21'  # ... and answers this one twice
+BROKEN = 'broken'          # Every request containing this article fails with a non-retryable 400
+
+
+def expected_topic(headline: str) -> str:
+    return TOPIC_LABELS[int(headline.split()[-1]) % len(TOPIC_LABELS)] if BROKEN not in headline else None
+
+
+def headline_of(article) -> str:
+    # Articles arrive as JSON objects, or as the prompt builder's plain text
+    if isinstance(article, dict):
+        return article['headline']
+    return next(line for line in article.splitlines() if line.startswith('Überschrift: '))[len('Überschrift: '):]
+
+
+def make_stub_model(axes: bool = False):
+    '''
+    A local stand-in for OpenRouter that answers single and packed requests with the topic
+    derived from the headline, and misbehaves on the articles configured above.
+    '''
+    calls = []
+
+    def answer(article) -> dict:
+        headline = headline_of(article)
+        output = {'topic_label': expected_topic(headline)}
+        if axes:
+            output.update(claim=f"Behauptung zu {headline}", instrumentalizer='Unbekannt', entities=[])
+        return output
+
+    async def respond(messages, info: AgentInfo) -> ModelResponse:
+        prompt = messages[-1].parts[-1].content
+        calls.append(prompt)
+        if BROKEN in prompt:
+            raise ModelHTTPError(status_code=400, model_name='stub')
+        if not prompt.startswith('['):
+            article = json.loads(prompt) if prompt.startswith('{') else prompt
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, answer(article))])
+        results = []
+        for item in json.loads(prompt):
+            headline = headline_of(item['article'])
+            if headline == SKIPPED:
+                continue
+            copies = 2 if headline == DUPLICATED else 1
+            results += [{'article_id': item['article_id'], **answer(item['article'])}] * copies
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {'results': results})])
+
+    return FunctionModel(respond), calls
+
+
+def make_articles():
+    return [
+        FactCheckArticleContent(
+            kicker='Faktencheck',
+            headline=f'Artikel {i}' if i != 45 else f'{BROKEN} Artikel {i}',
+            teaser='Ein viraler Beitrag in den Sozialen Netzwerken behauptet etwas, das nicht stimmt.',
+            body=[ParagraphBlock(type='paragraph', text='Wir haben die Behauptung geprüft und mit Fachleuten gesprochen. ' * 3)]
+        )
+        for i in range(NUM_ARTICLES)
+    ]
+
+
+def main():
+    with open(Path(project_root) / 'shared/system_prompts/system_prompt_topic_classifier.md', 'r') as f:
+        system_prompt = f.read()
+    articles = make_articles()
+
+    single_model, _ = make_stub_model()
+    single = TopicClassifierAgent(model_name='stub', system_prompt=system_prompt, model=single_model)
+    single_results = asyncio.run(single.run_many(articles, max_retries=0))
+
+    packed_model, calls = make_stub_model()
+    packed = TopicClassifierAgent(model_name='stub', system_prompt=system_prompt, model=packed_model)
+    results = asyncio.run(packed.run_many_packed(articles, max_request_tokens=MAX_REQUEST_TOKENS, max_retries=0))
+    print(f"Single: {single.usage}")
+    print(f"Packed: {packed.usage}")
+
+    # Same answers in input order, the broken article fails either way
+    assert [r.index for r in results] == list(range(NUM_ARTICLES)), 'results must keep input order'
+    assert [r.index for r in results if not r.ok] == [45] and isinstance(results[45].error, ModelHTTPError)
+    assert all(r.output.topic_label == expected_topic(article.headline) for r, article in zip(results, articles) if r.ok)
+    assert [r.output for r in results if r.ok] == [r.output for r in single_results if r.ok]
+
+    # Skipped and duplicated articles and the articles of the failed pack are re-sent alone
+    single_calls = [call for call in calls if not call.startswith('[')]
+    resent = {json.loads(call)['headline'] for call in single_calls if BROKEN not in call}
+    assert {SKIPPED, DUPLICATED} <= resent, resent
+    assert packed.usage['fallback_articles'] == len(single_calls), (packed.usage, len(single_calls))
+
+    # Fewer requests and fewer input tokens, every pack stays within the budget
+    assert packed.usage['requests'] * 3 < single.usage['requests'], (packed.usage, single.usage)
+    assert packed.usage['input_tokens'] * 2 < single.usage['input_tokens'], (packed.usage, single.usage)
+    packed_prompt_tokens = packed.token_counter.count(packed.packed_system_prompt)
+    pack_sizes = [len(json.loads(call)) for call in calls if call.startswith('[')]
+    print(f"Pack sizes for a budget of {MAX_REQUEST_TOKENS} tokens: {pack_sizes}")
+    assert 1 < max(pack_sizes) < 20, pack_sizes
+    assert all(packed_prompt_tokens + packed.token_counter.count(call) <= MAX_REQUEST_TOKENS * 1.05 for call in calls if call.startswith('['))
+
+    # With a prompt builder, every article prompt is built once and its saved tokens are counted
+    # once per classified article, also for the articles re-sent alone after their pack failed
+    builds = []
+
+    class CountingPromptBuilder(ArticlePromptBuilder):
+        def build(self, article_content):
+            builds.append(article_content.headline)
+            return super().build(article_content)
+
+    builder = CountingPromptBuilder()
+    budget_model, _ = make_stub_model()
+    budget = TopicClassifierAgent(model_name='stub', system_prompt=system_prompt, model=budget_model, prompt_builder=builder)
+    budget_results = asyncio.run(budget.run_many_packed(articles, max_request_tokens=MAX_REQUEST_TOKENS, max_retries=0))
+    print(f"Packed with prompt builder: {budget.usage}")
+    assert [r.output for r in budget_results if r.ok] == [r.output for r in results if r.ok]
+    assert budget.usage['fallback_articles'] > 0, budget.usage
+    assert len(builds) == NUM_ARTICLES, len(builds)
+    expected_saved = sum(ArticlePromptBuilder().build(article).saved_tokens for r, article in zip(budget_results, articles) if r.ok)
+    assert budget.usage['prompt_tokens_saved'] == expected_saved, (budget.usage, expected_saved)
+
+    # The AxisExtractor packs the same way
+    axes_model, _ = make_stub_model(axes=True)
+    extractor = AxisExtractorAgent(model_name='stub', system_prompt='Stub', model=axes_model)
+    axes_results = asyncio.run(extractor.run_many_packed(articles[:10], max_request_tokens=MAX_REQUEST_TOKENS))
+    assert all(r.ok and r.output.claim == f'Behauptung zu {article.headline}' for r, article in zip(axes_results, articles))
+    assert extractor.usage['packed_requests'] == 1, extractor.usage
+
+    print(f"✅ Packed {NUM_ARTICLES} articles into {packed.usage['requests']} requests instead of {single.usage['requests']} "
+          f"({packed.usage['input_tokens']} instead of {single.usage['input_tokens']} input tokens).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import sys, json, random, asyncio
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import FunctionModel, AgentInfo
+
+from shared.agents.topic_classifier import TopicClassifierAgent
+from shared.agents.prompt_builder import ArticlePromptBuilder
+from shared.schemas import FactCheckArticleContent, ParagraphBlock, SubheadlineBlock, TOPIC_LABELS
+
+# --- CONFIG ---
+BUDGET = 300
+NUM_ARTICLES = 150
+
+TOPIC_WORDS = {
+    'Demokratie & Wahlen': ['Wahl', 'Stimmzettel', 'Briefwahl'],
+    'Politik & Regierung': ['Bundesregierung', 'Minister', 'Koalition'],
+    'Medien & Öffentlichkeit': ['Zeitung', 'Rundfunk', 'Journalist'],
+    'Umwelt & Klima': ['Klimawandel', 'Windräder', 'Hitzewelle'],
+    'Migration & Asyl': ['Geflüchtete', 'Abschiebung', 'Einwanderung'],
+    'Gesundheit': ['Impfung', 'Krankenhaus', 'Medikament'],
+    'Krieg & Konflikte': ['Ukraine', 'Soldaten', 'Raketen'],
+    'Kriminalität & Sicherheit': ['Polizei', 'Festnahme', 'Einbruch'],
+    'Technologie': ['Deepfake', 'Smartphone', 'Chatbot'],
+    'Wirtschaft & Soziales': ['Inflation', 'Bürgergeld', 'Rente'],
+    'Verbraucherthemen': ['Supermarkt', 'Rückruf', 'Stromtarif'],
+}
+FILLER = 'Wir haben die Behauptung geprüft, Quellen verglichen und mit Fachleuten gesprochen.'
+
+
+def make_article(rng: random.Random, n: int):
+    '''
+    A long fact-check: the topic words are in the headline, teaser and first paragraphs, the
+    rest of the body is methodology and context mentioning a few other topics in passing.
+    '''
+    topic = rng.choice(TOPIC_LABELS)
+    words = TOPIC_WORDS[topic]
+    body = [
+        ParagraphBlock(type='paragraph', text=f'In Sozialen Netzwerken heißt es, {words[0]} und {words[1]} hingen zusammen. {FILLER}'),
+        SubheadlineBlock(type='subheadline', text=f'Was hinter der Behauptung über {words[2]} steckt'),
+        ParagraphBlock(type='paragraph', text=f'{words[1]}: {FILLER} {FILLER}'),
+    ]
+    for paragraph in range(25):
+        other = rng.choice(TOPIC_WORDS[rng.choice(TOPIC_LABELS)])
+        body.append(ParagraphBlock(type='paragraph', text=f'{FILLER} Auch {other} wurde erwähnt. {FILLER}'))
+        if paragraph % 8 == 7:
+            body.append(SubheadlineBlock(type='subheadline', text=f'Abschnitt {paragraph // 8 + 2}'))
+    content = FactCheckArticleContent(
+        kicker='Faktencheck',
+        headline=f'Nein, {words[0]} ist nicht schuld ({n})',
+        teaser=f'Ein Beitrag über {words[2]} verbreitet sich.',
+        body=body
+    )
+    return content, topic
+
+
+def make_stub_llm():
+    '''
+    Stub LLM that answers with the topic whose words occur most often in the prompt, recording prompts.
+    '''
+    prompts = []
+
+    async def respond(messages, info: AgentInfo) -> ModelResponse:
+        prompt = messages[-1].parts[-1].content
+        prompts.append(prompt)
+        if prompt.startswith('['):
+            results = [
+                {'article_id': item['article_id'], 'topic_label': label_of(item['article'])}
+                for item in json.loads(prompt)
+            ]
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {'results': results})])
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {'topic_label': label_of(prompt)})])
+
+    def label_of(text: str) -> str:
+        return max(TOPIC_LABELS, key=lambda label: sum(text.count(word) for word in TOPIC_WORDS[label]))
+
+    return FunctionModel(respond), prompts
+
+
+def main():
+    rng = random.Random(0)
+    builder = ArticlePromptBuilder(max_tokens=BUDGET)
+    article, _ = make_article(rng, 0)
+
+    # Header and subheadlines are kept, paragraphs in order until the budget, as plain text
+    prompt = builder.build(article)
+    print(f"Long article: {prompt.tokens} tokens instead of {prompt.full_tokens} ({prompt.saved_tokens} saved)")
+    assert prompt.tokens <= BUDGET and prompt.truncated, prompt
+    assert prompt.text.startswith('Dachzeile: Faktencheck\nÜberschrift: Nein,'), prompt.text
+    assert all(f'## {block.text}' in prompt.text for block in article.body if block.type == 'subheadline')
+    assert article.body[0].text in prompt.text and article.body[2].text in prompt.text
+    assert prompt.text.index(article.body[0].text) < prompt.text.index(article.body[1].text)
+    assert '"type"' not in prompt.text and '\\u' not in prompt.text
+    assert prompt.saved_tokens > prompt.full_tokens / 2
+
+    # A short article is kept whole
+    short = FactCheckArticleContent(headline='Kurz', body=article.body[:3])
+    short_prompt = builder.build(short)
+    assert not short_prompt.truncated and all(block.text in short_prompt.text for block in short.body), short_prompt
+
+    # The agent sends the built prompt, describes the plain-text format and counts the saved tokens
+    articles = [make_article(rng, n) for n in range(1, NUM_ARTICLES + 1)]
+    contents = [content for content, _ in articles]
+    full_model, _ = make_stub_llm()
+    full_agent = TopicClassifierAgent(model_name='stub', system_prompt='Stub\n\n# Input\n\nJSON', model=full_model)
+    budget_model, prompts = make_stub_llm()
+    budget_agent = TopicClassifierAgent(model_name='stub', system_prompt='Stub\n\n# Input\n\nJSON', model=budget_model, prompt_builder=builder)
+    assert 'JSON' not in budget_agent.system_prompt and 'Klartext' in budget_agent.system_prompt
+
+    full_results = asyncio.run(full_agent.run_many(contents))
+    budget_results = asyncio.run(budget_agent.run_many(contents))
+    assert prompts[0] in {builder.build(content).text for content in contents}
+    expected_saved = sum(builder.build(content).saved_tokens for content in contents)
+    assert budget_agent.usage['prompt_tokens_saved'] == expected_saved, budget_agent.usage
+    print(f"Input tokens: {budget_agent.usage['input_tokens']} instead of {full_agent.usage['input_tokens']}, "
+          f"{expected_saved} article tokens saved")
+    assert budget_agent.usage['input_tokens'] * 2 < full_agent.usage['input_tokens']
+
+    # Evaluation: the labels of the budgeted prompts do not degrade
+    full_labels = [result.output.topic_label for result in full_results]
+    budget_labels = [result.output.topic_label for result in budget_results]
+    expected = [topic for _, topic in articles]
+    same = sum(a == b for a, b in zip(full_labels, budget_labels)) / NUM_ARTICLES
+    full_correct = sum(a == b for a, b in zip(full_labels, expected)) / NUM_ARTICLES
+    budget_correct = sum(a == b for a, b in zip(budget_labels, expected)) / NUM_ARTICLES
+    print(f"Labels: {same:.0%} identical to the full prompt, {budget_correct:.0%} correct (full prompt: {full_correct:.0%})")
+    assert same >= 0.95 and budget_correct >= full_correct
+
+    # Packed requests carry the plain text as JSON strings
+    packed_model, packed_prompts = make_stub_llm()
+    packed_agent = TopicClassifierAgent(model_name='stub', system_prompt='Stub', model=packed_model, prompt_builder=builder)
+    packed_results = asyncio.run(packed_agent.run_many_packed(contents[:20], max_request_tokens=4000))
+    assert [result.output.topic_label for result in packed_results] == budget_labels[:20]
+    assert json.loads(packed_prompts[0])[0]['article'] == builder.build(contents[0]).text
+
+    print("✅ Prompt builder behaves as expected.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import sys, os, json
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from shared.models import Base
+from shared.schemas import TOPIC_LABELS
+
+# --- CONFIG ---
+NUM_SEED_ARTICLES = 50000  # Enough rows for the planner to prefer indexes over sequential scans
+
+# Each access path of the API and the pipelines, with the index its plan must use
+EXPECTED_PLANS = [
+    (
+        'articles by topic, newest first (/articles, /articles-by-topic)',
+        """
+        SELECT id, headline FROM fact_check_articles
+        WHERE topic = 'Gesundheit'
+        ORDER BY published_at DESC NULLS LAST, id DESC LIMIT 100
+        """,
+        'idx_fact_check_articles_topic_published_at_id'
+    ),
+    (
+        'articles by medium and date range, newest first',
+        """
+        SELECT id, headline FROM fact_check_articles
+        WHERE medium = 'correctiv' AND published_at >= '2023-01-01' AND published_at <= '2023-03-31'
+        ORDER BY published_at DESC NULLS LAST, id DESC LIMIT 100
+        """,
+        'idx_fact_check_articles_medium_published_at_id'
+    ),
+    (
+        'topic counts for one week (/topic-counts)',
+        """
+        SELECT topic, count(id) FROM fact_check_articles
+        WHERE published_at >= '2023-06-01' AND published_at <= '2023-06-07 23:59:59' AND topic IS NOT NULL
+        GROUP BY topic ORDER BY count(id) DESC
+        """,
+        'idx_fact_check_articles_published_at_id'
+    ),
+    (
+        'next chunk of unclassified articles (classification pipeline)',
+        """
+        SELECT id FROM fact_check_articles
+        WHERE topic IS NULL AND id > 1000
+        ORDER BY id LIMIT 100
+        """,
+        'idx_fact_check_articles_unclassified_id'
+    ),
+    (
+        'next chunk of unclassified or changed articles (classification pipeline)',
+        """
+        SELECT id FROM fact_check_articles
+        WHERE id > 1000 AND (topic IS NULL OR classified_hash IS DISTINCT FROM content_hash)
+        ORDER BY id LIMIT 100
+        """,
+        'idx_fact_check_articles_to_classify_id'
+    ),
+    (
+        'articles mentioning an entity',
+        """
+        SELECT id FROM fact_check_articles
+        WHERE entities @> '[{"name": "Entity 42"}]'
+        """,
+        'idx_fact_check_articles_entities'
+    ),
+]
+
+
+def seed(connection):
+    '''
+    Fill an empty table with synthetic articles spread over four years and five media.
+    Runs in the caller's transaction, which is rolled back after the check.
+    '''
+    count = connection.execute(text('SELECT count(*) FROM fact_check_articles')).scalar()
+    if count >= NUM_SEED_ARTICLES:
+        return
+    print(f"Seeding {NUM_SEED_ARTICLES - count} synthetic articles...")
+    connection.execute(
+        text(
+            """
+            INSERT INTO fact_check_articles (url, medium, headline, body, published_at, topic, entities, last_updated)
+            SELECT
+                'https://example.org/faktencheck/' || g,
+                (ARRAY['correctiv', 'br-faktenfuchs', 'tagesschau-faktenfinder', 'dpa', 'afp'])[1 + g % 5],
+                'Faktencheck ' || g,
+                '[]'::jsonb,
+                timestamp '2022-01-01' + g * interval '40 minutes',
+                CASE WHEN g % 100 = 0 THEN NULL ELSE (CAST(:topics AS text[]))[1 + g % 11] END,
+                jsonb_build_array(jsonb_build_object('name', 'Entity ' || (g % 2000), 'type', 'person')),
+                now()
+            FROM generate_series(:start, :end) AS g
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {'topics': list(TOPIC_LABELS), 'start': count + 1, 'end': NUM_SEED_ARTICLES}
+    )
+    connection.execute(text('ANALYZE fact_check_articles'))
+
+
+def used_indexes(plan: dict) -> set:
+    '''
+    Collect the names of all indexes used anywhere in an EXPLAIN (FORMAT JSON) plan tree.
+    '''
+    names = {plan['Index Name']} if 'Index Name' in plan else set()
+    for child in plan.get('Plans', []):
+        names |= used_indexes(child)
+    return names
+
+
+def main():
+    load_dotenv()
+    # Never run against DATABASE_URL, this script seeds synthetic rows into the table
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        print("Set TEST_DATABASE_URL to a local, disposable Postgres database to run this check.")
+        return
+
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    failures = []
+    with engine.connect() as connection:
+        # The seeded rows, their rollups and statistics only exist inside this transaction,
+        # so the other DB tests never see them
+        transaction = connection.begin()
+        try:
+            seed(connection)
+            for description, query, expected_index in EXPECTED_PLANS:
+                plan = connection.execute(text(f'EXPLAIN (FORMAT JSON) {query}')).scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                indexes = used_indexes(plan[0]['Plan'])
+                status = '✅' if expected_index in indexes else '❌'
+                print(f"{status} {description}: {', '.join(sorted(indexes)) or 'sequential scan'}")
+                if expected_index not in indexes:
+                    failures.append(description)
+        finally:
+            transaction.rollback()
+
+    assert not failures, f"Expected index not used for: {', '.join(failures)}"
+    print("All access paths use their index.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import sys, os, json, time, asyncio, threading
+from pathlib import Path
+from html.parser import HTMLParser
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.request import urlopen
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+# --- CONFIG ---
+ARTICLES_PER_MEDIUM = 30
+REQUESTS_PER_MINUTE = 600  # 10 requests per second per medium
+MAX_WORKERS = 3
+WRITE_BATCH_SIZE = 5
+PAGE_LATENCY_SECONDS = 0.05
+MISSING_ARTICLE = 13  # Answers 404, must fail without retries
+FLAKY_ARTICLE = 7  # Answers 503 once, must succeed on retry
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    '''
+    Serves /<medium>/index.json with the article links and /<medium>/articles/<n> as
+    fact-check pages, and records the time of every article request per medium.
+    '''
+    requests = {}
+    flaky_served = set()
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def send(self, status: int, body: str, content_type: str = 'text/html; charset=utf-8'):
+        encoded = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        medium = parts[0]
+        base_url = f'http://{self.headers["Host"]}/{medium}'
+        if parts[1:] == ['index.json']:
+            links = [f'{base_url}/articles/{n}' for n in range(1, ARTICLES_PER_MEDIUM + 1)]
+            # Listings repeat articles, the pipeline must dedupe them
+            self.send(200, json.dumps(links + links[:3]), 'application/json')
+            return
+        n = int(parts[2])
+        with self.lock:
+            self.requests.setdefault(medium, []).append(time.monotonic())
+            flaky_first = n == FLAKY_ARTICLE and medium not in self.flaky_served
+            if flaky_first:
+                self.flaky_served.add(medium)
+        time.sleep(PAGE_LATENCY_SECONDS)
+        if n == MISSING_ARTICLE:
+            self.send(404, 'not found')
+        elif flaky_first:
+            self.send(503, 'try again')
+        else:
+            self.send(200, f"""
+                <html><body><article>
+                <span class="topline">Faktencheck</span>
+                <h1>{medium} article {n}</h1>
+                <time datetime="2024-03-{1 + n % 28:02d}T10:00:00"></time>
+                <h2>Behauptung</h2><p>Claim {n}</p><p>Bewertung {n}</p>
+                </article></body></html>
+            """)
+
+
+class FixtureArticleParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.article = {'body_structured': []}
+        self.current = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'time':
+            self.article['datetime_published'] = attrs['datetime']
+        elif tag in ('h1', 'h2', 'p') or attrs.get('class') == 'topline':
+            self.current = tag if tag != 'span' else 'kicker'
+
+    def handle_data(self, data):
+        if not self.current or not data.strip():
+            return
+        if self.current == 'h1':
+            self.article['headline'] = data.strip()
+        elif self.current == 'kicker':
+            self.article['kicker'] = data.strip()
+        else:
+            self.article['body_structured'].append(('subheadline' if self.current == 'h2' else 'paragraph', data.strip()))
+        self.current = None
+
+
+class FixtureWorker():
+    '''
+    Minimal HTTP worker for the fixture pages, counts how often workers are created and closed.
+    '''
+    created = 0
+    closed = 0
+
+    def __init__(self):
+        FixtureWorker.created += 1
+
+    def __call__(self, url: str):
+        with urlopen(url, timeout=10) as response:
+            parser = FixtureArticleParser()
+            parser.feed(response.read().decode('utf-8'))
+        return parser.article
+
+    def close(self):
+        FixtureWorker.closed += 1
+
+
+def main():
+    # Never run against DATABASE_URL, this test inserts fixture articles
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        print("Set TEST_DATABASE_URL to a local, disposable Postgres database to run this test.")
+        return
+    os.environ['DATABASE_URL'] = database_url
+
+    from sqlalchemy import text
+    from shared.database import Database
+    from shared.models import Base
+    from shared.pipelines.scraping import ScrapingPipeline, ScrapeJob
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    media = ['fixture-a', 'fixture-b']
+
+    db = Database()
+    Base.metadata.create_all(db.engine)
+    with db.engine.begin() as connection:
+        connection.execute(text("DELETE FROM fact_check_articles WHERE url LIKE 'http://127.0.0.1:%'"))
+
+    def make_jobs():
+        return [
+            ScrapeJob(
+                medium=medium,
+                get_links=lambda medium=medium: json.load(urlopen(f'{base_url}/{medium}/index.json')),
+                make_worker=FixtureWorker,
+                max_workers=MAX_WORKERS,
+                requests_per_minute=REQUESTS_PER_MINUTE
+            )
+            for medium in media
+        ]
+
+    pipeline = ScrapingPipeline(db=db, jobs=make_jobs(), write_batch_size=WRITE_BATCH_SIZE)
+    saves = []
+    save = pipeline._save
+    pipeline._save = lambda articles: (saves.append(len(articles)), save(articles))
+    start = time.perf_counter()
+    stats = asyncio.run(pipeline.run())
+    duration = time.perf_counter() - start
+    print(f"First run in {duration:.1f}s: {stats}, {len(saves)} writes")
+
+    expected = len(media) * (ARTICLES_PER_MEDIUM - 1)
+    assert stats['saved'] == expected, stats
+    assert stats['failed'] == len(media), stats
+    assert len(saves) >= expected // WRITE_BATCH_SIZE, f"Articles were not written in batches: {saves}"
+    assert FixtureWorker.created <= len(media) * MAX_WORKERS, FixtureWorker.created
+    assert FixtureWorker.closed == FixtureWorker.created
+
+    # Politeness: each medium's requests respect its rate (the bucket allows a burst of one second)
+    rate = REQUESTS_PER_MINUTE / 60
+    for medium, times in FixtureHandler.requests.items():
+        min_duration = (len(times) - rate) / rate
+        assert times[-1] - times[0] >= min_duration * 0.95, f"{medium} was scraped faster than {rate}/s"
+    # The media are scraped in parallel, not one after the other
+    assert duration < 2 * (len(FixtureHandler.requests[media[0]]) - rate) / rate, duration
+
+    with db.engine.connect() as connection:
+        stored = connection.execute(
+            text("SELECT count(*) FROM fact_check_articles WHERE url LIKE 'http://127.0.0.1:%' AND headline IS NOT NULL AND published_at IS NOT NULL")
+        ).scalar()
+    assert stored == expected, stored
+
+    # Second run: all stored links are skipped up front, only the 404 page is requested again
+    FixtureHandler.requests.clear()
+    stats = asyncio.run(ScrapingPipeline(db=db, jobs=make_jobs(), write_batch_size=WRITE_BATCH_SIZE).run())
+    print(f"Second run: {stats}")
+    assert stats['saved'] == 0 and stats['skipped'] == len(media) * (ARTICLES_PER_MEDIUM - 1), stats
+    assert sum(len(times) for times in FixtureHandler.requests.values()) == len(media), FixtureHandler.requests
+
+    with db.engine.begin() as connection:
+        connection.execute(text("DELETE FROM fact_check_articles WHERE url LIKE 'http://127.0.0.1:%'"))
+    server.shutdown()
+    print("Scraping pipeline test passed.")
+
+
+if __name__ == "__main__":
+    main()
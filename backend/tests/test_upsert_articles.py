@@ -0,0 +1,131 @@
+import sys, os, time, datetime
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+# --- CONFIG ---
+URL_PREFIX = 'https://upsert-test.example/'
+NUM_ARTICLES = 2000
+CHUNK_SIZE = 500
+NUM_WRITERS = 4
+
+
+def make_article(n: int, headline: str = None):
+    from shared.schemas import FactCheckArticlesSchema
+    return FactCheckArticlesSchema.from_news_scraper({
+        'url': f'{URL_PREFIX}{n}',
+        'medium': 'upsert-test',
+        'headline': headline or f'Headline {n}',
+        'datetime_published': datetime.datetime(2024, 1, 1) + datetime.timedelta(hours=n),
+        'body_structured': [('paragraph', f'Claim {n}')],
+    })
+
+
+def main():
+    # Never run against DATABASE_URL, this test writes fixture articles
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        print("Set TEST_DATABASE_URL to a local, disposable Postgres database to run this test.")
+        return
+    os.environ['DATABASE_URL'] = database_url
+
+    from sqlalchemy import text
+    from shared.database import Database
+    from shared.models import Base, FactCheckArticles
+    from shared.services.fact_check_articles_service import FactCheckArticlesService, compute_content_hash
+
+    db = Database()
+    Base.metadata.create_all(db.engine)
+
+    def cleanup():
+        with db.engine.begin() as connection:
+            connection.execute(text("DELETE FROM fact_check_articles WHERE url LIKE :prefix"), {'prefix': URL_PREFIX + '%'})
+
+    def upsert(articles, **kwargs):
+        with db.get_session() as session:
+            return FactCheckArticlesService(session).upsert_articles(articles, chunk_size=CHUNK_SIZE, **kwargs)
+
+    cleanup()
+    articles = [make_article(n) for n in range(NUM_ARTICLES)]
+
+    # Fresh batch: everything is inserted, a URL repeated in the batch and one without a URL are skipped
+    start = time.perf_counter()
+    counts = upsert(articles + [make_article(0)] + [make_article(-1).model_copy(update={'url': None})])
+    print(f"Insert of {NUM_ARTICLES} articles in {time.perf_counter() - start:.2f}s: {counts}")
+    assert counts == {'inserted': NUM_ARTICLES, 'updated': 0, 'skipped': 2}, counts
+
+    # Classify one article, a re-scrape must not clear its topic
+    with db.get_session() as session:
+        session.query(FactCheckArticles).filter(
+            FactCheckArticles.url == f'{URL_PREFIX}1'
+        ).update({'topic': 'Politik'})
+        session.commit()
+
+    # Same batch again: unchanged articles are skipped
+    start = time.perf_counter()
+    counts = upsert(articles)
+    print(f"Unchanged re-upsert in {time.perf_counter() - start:.2f}s: {counts}")
+    assert counts == {'inserted': 0, 'updated': 0, 'skipped': NUM_ARTICLES}, counts
+
+    # Changed headlines are updated, new URLs inserted
+    changed = [make_article(n, headline=f'Corrected headline {n}') for n in range(10)]
+    counts = upsert(changed + [make_article(NUM_ARTICLES)])
+    assert counts == {'inserted': 1, 'updated': 10, 'skipped': 0}, counts
+    with db.get_session() as session:
+        article = session.query(FactCheckArticles).filter(FactCheckArticles.url == f'{URL_PREFIX}1').one()
+        assert article.headline == 'Corrected headline 1' and article.topic == 'Politik', (article.headline, article.topic)
+
+    # Only the corrected articles changed content, so only they are due for re-classification
+    with db.get_session() as session:
+        service = FactCheckArticlesService(session)
+        session.query(FactCheckArticles).filter(FactCheckArticles.url.like(URL_PREFIX + '%')).update(
+            {'topic': 'Politik', 'classified_hash': FactCheckArticles.content_hash}, synchronize_session=False
+        )
+        session.commit()
+        counts = service.upsert_articles(articles[:3] + changed[3:] + articles[10:])
+        assert counts == {'inserted': 0, 'updated': 3, 'skipped': NUM_ARTICLES - 3}, counts
+        to_classify = service.get_articles_to_classify(limit=NUM_ARTICLES)
+        changed_urls = {article.url for article in to_classify if article.url.startswith(URL_PREFIX)}
+        assert changed_urls == {f'{URL_PREFIX}{n}' for n in range(3)}, changed_urls
+        assert all(article.content_hash == compute_content_hash(article.headline, article.teaser, article.body) for article in to_classify)
+
+        # A bulk content edit updates the hash as well, so the article is re-classified too
+        edited = session.query(FactCheckArticles).filter(FactCheckArticles.url == f'{URL_PREFIX}5').one()
+        edited_id, edited_body = edited.id, [{'type': 'paragraph', 'text': 'Corrected body.'}]
+        # An ID that does not exist is ignored
+        assert service.bulk_update_articles({edited_id: {'body': edited_body}, 2**31 - 1: {'teaser': 'Missing'}}) == 1
+        session.expire_all()
+        edited = session.query(FactCheckArticles).filter(FactCheckArticles.id == edited_id).one()
+        assert edited.content_hash == compute_content_hash(edited.headline, edited.teaser, edited_body), edited.content_hash
+        to_classify = service.get_articles_to_classify(limit=NUM_ARTICLES)
+        changed_urls = {article.url for article in to_classify if article.url.startswith(URL_PREFIX)}
+        assert changed_urls == {f'{URL_PREFIX}{n}' for n in (0, 1, 2, 5)}, changed_urls
+
+    # Insert-only path (save_articles) leaves stored articles alone
+    with db.get_session() as session:
+        counts = FactCheckArticlesService(session).save_articles([make_article(0, headline='Ignored')])
+    assert counts == {'inserted': 0, 'updated': 0, 'skipped': 1}, counts
+
+    # Concurrent writers with overlapping batches: no unique violations, every URL inserted once
+    cleanup()
+    batches = [[make_article(n) for n in range(offset, offset + NUM_ARTICLES // 2)] for offset in range(0, NUM_WRITERS * 250, 250)]
+    with ThreadPoolExecutor(max_workers=NUM_WRITERS) as executor:
+        results = list(executor.map(lambda batch: upsert(batch, update_existing=False), batches))
+    total_urls = len({article.url for batch in batches for article in batch})
+    print(f"Concurrent writers: {results}")
+    assert sum(result['inserted'] for result in results) == total_urls, results
+    with db.engine.connect() as connection:
+        stored = connection.execute(text("SELECT count(*) FROM fact_check_articles WHERE url LIKE :prefix"), {'prefix': URL_PREFIX + '%'}).scalar()
+    assert stored == total_urls, stored
+
+    cleanup()
+    print("Upsert articles test passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ export const load = async ({ fetch, url, params }) => {
 
     const apiParams = new URLSearchParams();
     apiParams.append('topic', topic);
+    apiParams.append('summary', 'true');
     if (published_after) apiParams.append('published_after', published_after);
     if (published_before) apiParams.append('published_before', published_before);
     if (medium) apiParams.append('medium', medium);